@@ -1,32 +1,97 @@
 # backend/app.py - Main Flask application (Multi-Election Version)
-from flask import Flask, jsonify, request, send_from_directory, session, redirect, url_for, Response, send_file
+from flask import Flask, jsonify, request, send_from_directory, session, redirect, url_for, Response
 from flask_cors import CORS
 from datetime import datetime, timezone
 import json
 import io
 import csv
 import os
+import time
 import uuid
 from config import config
 from utils.data_handler import (
-    get_candidates, get_votes, save_votes, get_election_status, save_election_status,
-    add_candidate, remove_candidate, load_translations,
-    get_elections, save_elections, get_election_by_id, create_election_data_structure
+    get_candidates, get_candidate_roster, get_votes, save_votes, get_election_status, save_election_status, get_election_schedule,
+    add_candidate, remove_candidate, add_candidates, remove_candidates,
+    get_elections, save_elections, get_election_by_id, create_election_data_structure,
+    save_election, delete_election as delete_election_record, get_elections_for_user,
+    has_voter_voted, reserve_voter, release_voter, get_votes_columnar, iter_vote_records, warm_vote_indexes, lock_metrics
 )
 from models import Candidate, Vote, VotesData, ElectionStatus, Election
 from utils.auth import GoogleAuth, VoterSession
+from utils.google_standin import GoogleStandIn
+from utils.oauth_exchange import OAuthExchangePool, SignInFailed, SignInUnavailable
+from utils.tally import TallyEngine
+from utils.results_snapshot import ResultsSnapshotCache
+from utils.translations import TranslationsService
+from utils.static_assets import StaticAssets, IMMUTABLE as STATIC_IMMUTABLE
+from utils.http_cache import send_precompressed, send_stream
+from utils.vote_queue import VoteIngestQueue, VoteQueueFull
+from utils.metrics import metrics
+from utils.events import ElectionEventHub
+from utils.schedule import parse_schedule_time
+from utils import analytics, candidate_import, columnar_export
+
+SIGN_IN_RETRY_SECONDS = 5
+SIGN_IN_RETRY_PAGE = f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<meta http-equiv="refresh" content="{SIGN_IN_RETRY_SECONDS};url=/auth/google/login">
+<title>Signing in…</title>
+</head>
+<body style="font-family: sans-serif; text-align: center; margin-top: 4em;">
+<h1>Many members are signing in right now</h1>
+<p>We will try again in {SIGN_IN_RETRY_SECONDS} seconds. If nothing happens, <a href="/auth/google/login">sign in again</a>.</p>
+</body>
+</html>
+"""
 
 def create_app(config_name='default'):
     app = Flask(__name__, static_folder='../frontend')
     app.config.from_object(config[config_name])
     CORS(app, supports_credentials=True)
     app.secret_key = app.config['SECRET_KEY']
+    google_endpoints = None
+    if app.config.get('GOOGLE_AUTH_OFFLINE'):
+        # Offline mode: sign-in goes to a local stand-in for Google's endpoints.
+        google_standin = GoogleStandIn(app.config['GOOGLE_CLIENT_ID'], app.config['GOOGLE_CLIENT_SECRET']).start()
+        google_endpoints = google_standin.endpoints
+        app.logger.warning(f"GOOGLE_AUTH_OFFLINE is set: Google sign-in is simulated by {google_standin.base_url}")
     google_auth = GoogleAuth(
         client_id=app.config['GOOGLE_CLIENT_ID'],
         client_secret=app.config['GOOGLE_CLIENT_SECRET'],
-        redirect_uri=app.config['GOOGLE_REDIRECT_URI']
+        redirect_uri=app.config['GOOGLE_REDIRECT_URI'],
+        endpoints=google_endpoints
+    )
+    oauth_exchange = OAuthExchangePool(
+        google_auth,
+        max_concurrent=app.config.get('OAUTH_MAX_CONCURRENT', 8),
+        max_waiting=app.config.get('OAUTH_MAX_WAITING', 16),
+        timeout_seconds=app.config.get('OAUTH_TIMEOUT_SECONDS', 15)
     )
     voter_session = VoterSession()
+    warm_vote_indexes()
+    tally_engine = TallyEngine()
+    results_snapshots = ResultsSnapshotCache()
+    translations = TranslationsService()
+    static_assets = StaticAssets(
+        app.static_folder,
+        app.config.get('STATIC_BUILD_DIR', os.path.join(app.static_folder, 'dist')),
+        revalidate_seconds=app.config.get('STATIC_REVALIDATE_SECONDS', 1.0)
+    )
+    static_assets.build()
+    election_events = ElectionEventHub(turnout=tally_engine.ballot_count)
+
+    def _on_votes_committed(election_id: str):
+        tally_engine.record_ballot(election_id)
+        election_events.notify(election_id)
+
+    vote_queue = VoteIngestQueue(
+        max_pending=app.config.get('VOTE_QUEUE_MAX_PENDING', 1000),
+        max_batch=app.config.get('VOTE_QUEUE_MAX_BATCH', 200),
+        linger_seconds=app.config.get('VOTE_QUEUE_LINGER_MS', 5) / 1000.0,
+        on_committed=_on_votes_committed
+    )
 
     def _get_election_context(election_id: str, voter_session_id: str):
         if not voter_session_id:
@@ -39,16 +104,43 @@ def create_app(config_name='default'):
         if not election:
             return None, False, False, (jsonify({'message': 'Election not found'}), 404)
 
-        user_id = voter_info.get('user_id')
-        user_email = voter_info.get('email')
-        is_eligible_voter = election.is_user_eligible_voter(user_email)
-        is_admin = election.is_user_admin(user_id)
-
+        is_admin, is_eligible_voter = _election_roles(election, voter_info)
         return election, is_admin, is_eligible_voter, None
 
+    def _election_roles(election: Election, voter_info):
+        return election.is_user_admin(voter_info.get('user_id')), election.is_user_eligible_voter(voter_info.get('email'))
+
+    def _user_payload(voter_info):
+        return {
+            'name': voter_info['name'],
+            'email': voter_info['email'],
+            'isAdmin': voter_info.get('is_admin', False),
+            'isEligibleVoter': voter_info.get('is_eligible_voter', True),
+            'hasVoted': voter_info.get('has_voted', False)
+        }
+
+    def _election_summary(election: Election, user_id):
+        return {
+            'id': election.id,
+            'name': election.name,
+            'description': election.description,
+            'created_at': election.created_at,
+            'is_admin': election.is_user_admin(user_id)
+        }
+
+    def _logged_export(chunks, election_id: str, kind: str):
+        # Errors after the first chunk can no longer become a 500; log them and end the download.
+        try:
+            yield from chunks
+        except Exception as e:
+            app.logger.error(f"Error streaming {kind} export for election {election_id}: {e}", exc_info=True)
+
     @app.route('/')
     def serve_index():
-        return send_from_directory(app.static_folder, 'index.html')
+        body = static_assets.index()
+        if body is None:
+            return send_from_directory(app.static_folder, 'index.html')
+        return send_precompressed(body, request, 'no-cache')
 
     @app.route('/api/language')
     def get_language():
@@ -56,8 +148,9 @@ def create_app(config_name='default'):
 
     @app.route('/auth/google/login')
     def google_login():
-        auth_url, state = google_auth.get_authorization_url()
+        auth_url, state, code_verifier = google_auth.get_authorization_url()
         session['oauth_state'] = state
+        session['oauth_code_verifier'] = code_verifier
         return redirect(auth_url)
 
     @app.route('/auth/google/callback')
@@ -69,12 +162,17 @@ def create_app(config_name='default'):
         code = request.args.get('code')
         if not code:
             return jsonify({'message': 'Authorization code not found'}), 400
-        tokens = google_auth.exchange_code_for_tokens(code)
-        if not tokens:
-            return jsonify({'message': 'Failed to exchange authorization code'}), 400
-        user_info = google_auth.verify_id_token(tokens['id_token'])
-        if not user_info:
-            return jsonify({'message': 'Failed to verify user identity'}), 400
+        started = time.perf_counter()
+        try:
+            sign_in = oauth_exchange.sign_in(code, session.pop('oauth_code_verifier', None))
+        except SignInUnavailable as e:
+            # The code is single-use, so the retry starts a fresh sign-in.
+            app.logger.warning(f"Sign-in deferred ({type(e).__name__}); {oauth_exchange.in_flight} exchanges in flight")
+            return Response(SIGN_IN_RETRY_PAGE, status=503, mimetype='text/html',
+                            headers={'Retry-After': str(SIGN_IN_RETRY_SECONDS), 'Cache-Control': 'no-store'})
+        except SignInFailed as e:
+            return jsonify({'message': str(e)}), 400
+        user_info = sign_in.user_info
 
         session_id = voter_session.create_session(
             user_info['user_id'],
@@ -91,6 +189,9 @@ def create_app(config_name='default'):
         )
         session['voter_session_id'] = session_id
         session['user_info'] = user_info
+        total = time.perf_counter() - started
+        metrics.record_timing('oauth.callback', total)
+        metrics.record_timing('oauth.processing', max(0.0, total - sign_in.queued_seconds - sign_in.google_seconds))
         return redirect(f"{app.config['FRONTEND_URL']}?authenticated=true")
 
     @app.route('/api/auth/session')
@@ -103,15 +204,43 @@ def create_app(config_name='default'):
             return jsonify({'authenticated': False}), 401
         return jsonify({
             'authenticated': True,
-            'user': {
-                'name': voter_info['name'],
-                'email': voter_info['email'],
-                'isAdmin': voter_info.get('is_admin', False),
-                'isEligibleVoter': voter_info.get('is_eligible_voter', True),
-                'hasVoted': voter_info.get('has_voted', False)
-            }
+            'user': _user_payload(voter_info)
         }), 200
 
+    @app.route('/api/bootstrap')
+    def bootstrap():
+        """Everything the SPA needs for first paint: session, elections and, for the chosen
+        election (?election_id= if accessible, else the first), its status and candidates."""
+        payload = {
+            'authenticated': False,
+            'translations': translations.versions(),
+            'liveEvents': app.config.get('ELECTION_EVENTS_ENABLED', False)
+        }
+        voter_session_id = session.get('voter_session_id')
+        voter_info = voter_session.get_session(voter_session_id) if voter_session_id else None
+        if voter_info:
+            user_id = voter_info.get('user_id')
+            elections = get_elections_for_user(user_id, voter_info.get('email'))
+            requested_id = request.args.get('election_id')
+            election = next((e for e in elections if e.id == requested_id), elections[0] if elections else None)
+            payload.update({
+                'authenticated': True,
+                'user': _user_payload(voter_info),
+                'elections': [_election_summary(e, user_id) for e in elections],
+                'electionId': None,
+                'status': None,
+                'candidates': None
+            })
+            if election:
+                is_admin, is_eligible_voter = _election_roles(election, voter_info)
+                payload['electionId'] = election.id
+                payload['status'] = get_election_schedule(election.id).status_payload()
+                if is_admin or is_eligible_voter:
+                    payload['candidates'] = list(get_candidate_roster(election.id).records)
+        response = jsonify(payload)
+        response.headers['Cache-Control'] = 'private, no-store'
+        return response
+
     @app.route('/api/auth/demo', methods=['POST'])
     def demo_auth():
         demo_user_id = str(uuid.uuid4())
@@ -138,9 +267,7 @@ def create_app(config_name='default'):
             admin_user_ids=[demo_user_id]
         )
 
-        elections = get_elections()
-        elections.append(demo_election)
-        if not save_elections(elections):
+        if not save_election(demo_election):
             app.logger.error(f"Failed to save demo election {demo_election_id} to global list")
 
         session_id = voter_session.create_session(
@@ -217,9 +344,7 @@ def create_app(config_name='default'):
         if not create_election_data_structure(new_election_id):
             return jsonify({'message': 'Failed to create data structure for new election'}), 500
 
-        elections = get_elections()
-        elections.append(new_election)
-        if save_elections(elections):
+        if save_election(new_election):
             return jsonify({'message': 'Election created successfully', 'election_id': new_election_id}), 201
         else:
             return jsonify({'message': 'Failed to save new election'}), 500
@@ -236,18 +361,8 @@ def create_app(config_name='default'):
         user_id = voter_info.get('user_id')
         user_email = voter_info.get('email')
 
-        all_elections = get_elections()
-        accessible_elections = []
-
-        for election in all_elections:
-            if election.is_user_admin(user_id) or election.is_user_eligible_voter(user_email):
-                 accessible_elections.append({
-                     'id': election.id,
-                     'name': election.name,
-                     'description': election.description,
-                     'created_at': election.created_at,
-                     'is_admin': election.is_user_admin(user_id)
-                 })
+        accessible_elections = [_election_summary(election, user_id)
+                                for election in get_elections_for_user(user_id, user_email)]
 
         return jsonify(accessible_elections), 200
 
@@ -281,16 +396,11 @@ def create_app(config_name='default'):
             election.name = data.get('name', election.name)
             election.description = data.get('description', election.description)
             if 'eligible_voter_emails' in data:
-                election.eligible_voter_emails = data['eligible_voter_emails']
+                election.set_eligible_voter_emails(data['eligible_voter_emails'])
             if 'admin_user_ids' in data:
-                 election.admin_user_ids = data['admin_user_ids']
-
-            elections = get_elections()
-            for i, e in enumerate(elections):
-                if e.id == election_id:
-                    elections[i] = election
-                    break
-            if save_elections(elections):
+                election.set_admin_user_ids(data['admin_user_ids'])
+
+            if save_election(election):
                 return jsonify({'message': 'Election updated successfully'}), 200
             else:
                  return jsonify({'message': 'Failed to save updated election'}), 500
@@ -309,9 +419,7 @@ def create_app(config_name='default'):
              return jsonify({'message': 'Admin access required to delete election'}), 403
 
          try:
-             elections = get_elections()
-             elections = [e for e in elections if e.id != election_id]
-             if save_elections(elections):
+             if delete_election_record(election_id):
                  return jsonify({'message': 'Election deleted successfully'}), 200
              else:
                  return jsonify({'message': 'Failed to save election list after deletion'}), 500
@@ -329,10 +437,8 @@ def create_app(config_name='default'):
         if not (is_eligible_voter or is_admin):
             return jsonify({'message': 'Access denied to candidates for this election'}), 403
 
-        include_private = is_eligible_voter or is_admin
-        candidates = get_candidates(election_id, include_private=include_private)
-        candidates_dicts = [c.to_dict(include_private=include_private) for c in candidates]
-        return jsonify(candidates_dicts), 200
+        roster = get_candidate_roster(election_id)
+        return send_precompressed(roster.body, request, cache_control='private, no-cache')
 
     @app.route('/api/elections/<election_id>/results')
     def get_results(election_id):
@@ -346,16 +452,11 @@ def create_app(config_name='default'):
             app.logger.warning(f"User {user_email} attempted to view results for election {election_id} but is not eligible.")
             return jsonify({'message': 'You are not authorized to view election results for this election.'}), 403
 
-        status = get_election_status(election_id)
+        schedule = get_election_schedule(election_id)
+        status = schedule.status
         current_time = datetime.now(timezone.utc)
-        is_election_open = False
-        if status.start_time and status.end_time:
-            try:
-                start_dt = datetime.fromisoformat(status.start_time.replace('Z', '+00:00')) if isinstance(status.start_time, str) else status.start_time
-                end_dt = datetime.fromisoformat(status.end_time.replace('Z', '+00:00')) if isinstance(status.end_time, str) else status.end_time
-                is_election_open = start_dt <= current_time < end_dt
-            except ValueError as e:
-                app.logger.error(f"Error parsing election start/end times for results (Election ID: {election_id}): {e}")
+        is_election_open = schedule.is_open(current_time)
+        is_election_closed = schedule.is_closed(current_time)
 
         if is_election_open:
             return jsonify({
@@ -365,45 +466,23 @@ def create_app(config_name='default'):
                 'results': []
             }), 200
 
-        votes_data = get_votes(election_id)
-        if not votes_data.votes:
-            return jsonify({
-                'isOpen': False,
-                'totalVotes': 0,
-                'results': []
-            }), 200
-
-        candidates = get_candidates(election_id, include_private=False)
-        candidate_votes = {}
-        total_votes = len(votes_data.voter_ids)
-
-        for candidate in candidates:
-            candidate_votes[candidate.id] = {'name': candidate.name, 'councilVotes': 0, 'executiveVotes': 0}
-
-        for vote in votes_data.votes:
-            for candidate_id in vote.selected_candidates:
-                if candidate_id in candidate_votes:
-                    candidate_votes[candidate_id]['councilVotes'] += 1
-            for candidate_id in vote.executive_candidates:
-                if candidate_id in candidate_votes:
-                    candidate_votes[candidate_id]['executiveVotes'] += 1
-
-        results = [
-            {
-                'id': candidate_id,
-                'name': vote_data['name'],
-                'councilVotes': vote_data['councilVotes'],
-                'executiveVotes': vote_data['executiveVotes']
-            }
-            for candidate_id, vote_data in candidate_votes.items()
-        ]
-        results.sort(key=lambda x: (-x['councilVotes'], -x['executiveVotes']))
+        # Once the scheduled end has passed the results are final: serve the frozen snapshot.
+        if is_election_closed:
+            snapshot = results_snapshots.get(election_id, status)
+            if snapshot:
+                return send_precompressed(snapshot, request, cache_control='private, no-cache')
 
-        return jsonify({
+        candidates = list(get_candidate_roster(election_id).candidates)
+        total_votes, results = tally_engine.results(election_id, candidates)
+        payload = {
             'isOpen': False,
             'totalVotes': total_votes,
-            'results': results
-        }), 200
+            'results': results if total_votes else []
+        }
+        if is_election_closed:
+            snapshot = results_snapshots.materialize(election_id, status, payload)
+            return send_precompressed(snapshot, request, cache_control='private, no-cache')
+        return jsonify(payload), 200
 
     @app.route('/api/elections/<election_id>/election/status')
     def get_election_status_api(election_id):
@@ -413,18 +492,12 @@ def create_app(config_name='default'):
              return error_response
 
          try:
-             status = get_election_status(election_id)
+             schedule = get_election_schedule(election_id)
              current_time = datetime.now(timezone.utc)
-             is_open = False
-             if status.start_time and status.end_time:
-                 start_dt = datetime.fromisoformat(status.start_time.replace('Z', '+00:00')) if isinstance(status.start_time, str) else status.start_time
-                 end_dt = datetime.fromisoformat(status.end_time.replace('Z', '+00:00')) if isinstance(status.end_time, str) else status.end_time
-                 is_open = start_dt <= current_time < end_dt
-             return jsonify({
-                  'is_open': is_open,
-                  'start_time': status.start_time,
-                  'end_time': status.end_time
-              }), 200
+             response = jsonify(schedule.status_payload(current_time))
+             # Clients may reuse the answer until the election next opens or closes.
+             response.headers['Cache-Control'] = schedule.cache_control(current_time, app.config.get('SCHEDULE_MAX_AGE_CAP', 300))
+             return response, 200
          except Exception as e:
              app.logger.error(f"Error fetching election status for election {election_id}: {e}")
              return jsonify({
@@ -433,6 +506,24 @@ def create_app(config_name='default'):
                   'end_time': None,
                  'message': "Error fetching election status."}), 500
 
+    @app.route('/api/elections/<election_id>/events')
+    def election_events_stream(election_id):
+        if not app.config.get('ELECTION_EVENTS_ENABLED', False):
+            return jsonify({'message': 'Live election events are disabled'}), 404
+        voter_session_id = session.get('voter_session_id')
+        election, is_admin, is_eligible_voter, error_response = _get_election_context(election_id, voter_session_id)
+        if error_response:
+            return error_response
+
+        if not (is_admin or is_eligible_voter):
+            return jsonify({'message': 'Access denied to events for this election'}), 403
+
+        return Response(
+            election_events.stream(election_id),
+            mimetype='text/event-stream',
+            headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+        )
+
     @app.route('/api/elections/<election_id>/votes/submit', methods=['POST'])
     def submit_vote(election_id):
         voter_session_id = session.get('voter_session_id')
@@ -446,8 +537,7 @@ def create_app(config_name='default'):
              return jsonify({'message': 'You are not authorized to vote in this election.'}), 403
 
         voter_info = voter_session.get_session(voter_session_id)
-        votes_data = get_votes(election_id)
-        if voter_info['user_id'] in votes_data.voter_ids:
+        if has_voter_voted(election_id, voter_info['user_id']):
             return jsonify({'message': 'You have already voted in this election'}), 400
 
         data = request.get_json()
@@ -463,23 +553,15 @@ def create_app(config_name='default'):
         if not set(executive_candidates).issubset(set(selected_candidates)):
             return jsonify({'message': 'All executive candidates must also be selected as council members'}), 400
 
-        election_status = get_election_status(election_id)
-        is_election_open = False
-        if election_status.start_time and election_status.end_time:
-            try:
-                start_dt = datetime.fromisoformat(election_status.start_time.replace('Z', '+00:00')) if isinstance(election_status.start_time, str) else election_status.start_time
-                end_dt = datetime.fromisoformat(election_status.end_time.replace('Z', '+00:00')) if isinstance(election_status.end_time, str) else election_status.end_time
-                current_time = datetime.now(timezone.utc)
-                is_election_open = start_dt <= current_time < end_dt
-            except ValueError as e:
-                app.logger.error(f"Error parsing election start/end times for vote submission (Election ID: {election_id}): {e}")
-                is_election_open = False
-        else:
-            is_election_open = False
+        is_election_open = get_election_schedule(election_id).is_open()
 
         if not is_election_open:
             return jsonify({'message': 'Election is currently closed'}), 400
 
+        # Atomic across threads and workers: only one request per voter gets past this point.
+        if not reserve_voter(election_id, voter_info['user_id']):
+            return jsonify({'message': 'You have already voted in this election'}), 400
+
         new_vote = Vote(id=str(uuid.uuid4()),
                         voter_id=voter_info['user_id'],
                         selected_candidates=selected_candidates,
@@ -488,11 +570,17 @@ def create_app(config_name='default'):
                         voter_email=voter_info['email'],
                         timestamp=datetime.utcnow().isoformat() + 'Z')
 
-        votes_data.voter_ids.append(voter_info['user_id'])
-        votes_data.votes.append(new_vote)
-        if save_votes(votes_data, election_id):
+        try:
+            stored = vote_queue.submit(election_id, new_vote)
+        except VoteQueueFull:
+            release_voter(election_id, voter_info['user_id'])
+            app.logger.warning(f"Vote queue full; asking voter to retry (Election ID: {election_id}).")
+            return jsonify({'message': 'The server is busy. Please submit your vote again in a moment.'}), 503, {'Retry-After': '2'}
+
+        if stored:
             return jsonify({'message': 'Vote submitted successfully'}), 200
         else:
+            release_voter(election_id, voter_info['user_id'])
             return jsonify({'message': 'Failed to save vote'}), 500
 
     @app.route('/api/elections/<election_id>/admin/candidates', methods=['GET'])
@@ -506,8 +594,8 @@ def create_app(config_name='default'):
             return jsonify({'message': 'Admin access required'}), 403
 
         try:
-            candidates = get_candidates(election_id, include_private=True)
-            return jsonify([c.to_dict(include_private=True) for c in candidates]), 200
+            roster = get_candidate_roster(election_id)
+            return send_precompressed(roster.body, request, cache_control='private, no-cache')
         except Exception as e:
             app.logger.error(f"Error fetching admin candidates for election {election_id}: {e}")
             return jsonify({"message": "Internal server error fetching candidates for admin."}), 500
@@ -569,6 +657,78 @@ def create_app(config_name='default'):
             app.logger.error(f"Error deleting candidate {candidate_id} for election {election_id}: {e}")
             return jsonify({"message": "Internal server error deleting candidate."}), 500
 
+    @app.route('/api/elections/<election_id>/admin/candidates/bulk', methods=['POST'])
+    def import_candidates(election_id):
+        """Add many candidates in one write, from a JSON array body or a CSV/JSON file upload ('file')."""
+        voter_session_id = session.get('voter_session_id')
+        election, is_admin, _, error_response = _get_election_context(election_id, voter_session_id)
+        if error_response:
+            return error_response
+
+        if not is_admin:
+            return jsonify({'message': 'Admin access required'}), 403
+
+        if get_election_schedule(election_id).is_open():
+            return jsonify({"message": "Cannot add candidates while election is open."}), 400
+
+        try:
+            upload = request.files.get('file')
+            if upload is not None:
+                rows = candidate_import.parse_upload(upload.read(), upload.filename, upload.mimetype)
+            elif request.is_json:
+                rows = candidate_import.parse_json(request.get_data())
+            else:
+                rows = candidate_import.parse_upload(request.get_data(), content_type=request.mimetype)
+        except ValueError as e:
+            return jsonify({"message": str(e)}), 400
+
+        max_rows = app.config.get('CANDIDATE_IMPORT_MAX_ROWS', 1000)
+        if len(rows) > max_rows:
+            return jsonify({"message": f"Too many candidates in one import (at most {max_rows})."}), 400
+
+        try:
+            success, message, added, errors = add_candidates(rows, election_id)
+            if success:
+                return jsonify({
+                    "message": message,
+                    "candidates": [c.to_dict(include_private=True) for c in added]
+                }), 201
+            return jsonify({"message": message, "errors": errors}), 400
+        except Exception as e:
+            app.logger.error(f"Error importing candidates for election {election_id}: {e}")
+            return jsonify({"message": "Internal server error importing candidates."}), 500
+
+    @app.route('/api/elections/<election_id>/admin/candidates/bulk', methods=['DELETE'])
+    def delete_candidates(election_id):
+        """Remove the candidates listed in {"ids": [...]} in one write."""
+        voter_session_id = session.get('voter_session_id')
+        election, is_admin, _, error_response = _get_election_context(election_id, voter_session_id)
+        if error_response:
+            return error_response
+
+        if not is_admin:
+            return jsonify({'message': 'Admin access required'}), 403
+
+        data = request.get_json(silent=True) or {}
+        candidate_ids = data.get('ids') if isinstance(data, dict) else None
+        if (not isinstance(candidate_ids, list) or not candidate_ids
+                or not all(isinstance(i, int) and not isinstance(i, bool) for i in candidate_ids)):
+            return jsonify({"message": "Expected {\"ids\": [candidate ids]}"}), 400
+
+        if get_election_schedule(election_id).is_open():
+            return jsonify({"message": "Cannot remove candidates while election is open."}), 400
+
+        try:
+            success, message, removed, missing = remove_candidates(candidate_ids, election_id)
+            if success:
+                return jsonify({"message": message, "removed": removed, "notFound": missing}), 200
+            if missing and not removed:
+                return jsonify({"message": "None of the candidates were found.", "notFound": missing}), 404
+            return jsonify({"message": message}), 500
+        except Exception as e:
+            app.logger.error(f"Error deleting candidates for election {election_id}: {e}")
+            return jsonify({"message": "Internal server error deleting candidates."}), 500
+
     @app.route('/api/elections/<election_id>/admin/election/toggle', methods=['POST'])
     def toggle_election(election_id):
         voter_session_id = session.get('voter_session_id')
@@ -583,6 +743,7 @@ def create_app(config_name='default'):
             current_status = get_election_status(election_id)
             new_status = ElectionStatus(is_open=not current_status.is_open)
             if save_election_status(new_status, election_id):
+                election_events.notify(election_id)
                 action = "opened" if new_status.is_open else "closed"
                 return jsonify({'message': f'Election successfully {action}', 'is_open': new_status.is_open}), 200
             else:
@@ -601,20 +762,38 @@ def create_app(config_name='default'):
         if not is_admin:
             return jsonify({'message': 'Admin access required'}), 403
 
-        try:
-            from utils.data_handler import DATA_DIR
-            VOTES_FILE_PATH = os.path.join(DATA_DIR, 'elections', election_id, 'votes.json')
-            if not os.path.exists(VOTES_FILE_PATH):
-                app.logger.error(f"Votes file not found at expected path for election {election_id}: {VOTES_FILE_PATH}")
-                return jsonify({"error": "Votes file not found on server for this election."}), 404
-            return send_file(
-                VOTES_FILE_PATH,
-                as_attachment=True,
-                download_name=f'election_{election_id}_votes.json'
-            )
-        except Exception as e:
-            app.logger.error(f"Error exporting votes file for election {election_id}: {e}", exc_info=True)
-            return jsonify({"error": "An internal error occurred while exporting votes."}), 500
+        export_format = request.args.get('format', 'json').lower()
+        if export_format not in ('json', 'ndjson'):
+            return jsonify({'message': "format must be 'json' or 'ndjson'."}), 400
+
+        def generate_json():
+            # Two passes over storage keep the votes.json layout (voter_ids first) without buffering ballots.
+            yield '{\n    "voter_ids": ['
+            separator = '\n        '
+            for record in iter_vote_records(election_id):
+                yield separator + json.dumps(record.get('voter_id'))
+                separator = ',\n        '
+            yield '\n    ],\n    "votes": ['
+            separator = '\n        '
+            for record in iter_vote_records(election_id):
+                yield separator + json.dumps(record, default=str)
+                separator = ',\n        '
+            yield '\n    ]\n}\n'
+
+        def generate_ndjson():
+            for record in iter_vote_records(election_id):
+                yield json.dumps(record, default=str) + '\n'
+
+        if export_format == 'ndjson':
+            chunks, mimetype, extension = generate_ndjson(), 'application/x-ndjson', 'ndjson'
+        else:
+            chunks, mimetype, extension = generate_json(), 'application/json', 'json'
+        return send_stream(
+            _logged_export(chunks, election_id, export_format.upper()),
+            request,
+            mimetype=mimetype,
+            headers={"Content-Disposition": f"attachment;filename=election_{election_id}_votes.{extension}"}
+        )
 
     @app.route('/api/elections/<election_id>/admin/votes/export/csv', methods=['GET'])
     def export_votes_to_csv(election_id):
@@ -627,51 +806,165 @@ def create_app(config_name='default'):
             return jsonify({'message': 'Admin access required'}), 403
 
         try:
-            votes_data = get_votes(election_id)
             candidates = get_candidates(election_id, include_private=False)
-            candidate_lookup = {c.id: c.name for c in candidates}
-            voter_email_lookup = {vote.voter_id: vote.voter_email for vote in votes_data.votes}
+        except Exception as err:
+            app.logger.error(f"Error loading candidates for CSV export of election {election_id}: {err}")
+            return jsonify({'message': 'An internal server error occurred during CSV export.'}), 500
+        candidate_lookup = {c.id: c.name for c in candidates}
 
+        def generate_csv():
             output = io.StringIO()
             writer = csv.writer(output)
+
+            def line(row):
+                writer.writerow(row)
+                text = output.getvalue()
+                output.seek(0)
+                output.truncate(0)
+                return text
+
             header = ['Voter Name']
             header.extend([f'Executive {i+1}' for i in range(7)])
             header.extend([f'Council {i+1}' for i in range(8)])
-            writer.writerow(header)
+            yield line(header)
 
-            for vote in votes_data.votes:
-                voter_email = voter_email_lookup.get(vote.voter_id, f"Unknown Email ({vote.voter_id})")
-                row = [voter_email]
-                executive_names_list = [candidate_lookup.get(cid, f"Unknown ID: {cid}") for cid in vote.executive_candidates[:7]]
+            for record in iter_vote_records(election_id):
+                executive_ids = record.get('executive_candidates') or []
+                executive_set = set(executive_ids)
+                row = [record.get('voter_email', f"Unknown Email ({record.get('voter_id')})")]
+                executive_names_list = [candidate_lookup.get(cid, f"Unknown ID: {cid}") for cid in executive_ids[:7]]
                 executive_names_list.extend([''] * (7 - len(executive_names_list)))
                 row.extend(executive_names_list)
-                remaining_council_ids = [cid for cid in vote.selected_candidates if cid not in set(vote.executive_candidates)]
+                remaining_council_ids = [cid for cid in record.get('selected_candidates') or [] if cid not in executive_set]
                 remaining_council_names_list = [candidate_lookup.get(cid, f"Unknown ID: {cid}") for cid in remaining_council_ids[:8]]
                 remaining_council_names_list.extend([''] * (8 - len(remaining_council_names_list)))
                 row.extend(remaining_council_names_list)
-                writer.writerow(row)
+                yield line(row)
 
-            csv_data = output.getvalue()
-            output.close()
-            return Response(
-                csv_data,
-                mimetype='text/csv',
-                headers={"Content-Disposition": f"attachment;filename=election_{election_id}_votes_export_with_names.csv"}
-            )
-        except FileNotFoundError as e:
-            app.logger.error(f"Data file not found during CSV export for election {election_id}: {e}")
-            return jsonify({'message': 'Required data file not found for export.'}), 404
-        except Exception as err:
-            app.logger.error(f"Error exporting votes to CSV for election {election_id}: {err}")
-            return jsonify({'message': 'An internal server error occurred during CSV export.'}), 500
+        return send_stream(
+            _logged_export(generate_csv(), election_id, 'CSV'),
+            request,
+            mimetype='text/csv',
+            headers={"Content-Disposition": f"attachment;filename=election_{election_id}_votes_export_with_names.csv"}
+        )
+
+    @app.route('/api/elections/<election_id>/admin/votes/export/columnar', methods=['GET'])
+    def export_votes_columnar(election_id):
+        voter_session_id = session.get('voter_session_id')
+        election, is_admin, _, error_response = _get_election_context(election_id, voter_session_id)
+        if error_response:
+            return error_response
+
+        if not is_admin:
+            return jsonify({'message': 'Admin access required'}), 403
+
+        export_format = request.args.get('format', columnar_export.default_format()).lower()
+        if export_format not in columnar_export.FORMATS:
+            return jsonify({'message': f"format must be one of: {', '.join(columnar_export.FORMATS)}."}), 400
+        if export_format != 'zip' and not columnar_export.is_arrow_available():
+            return jsonify({'message': f"The {export_format} format requires pyarrow, which is not installed on the server. Use format=zip."}), 501
+
+        try:
+            votes_data = get_votes_columnar(election_id)
+            candidates = get_candidates(election_id, include_private=False)
+            body = columnar_export.export_ballots(election_id, votes_data, candidates, export_format)
+        except Exception as e:
+            app.logger.error(f"Error exporting columnar votes for election {election_id}: {e}", exc_info=True)
+            return jsonify({'message': 'An internal server error occurred during columnar export.'}), 500
+
+        mimetype, extension = columnar_export.FORMATS[export_format]
+        return Response(
+            body,
+            mimetype=mimetype,
+            headers={"Content-Disposition": f"attachment;filename=election_{election_id}_votes.{extension}"}
+        )
+
+    @app.route('/api/elections/<election_id>/admin/analytics', methods=['GET'])
+    def get_election_analytics(election_id):
+        voter_session_id = session.get('voter_session_id')
+        election, is_admin, _, error_response = _get_election_context(election_id, voter_session_id)
+        if error_response:
+            return error_response
+
+        if not is_admin:
+            return jsonify({'message': 'Admin access required'}), 403
+
+        if not analytics.is_available():
+            return jsonify({'message': 'Analytics require numpy, which is not installed on the server.'}), 501
+
+        try:
+            bucket_seconds = int(request.args.get('bucket', 3600))
+            if bucket_seconds <= 0:
+                raise ValueError
+        except ValueError:
+            return jsonify({'message': 'bucket must be a positive number of seconds.'}), 400
+
+        try:
+            votes_data = get_votes_columnar(election_id)
+            candidates = get_candidates(election_id, include_private=False)
+            return jsonify(analytics.election_analytics(votes_data, candidates, bucket_seconds)), 200
+        except Exception as e:
+            app.logger.error(f"Error computing analytics for election {election_id}: {e}", exc_info=True)
+            return jsonify({'message': 'An internal server error occurred while computing analytics.'}), 500
+
+    @app.route('/api/elections/<election_id>/admin/metrics', methods=['GET'])
+    def get_election_metrics(election_id):
+        voter_session_id = session.get('voter_session_id')
+        election, is_admin, _, error_response = _get_election_context(election_id, voter_session_id)
+        if error_response:
+            return error_response
+
+        if not is_admin:
+            return jsonify({'message': 'Admin access required'}), 403
+
+        return jsonify({
+            'pid': os.getpid(),
+            'locks': lock_metrics(election_id),
+            'voteQueue': dict(metrics.snapshot('vote_queue.'), depth=vote_queue.depth),
+            'oauth': dict(metrics.snapshot('oauth.'), inFlight=oauth_exchange.in_flight),
+            'eventSubscribers': metrics.snapshot(f'events.subscribers.{election_id}')['gauges'].get(f'events.subscribers.{election_id}', 0)
+        }), 200
+
+    @app.route('/api/elections/<election_id>/admin/logins', methods=['GET'])
+    def query_login_log(election_id):
+        """NDJSON stream of logins by this election's voters and admins; ?email=, ?since=, ?until= (ISO 8601)."""
+        voter_session_id = session.get('voter_session_id')
+        election, is_admin, _, error_response = _get_election_context(election_id, voter_session_id)
+        if error_response:
+            return error_response
+
+        if not is_admin:
+            return jsonify({'message': 'Admin access required'}), 403
+
+        try:
+            since = parse_schedule_time(request.args.get('since'))
+            until = parse_schedule_time(request.args.get('until'))
+        except ValueError:
+            return jsonify({'message': 'since and until must be ISO 8601 times'}), 400
+        email = request.args.get('email')
+
+        def records():
+            for record in voter_session.iter_logins(email=email, since=since, until=until):
+                if election.is_user_eligible_voter(record.get('email', '')) or election.is_user_admin(record.get('google_id', '')):
+                    yield json.dumps(record) + '\n'
+
+        return send_stream(_logged_export(records(), election_id, 'login log'), request, 'application/x-ndjson')
 
     @app.route('/api/translations')
     def get_translations():
-        translations_data = load_translations()
-        if translations_data:
-            return jsonify(translations_data), 200
+        return send_precompressed(translations.all(), request, 'no-cache')
+
+    @app.route('/api/translations/<lang>')
+    def get_language_translations(lang):
+        body = translations.language(lang)
+        if body is None:
+            return jsonify({'message': f"No translations for language '{lang}'"}), 404
+        # ?v=<version> URLs never change content; anything else revalidates (a cheap 304).
+        if request.args.get('v') == body.etag.strip('"'):
+            cache_control = 'public, max-age=31536000, immutable'
         else:
-            return jsonify({}), 200
+            cache_control = 'no-cache'
+        return send_precompressed(body, request, cache_control)
 
     @app.route('/api/elections/<election_id>/admin/election/schedule', methods=['POST'])
     def schedule_election(election_id):
@@ -706,10 +999,11 @@ def create_app(config_name='default'):
 
             new_status = ElectionStatus(is_open=False, start_time=start_time, end_time=end_time)
             if save_election_status(new_status, election_id):
+                election_events.notify(election_id)
                 return jsonify({
                     'message': 'Election schedule updated successfully.',
-                    'start_time': new_status.start_time.isoformat() if new_status.start_time else None,
-                    'end_time': new_status.end_time.isoformat() if new_status.end_time else None
+                    'start_time': new_status.start_time,
+                    'end_time': new_status.end_time
                 }), 200
             else:
                 app.logger.error("schedule_election: Failed to save election status to data handler.")
@@ -720,7 +1014,11 @@ def create_app(config_name='default'):
 
     @app.route('/<path:filename>')
     def serve_static(filename):
-        return send_from_directory(app.static_folder, filename)
+        asset = static_assets.lookup(filename)
+        if asset is None:
+            return send_from_directory(app.static_folder, filename)
+        body, immutable = asset
+        return send_precompressed(body, request, STATIC_IMMUTABLE if immutable else 'no-cache')
 
     return app
 
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Benchmark: latency of the Google part of the OAuth callback (code exchange plus
+ID token verification) during a login storm, without touching the network.
+
+A local stand-in (utils.google_standin) plays Google's token and certificate
+endpoints, with --latency seconds added to each token request. Each row runs
+--logins callbacks from --concurrency threads, first the way GoogleAuth used to
+do it (new HTTP connection and certificate download per login), then with the
+pooled session and cached certificates.
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import requests as http_requests
+from google.auth.transport import requests as google_requests
+from google.oauth2 import id_token
+from utils.auth import GoogleAuth
+from utils.google_standin import GoogleStandIn
+
+CLIENT_ID = 'benchmark-client.apps.googleusercontent.com'
+CLIENT_SECRET = 'benchmark-secret'
+REDIRECT_URI = 'http://localhost:5001/auth/google/callback'
+
+def uncached_callback(standin: GoogleStandIn, code: str) -> bool:
+    """The previous behaviour: one-off connections and a certificate fetch per login."""
+    response = http_requests.post(standin.endpoints['token_uri'], data={
+        'grant_type': 'authorization_code', 'code': code, 'client_id': CLIENT_ID,
+        'client_secret': CLIENT_SECRET, 'redirect_uri': REDIRECT_URI,
+    }, timeout=10)
+    tokens = response.json()
+    idinfo = id_token.verify_token(tokens['id_token'], google_requests.Request(), audience=CLIENT_ID,
+                                   certs_url=standin.endpoints['certs_uri'])
+    return bool(idinfo.get('email'))
+
+def pooled_callback(google_auth: GoogleAuth, code: str) -> bool:
+    tokens = google_auth.exchange_code_for_tokens(code)
+    return bool(tokens and google_auth.verify_id_token(tokens['id_token']))
+
+def storm(callback, standin: GoogleStandIn, logins: int, concurrency: int):
+    codes = [standin.issue_code(f'voter{i}@example.com', redirect_uri=REDIRECT_URI) for i in range(logins)]
+    latencies = []
+    lock = threading.Lock()
+
+    def one(code):
+        start = time.perf_counter()
+        ok = callback(code)
+        elapsed = time.perf_counter() - start
+        with lock:
+            latencies.append(elapsed)
+        return ok
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        failures = sum(1 for ok in pool.map(one, codes) if not ok)
+    wall = time.perf_counter() - start
+    latencies.sort()
+    return {
+        'p50': statistics.median(latencies) * 1000,
+        'p95': latencies[int(len(latencies) * 0.95) - 1] * 1000,
+        'p99': latencies[int(len(latencies) * 0.99) - 1] * 1000,
+        'rate': logins / wall,
+        'failures': failures,
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure OAuth callback latency under a login storm, offline.")
+    parser.add_argument('--logins', type=int, default=500, help="Callbacks per run")
+    parser.add_argument('--concurrency', default='1,16,64', help="Comma-separated thread counts to test")
+    parser.add_argument('--latency', type=float, default=0.0, help="Seconds added to each token request")
+    args = parser.parse_args()
+
+    standin = GoogleStandIn(CLIENT_ID, CLIENT_SECRET, latency=args.latency).start()
+    try:
+        google_auth = GoogleAuth(CLIENT_ID, CLIENT_SECRET, REDIRECT_URI, endpoints=standin.endpoints, pool_size=64)
+        print(f"{'threads':>7}  {'mode':>8}  {'p50 (ms)':>9}  {'p95 (ms)':>9}  {'p99 (ms)':>9}  {'logins/s':>9}  {'failed':>6}")
+        for concurrency in sorted(int(value) for value in args.concurrency.split(',')):
+            for mode, callback in (('uncached', lambda code: uncached_callback(standin, code)),
+                                   ('pooled', lambda code: pooled_callback(google_auth, code))):
+                row = storm(callback, standin, args.logins, concurrency)
+                print(f"{concurrency:>7}  {mode:>8}  {row['p50']:>9.2f}  {row['p95']:>9.2f}  {row['p99']:>9.2f}"
+                      f"  {row['rate']:>9.0f}  {row['failures']:>6}")
+    finally:
+        standin.stop()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Benchmark: cost of a login (create_session) and of a request's session lookup
+(get_session) as the number of stored sessions grows.
+
+Runs against a throwaway SQLite file, so it does not touch backend/data.
+Each row pre-fills the store up to the given session count and then times
+--logins new sessions; the per-operation times should stay roughly constant.
+"""
+
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+import uuid
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from utils.session_store import SessionStore, SQLiteSessionBackend
+
+def session_data(i: int) -> dict:
+    return {
+        'user_id': f'user-{i}',
+        'email': f'voter{i}@example.com',
+        'name': f'Voter {i}',
+        'created_at': '2025-01-01T00:00:00Z',
+        'has_voted': False,
+        'is_admin': False,
+        'is_eligible_voter': True
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure session store cost as the session count grows.")
+    parser.add_argument('--sizes', default='1000,10000,100000', help="Comma-separated session counts to test")
+    parser.add_argument('--logins', type=int, default=2000, help="Logins timed at each size")
+    args = parser.parse_args()
+
+    sizes = sorted(int(size) for size in args.sizes.split(','))
+    tmp_dir = tempfile.mkdtemp(prefix='phoenix-sessions-')
+    try:
+        store = SessionStore(SQLiteSessionBackend(os.path.join(tmp_dir, 'sessions.db')), sweep_interval=3600)
+        backend = store.backend
+        stored = 0
+        print(f"{'sessions':>10}  {'login (us)':>11}  {'lookup (us)':>12}")
+        for size in sizes:
+            # Bulk pre-fill straight into the backend; it is not what is being measured.
+            expires_at = time.time() + 86400
+            stored += backend.save_many((str(uuid.uuid4()), session_data(i), expires_at) for i in range(stored, size))
+
+            ids = [str(uuid.uuid4()) for _ in range(args.logins)]
+            start = time.perf_counter()
+            for i, session_id in enumerate(ids):
+                store.create(session_id, session_data(stored + i))
+            login_us = (time.perf_counter() - start) / args.logins * 1e6
+            stored += args.logins
+
+            store.clear_cache()  # time backend reads, not cache hits
+            start = time.perf_counter()
+            for session_id in ids:
+                store.get(session_id)
+            lookup_us = (time.perf_counter() - start) / args.logins * 1e6
+            print(f"{stored:>10}  {login_us:>11.1f}  {lookup_us:>12.1f}")
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+if __name__ == "__main__":
+    main()
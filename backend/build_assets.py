@@ -0,0 +1,33 @@
+#!/usr/bin/env python3
+"""
+Build the fingerprinted, precompressed frontend into frontend/dist.
+
+The app does the same at startup (reusing whatever is already built), so this is
+only needed when a front web server should serve the files directly, or to keep
+compression off the workers' startup path. Install `brotli` to also emit .br files.
+"""
+
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from utils.static_assets import StaticAssets
+
+def main():
+    backend_dir = os.path.dirname(os.path.abspath(__file__))
+    frontend_dir = os.path.join(os.path.dirname(backend_dir), 'frontend')
+    parser = argparse.ArgumentParser(description="Fingerprint and precompress the frontend's CSS/JS.")
+    parser.add_argument('--source', default=frontend_dir, help="Frontend directory (default: ../frontend)")
+    parser.add_argument('--out', default=None, help="Build directory (default: <source>/dist)")
+    args = parser.parse_args()
+
+    out_dir = args.out or os.path.join(args.source, 'dist')
+    manifest = StaticAssets(args.source, out_dir).build()
+    for original, hashed in sorted(manifest.items()):
+        print(f"   {original} -> {hashed}")
+    print(f"✅ Built {len(manifest)} assets into {out_dir}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+One-shot migration of the JSON data layout to the SQLite storage backend.
+
+Reads elections.json, elections/<id>/{candidates,votes,election_status}.json
+(plus any votes.jsonl log), voter_login_log.json and the login_audit/ log
+segments into the database used when STORAGE_BACKEND = 'sqlite'. Sessions from voter_sessions.json are imported
+into the same database with a fresh expiry.
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from utils.sqlite_store import SQLiteStore
+from utils.session_store import SQLiteSessionBackend
+from utils.login_audit import LoginAuditLog
+
+def main():
+    backend_dir = os.path.dirname(os.path.abspath(__file__))
+    default_data_dir = os.path.join(backend_dir, 'data')
+
+    parser = argparse.ArgumentParser(description="Migrate Phoenix JSON data files into SQLite.")
+    parser.add_argument('--data-dir', default=default_data_dir, help="Directory holding elections.json")
+    parser.add_argument('--db', default=None, help="SQLite database path (default: <data-dir>/phoenix.db)")
+    parser.add_argument('--session-ttl', type=int, default=86400, help="Seconds imported sessions stay valid (default: 86400)")
+    args = parser.parse_args()
+
+    db_path = args.db or os.path.join(args.data_dir, 'phoenix.db')
+    if not os.path.exists(os.path.join(args.data_dir, 'elections.json')):
+        print(f"❌ No elections.json found in {args.data_dir}")
+        sys.exit(1)
+
+    print(f"📦 Migrating {args.data_dir} -> {db_path}")
+    store = SQLiteStore(db_path)
+    audit_dir = os.path.join(args.data_dir, 'login_audit')
+    counts = store.migrate_from_json(
+        args.data_dir,
+        login_log_file=os.path.join(args.data_dir, 'voter_login_log.json'),
+        login_records=LoginAuditLog(audit_dir).query() if os.path.isdir(audit_dir) else ()
+    )
+
+    sessions_file = os.path.join(args.data_dir, 'voter_sessions.json')
+    counts['sessions'] = 0
+    if os.path.exists(sessions_file):
+        with open(sessions_file, 'r') as f:
+            sessions = json.load(f)
+        backend = SQLiteSessionBackend(db_path)
+        expires_at = time.time() + args.session_ttl
+        for session_id, session_data in sessions.items():
+            backend.save(session_id, session_data, expires_at)
+            counts['sessions'] += 1
+    for name, count in counts.items():
+        print(f"   {name}: {count}")
+    print()
+    print("✅ Done. Set STORAGE_BACKEND = 'sqlite' (and SQLITE_DB_PATH if you used --db) in config.py.")
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,35 @@
 # backend/models.py
 from dataclasses import dataclass, asdict
-from typing import List, Optional, Dict, Any
-from datetime import datetime
+from typing import List, Optional, Dict, Any, Callable, FrozenSet, Iterable, Iterator, Tuple
+from datetime import datetime, timedelta
+from array import array
+import uuid
+
+def normalize_email(email: Optional[str]) -> str:
+    return (email or '').strip().casefold()
+
+def normalize_user_id(user_id: Optional[str]) -> str:
+    return str(user_id or '').strip()
+
+def _build_index(values: Iterable[str], normalize: Callable[[Optional[str]], str]) -> FrozenSet[str]:
+    return frozenset(normalize(v) for v in values)
+
+def _update_index(index: FrozenSet[str], old_values: List[str], new_values: List[str],
+                  normalize: Callable[[Optional[str]], str]) -> FrozenSet[str]:
+    """Apply the difference between two membership lists to an existing index.
+
+    Only added and removed entries are normalized. If the old list had several entries
+    that normalize to the same key, removing one of them must not drop the key, so
+    that case falls back to a full rebuild.
+    """
+    old_set, new_set = set(old_values), set(new_values)
+    if len(old_set) != len(index):
+        return _build_index(new_set, normalize)
+    removed = {normalize(v) for v in old_set - new_set}
+    added = {normalize(v) for v in new_set - old_set}
+    return (index - removed) | added
+
+CANDIDATE_PRIVATE_FIELDS = ('email', 'phone', 'place_of_birth', 'residence', 'full_name', 'date_of_birth')
 
 @dataclass
 class Candidate:
@@ -23,9 +51,8 @@ class Candidate:
     facebook_url: str = ""
     def to_dict(self, include_private: bool = False) -> Dict[str, Any]:
         data = asdict(self)
-        private_keys = ['email', 'phone', 'place_of_birth', 'residence','full_name','date_of_birth']
         if not include_private:
-            for key in private_keys:
+            for key in CANDIDATE_PRIVATE_FIELDS:
                 data.pop(key, None)
         return data
 
@@ -51,6 +78,160 @@ class VotesData:
             "votes": [vote.to_dict() for vote in self.votes]
         }
 
+COUNCIL_SLOTS = 15
+EXECUTIVE_SLOTS = 7
+_VOTE_FIELDS = frozenset(Vote.__dataclass_fields__)
+_EPOCH = datetime(1970, 1, 1)
+
+def _encode_timestamp(timestamp: Any) -> Optional[int]:
+    """'2025-09-19T08:56:18.224755Z' -> microseconds since the epoch, or None if it would not round-trip."""
+    if not isinstance(timestamp, str) or not timestamp.endswith('Z'):
+        return None
+    try:
+        dt = datetime.fromisoformat(timestamp[:-1])
+    except ValueError:
+        return None
+    if dt.tzinfo is not None or dt.isoformat() + 'Z' != timestamp:
+        return None
+    return (dt - _EPOCH) // timedelta(microseconds=1)
+
+def _decode_timestamp(micros: int) -> str:
+    return (_EPOCH + timedelta(microseconds=micros)).isoformat() + 'Z'
+
+def _encode_vote_id(vote_id: Any) -> Optional[bytes]:
+    try:
+        parsed = uuid.UUID(vote_id)
+    except (TypeError, ValueError, AttributeError):
+        return None
+    return parsed.bytes if str(parsed) == vote_id else None
+
+def _fits_slots(candidate_ids: Any, slots: int) -> bool:
+    return (isinstance(candidate_ids, list) and len(candidate_ids) <= slots
+            and all(type(cid) is int and 0 < cid <= 0xFFFF for cid in candidate_ids))
+
+class _LazyVotes:
+    """Read-only sequence view that builds Vote objects only when they are accessed."""
+    def __init__(self, data: 'ColumnarVotesData'):
+        self._data = data
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __getitem__(self, row: int) -> Vote:
+        if row < 0:
+            row += len(self._data)
+        if not 0 <= row < len(self._data):
+            raise IndexError(row)
+        return self._data.vote_at(row)
+
+    def __iter__(self) -> Iterator[Vote]:
+        for row in range(len(self._data)):
+            yield self._data.vote_at(row)
+
+    def __bool__(self) -> bool:
+        return len(self._data) > 0
+
+class ColumnarVotesData:
+    """Array-backed alternative to VotesData for large elections.
+
+    Per ballot it stores a 16-byte vote uuid, fixed-width council/executive
+    selections (0 marks an empty slot), a microsecond epoch timestamp and an index
+    into a table of voter identities -- roughly 70 bytes instead of a Vote object
+    with its lists and strings. `votes` materializes Vote objects on access. Ballots
+    that do not fit the fixed layout (non-uuid ids, odd timestamps, oversized
+    selections) are kept verbatim and returned unchanged.
+    """
+    def __init__(self):
+        self.vote_ids = bytearray()
+        self.council = array('H')
+        self.executive = array('H')
+        self.timestamps = array('q')
+        self.voter_refs = array('I')
+        self.voters: List[Tuple[str, str, str]] = []
+        self._voter_index: Dict[Tuple[str, str, str], int] = {}
+        self._irregular: Dict[int, Dict[str, Any]] = {}
+
+    def __len__(self) -> int:
+        return len(self.voter_refs)
+
+    def append_dict(self, vote_data: Dict[str, Any]):
+        if not isinstance(vote_data, dict):
+            raise TypeError(f"vote record must be a dict, got {type(vote_data).__name__}")
+        identity = (vote_data.get('voter_id', ''), vote_data.get('voter_name', ''), vote_data.get('voter_email', ''))
+        ref = self._voter_index.get(identity)
+        if ref is None:
+            ref = self._voter_index[identity] = len(self.voters)
+            self.voters.append(identity)
+
+        selected = vote_data.get('selected_candidates')
+        executive = vote_data.get('executive_candidates')
+        vote_id = _encode_vote_id(vote_data.get('id'))
+        micros = _encode_timestamp(vote_data.get('timestamp'))
+        regular = (vote_id is not None and micros is not None and 'voter_id' in vote_data
+                   and vote_data.keys() <= _VOTE_FIELDS
+                   and _fits_slots(selected, COUNCIL_SLOTS) and _fits_slots(executive, EXECUTIVE_SLOTS))
+        if not regular:
+            Vote(**vote_data)  # raises TypeError for records get_votes() would also reject
+            self._irregular[len(self)] = dict(vote_data)
+            selected, executive, vote_id, micros = [], [], bytes(16), 0
+        self.vote_ids += vote_id
+        self.council.extend(selected)
+        self.council.extend([0] * (COUNCIL_SLOTS - len(selected)))
+        self.executive.extend(executive)
+        self.executive.extend([0] * (EXECUTIVE_SLOTS - len(executive)))
+        self.timestamps.append(micros)
+        self.voter_refs.append(ref)
+
+    def append(self, vote: Vote):
+        self.append_dict(vote.to_dict())
+
+    def vote_at(self, row: int) -> Vote:
+        irregular = self._irregular.get(row)
+        if irregular is not None:
+            return Vote(**irregular)
+        voter_id, voter_name, voter_email = self.voters[self.voter_refs[row]]
+        council = self.council[row * COUNCIL_SLOTS:(row + 1) * COUNCIL_SLOTS]
+        executive = self.executive[row * EXECUTIVE_SLOTS:(row + 1) * EXECUTIVE_SLOTS]
+        return Vote(
+            id=str(uuid.UUID(bytes=bytes(self.vote_ids[row * 16:(row + 1) * 16]))),
+            voter_id=voter_id,
+            selected_candidates=[cid for cid in council if cid],
+            executive_candidates=[cid for cid in executive if cid],
+            timestamp=_decode_timestamp(self.timestamps[row]),
+            voter_name=voter_name,
+            voter_email=voter_email
+        )
+
+    def irregular_rows(self) -> Dict[int, Dict[str, Any]]:
+        return self._irregular
+
+    @property
+    def votes(self) -> _LazyVotes:
+        return _LazyVotes(self)
+
+    @property
+    def voter_ids(self) -> List[str]:
+        return [self.voters[ref][0] for ref in self.voter_refs]
+
+    def to_votes_data(self) -> VotesData:
+        return VotesData(voter_ids=self.voter_ids, votes=list(self.votes))
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "voter_ids": self.voter_ids,
+            "votes": [vote.to_dict() for vote in self.votes]
+        }
+
+    @classmethod
+    def from_records(cls, records: Iterable[Dict[str, Any]]) -> 'ColumnarVotesData':
+        data = cls()
+        for record in records:
+            try:
+                data.append_dict(record)
+            except TypeError as e:
+                print(f"Warning: Skipping invalid vote data due to TypeError: {e}. Data: {record}")
+        return data
+
 @dataclass
 class ElectionStatus:
     def __init__(self, is_open=False, start_time=None, end_time=None):
@@ -107,6 +288,9 @@ class Election:
             self.eligible_voter_emails = []
         if self.admin_user_ids is None:
             self.admin_user_ids = []
+        # Case-folded membership indexes; not dataclass fields, so to_dict() is unchanged.
+        self.eligible_voter_index = _build_index(self.eligible_voter_emails, normalize_email)
+        self.admin_user_index = _build_index(self.admin_user_ids, normalize_user_id)
 
     def to_dict(self) -> Dict[str, Any]:
         return asdict(self)
@@ -117,11 +301,21 @@ class Election:
         data.setdefault('admin_user_ids', [])
         return cls(**data)
 
+    def set_eligible_voter_emails(self, emails: List[str]):
+        self.eligible_voter_index = _update_index(
+            self.eligible_voter_index, self.eligible_voter_emails, emails, normalize_email)
+        self.eligible_voter_emails = list(emails)
+
+    def set_admin_user_ids(self, user_ids: List[str]):
+        self.admin_user_index = _update_index(
+            self.admin_user_index, self.admin_user_ids, user_ids, normalize_user_id)
+        self.admin_user_ids = list(user_ids)
+
     def is_user_admin(self, user_id: str) -> bool:
-        return user_id in self.admin_user_ids
+        return normalize_user_id(user_id) in self.admin_user_index
 
     def is_user_eligible_voter(self, user_email: str) -> bool:
-        return user_email in self.eligible_voter_emails
+        return normalize_email(user_email) in self.eligible_voter_index
 
     def get_status(self) -> ElectionStatus:
         return ElectionStatus(is_open=self.is_open, start_time=self.start_time, end_time=self.end_time)
@@ -0,0 +1,39 @@
+# backend/tests/support.py
+"""Shared setup for the backend tests; import it before anything from the app.
+
+data_handler reads Config at import time, so this installs a `config` module that
+points at a scratch data folder (JSON storage, 'json' vote mode). Each test creates
+its own election with new_election(), so tests do not see each other's data.
+"""
+import atexit
+import os
+import shutil
+import sys
+import tempfile
+import types
+import uuid
+from datetime import datetime, timezone
+
+DATA_DIR = tempfile.mkdtemp(prefix='phoenix-test-')
+atexit.register(shutil.rmtree, DATA_DIR, ignore_errors=True)
+
+_config = types.ModuleType('config')
+_config.Config = type('Config', (), {'DATA_FOLDER': DATA_DIR, 'STORAGE_BACKEND': 'json', 'VOTE_STORAGE_MODE': 'json'})
+_config.config = {'default': _config.Config}
+sys.modules['config'] = _config
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models import Vote
+
+def new_election() -> str:
+    """Create an empty election folder and return its id."""
+    from utils import data_handler
+    election_id = f'test-{uuid.uuid4().hex[:12]}'
+    assert data_handler.create_election_data_structure(election_id)
+    return election_id
+
+def ballot(voter_id: str) -> Vote:
+    """A valid 15/7 ballot from `voter_id`."""
+    return Vote(id=f'vote-{voter_id}', voter_id=voter_id, selected_candidates=list(range(1, 16)),
+                executive_candidates=list(range(1, 8)),
+                timestamp=datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z'))
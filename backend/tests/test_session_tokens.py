@@ -0,0 +1,85 @@
+# backend/tests/test_session_tokens.py
+import base64
+import json
+import os
+import time
+import unittest
+import uuid
+
+from support import DATA_DIR
+from utils.session_store import SQLiteSessionBackend
+from utils.session_tokens import SessionTokenSigner
+
+SESSION = {'user_id': 'user-1', 'email': 'voter@example.com', 'name': 'Voter', 'created_at': '2030-01-01T00:00:00Z',
+           'has_voted': False, 'is_admin': False, 'is_eligible_voter': True}
+
+def _encode(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b'=').decode('ascii')
+
+def _decode(text: str) -> bytes:
+    return base64.urlsafe_b64decode(text + '=' * (-len(text) % 4))
+
+class SessionTokenSignerTest(unittest.TestCase):
+    def setUp(self):
+        self.backend = SQLiteSessionBackend(os.path.join(DATA_DIR, f'tokens-{uuid.uuid4().hex}.db'))
+        self.signer = self._signer()
+
+    def _signer(self, secret='test-secret', **kwargs) -> SessionTokenSigner:
+        kwargs.setdefault('revocation_refresh_seconds', 0)
+        return SessionTokenSigner(secret, self.backend, **kwargs)
+
+    def test_issued_token_verifies_to_the_session_fields(self):
+        self.assertEqual(self.signer.verify(self.signer.issue(dict(SESSION, extra='not carried'))), SESSION)
+
+    def test_tampered_token_is_rejected(self):
+        token = self.signer.issue(SESSION)
+        payload, signature = token.split('.')
+        claims = json.loads(_decode(payload))
+        claims['is_admin'] = True
+        forged_payload = _encode(json.dumps(claims, separators=(',', ':')).encode('utf-8'))
+        flipped = signature[:-2] + ('A' if signature[-2] != 'A' else 'B') + signature[-1]
+
+        self.assertIsNone(self.signer.verify(f'{forged_payload}.{signature}'))
+        self.assertIsNone(self.signer.verify(f'{payload}.{flipped}'))
+        self.assertIsNone(self.signer.verify(f'{payload}.'))
+        for malformed in ('', 'no-dot', 'a.b.c', '!!!.???', None, 42):
+            self.assertIsNone(self.signer.verify(malformed))
+
+    def test_expired_token_is_rejected(self):
+        self.assertIsNone(self._signer(ttl_seconds=-1).verify(self._signer(ttl_seconds=-1).issue(SESSION)))
+        self.assertIsNotNone(self._signer(ttl_seconds=60).verify(self._signer(ttl_seconds=60).issue(SESSION)))
+
+    def test_revoked_token_is_rejected_by_every_worker(self):
+        other_worker = self._signer()
+        token, kept = self.signer.issue(SESSION), self.signer.issue(SESSION)
+        self.assertIsNotNone(other_worker.verify(token))
+
+        self.signer.revoke(token)
+        self.assertIsNone(self.signer.verify(token))
+        self.assertIsNone(other_worker.verify(token))
+        self.assertEqual(other_worker.verify(kept), SESSION)
+
+    def test_revoking_prunes_revocations_that_have_expired(self):
+        expired = self._signer(ttl_seconds=-1).issue(SESSION)
+        self.signer.revoke(expired)
+        self.assertEqual(len(self.backend.revoked_tokens(0)), 1)
+
+        self.signer.revoke(self.signer.issue(SESSION))
+        remaining = self.backend.revoked_tokens(0)
+        self.assertEqual(len(remaining), 1)
+        self.assertEqual(self.backend.revoked_tokens(time.time()), remaining)
+
+    def test_rotating_the_secret_invalidates_existing_tokens(self):
+        token = self.signer.issue(SESSION)
+        self.assertEqual(self._signer('test-secret').verify(token), SESSION)
+        rotated = self._signer('rotated-secret')
+        self.assertIsNone(rotated.verify(token))
+        self.assertEqual(rotated.verify(rotated.issue(SESSION)), SESSION)
+
+    def test_missing_secret_is_refused(self):
+        for secret in ('', None):
+            with self.assertRaises(ValueError):
+                self._signer(secret)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,86 @@
+# backend/tests/test_sqlite_migration.py
+import contextlib
+import io
+import json
+import os
+import shutil
+import sys
+import unittest
+
+from support import DATA_DIR, ballot, new_election
+from models import Election, ElectionStatus, VotesData
+from utils import data_handler
+from utils.login_audit import LoginAuditLog
+from utils.sqlite_store import SQLiteStore
+import migrate_to_sqlite
+
+class MigrationRoundTripTest(unittest.TestCase):
+    """Build the JSON layout through data_handler, migrate it, and read it back from SQLite."""
+
+    def setUp(self):
+        self.election_id = new_election()
+        self.db_path = os.path.join(DATA_DIR, f'{self.election_id}.db')
+        election = Election(id=self.election_id, name='Migration test', description='', created_by='admin',
+                            created_at='2030-01-01T00:00:00Z', eligible_voter_emails=['voter@example.com'])
+        self.assertTrue(data_handler.save_elections(data_handler.get_elections() + [election]))
+        self.assertTrue(data_handler.save_election_status(
+            ElectionStatus(is_open=True, start_time='2030-01-01T00:00:00Z', end_time='2030-01-02T00:00:00Z'),
+            self.election_id))
+        ok, message, _, _ = data_handler.add_candidates(
+            [{'name': f'C{i}', 'bio': 'bio', 'email': f'c{i}@example.com', 'activity': i} for i in range(1, 21)],
+            self.election_id)
+        self.assertTrue(ok, message)
+
+        # Two ballots in the votes.json snapshot and two in the votes.jsonl log.
+        self.assertTrue(data_handler.save_votes(
+            VotesData(voter_ids=['v1', 'v2'], votes=[ballot('v1'), ballot('v2')]), self.election_id))
+        original_mode = data_handler.VOTE_STORAGE_MODE
+        data_handler.VOTE_STORAGE_MODE = 'jsonl'
+        self.addCleanup(lambda: setattr(data_handler, 'VOTE_STORAGE_MODE', original_mode))
+        self.assertEqual(data_handler.append_votes([ballot('v3'), ballot('v4')], self.election_id), [True, True])
+
+        with open(os.path.join(DATA_DIR, 'voter_login_log.json'), 'w') as f:
+            json.dump([{'google_id': 'g1', 'email': 'old@example.com', 'name': 'Old',
+                        'login_timestamp': '2029-12-31T00:00:00Z'}], f)
+        audit_dir = os.path.join(DATA_DIR, 'login_audit')
+        shutil.rmtree(audit_dir, ignore_errors=True)
+        audit_log = LoginAuditLog(audit_dir)
+        audit_log.log({'google_id': 'g2', 'email': 'new@example.com', 'name': 'New',
+                       'login_timestamp': '2030-01-01T00:00:00Z'})
+        audit_log.flush()
+
+    def _migrate(self) -> SQLiteStore:
+        argv = sys.argv
+        sys.argv = ['migrate_to_sqlite.py', '--data-dir', DATA_DIR, '--db', self.db_path]
+        try:
+            with contextlib.redirect_stdout(io.StringIO()):
+                migrate_to_sqlite.main()
+        finally:
+            sys.argv = argv
+        return SQLiteStore(self.db_path)
+
+    def assertMatchesJson(self, store: SQLiteStore):
+        json_votes = data_handler.get_votes(self.election_id)
+        sqlite_votes = store.get_votes(self.election_id)
+        self.assertEqual(sqlite_votes.voter_ids, ['v1', 'v2', 'v3', 'v4'])
+        self.assertEqual(sqlite_votes.voter_ids, json_votes.voter_ids)
+        self.assertEqual([v.to_dict() for v in sqlite_votes.votes], [v.to_dict() for v in json_votes.votes])
+        self.assertEqual([c.to_dict(include_private=True) for c in store.get_candidates(self.election_id)],
+                         [c.to_dict(include_private=True)
+                          for c in data_handler.get_candidates(self.election_id, include_private=True)])
+        self.assertEqual(store.get_election_status(self.election_id).to_dict(),
+                         data_handler.get_election_status(self.election_id).to_dict())
+        self.assertEqual(store.get_election_by_id(self.election_id).to_dict(),
+                         data_handler.get_election_by_id(self.election_id).to_dict())
+        self.assertTrue(store.has_voter_voted(self.election_id, 'v4'))
+        self.assertEqual([entry['email'] for entry in store.iter_logins()], ['old@example.com', 'new@example.com'])
+
+    def test_migrated_data_matches_the_json_layout(self):
+        self.assertMatchesJson(self._migrate())
+
+    def test_rerunning_the_migration_is_idempotent(self):
+        self._migrate()
+        self.assertMatchesJson(self._migrate())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,106 @@
+# backend/tests/test_storage_locking.py
+import json
+import multiprocessing
+import os
+import threading
+import unittest
+
+from support import new_election
+from models import ElectionStatus
+from utils import data_handler
+
+def _run_threads(target, count):
+    barrier = threading.Barrier(count)
+    errors = []
+
+    def run(n):
+        barrier.wait()
+        try:
+            target(n)
+        except Exception as e:  # returned so the test can assert there were none
+            errors.append(e)
+
+    threads = [threading.Thread(target=run, args=(n,)) for n in range(count)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return errors
+
+def _add_batches(election_id, writer, batches, start=None):
+    if start is not None:
+        start.wait()
+    for batch in range(batches):
+        rows = [{'name': f'w{writer}-b{batch}-{i}', 'bio': 'bio'} for i in range(3)]
+        ok, message, _, errors = data_handler.add_candidates(rows, election_id)
+        assert ok, (message, errors)
+
+class ConcurrentWriterTest(unittest.TestCase):
+    def setUp(self):
+        self.election_id = new_election()
+        self.election_dir = os.path.dirname(data_handler._get_election_file_path(self.election_id, 'votes.json'))
+
+    def assertAllCandidatesKept(self, writers, batches):
+        candidates = data_handler.get_candidates(self.election_id, include_private=True)
+        expected = {f'w{w}-b{b}-{i}' for w in range(writers) for b in range(batches) for i in range(3)}
+        self.assertEqual(sorted(c.name for c in candidates), sorted(expected))
+        self.assertEqual(sorted(c.id for c in candidates), list(range(1, len(expected) + 1)))
+
+    def assertNoTempFiles(self):
+        self.assertEqual([name for name in os.listdir(self.election_dir) if name.endswith('.tmp')], [])
+
+    def test_concurrent_add_candidates_lose_no_rows(self):
+        errors = _run_threads(lambda n: _add_batches(self.election_id, n, 10), 8)
+        self.assertEqual(errors, [])
+        self.assertAllCandidatesKept(8, 10)
+        self.assertNoTempFiles()
+
+    @unittest.skipUnless('fork' in multiprocessing.get_all_start_methods(), 'needs fork')
+    def test_add_candidates_from_several_processes_lose_no_rows(self):
+        context = multiprocessing.get_context('fork')
+        start = context.Barrier(4)
+        workers = [context.Process(target=_add_batches, args=(self.election_id, n, 10, start)) for n in range(4)]
+        for p in workers:
+            p.start()
+        for p in workers:
+            p.join()
+        self.assertEqual([p.exitcode for p in workers], [0] * 4)
+        self.assertAllCandidatesKept(4, 10)
+        self.assertNoTempFiles()
+
+    def test_status_readers_never_see_a_partial_file(self):
+        status_file = data_handler._get_election_file_path(self.election_id, 'election_status.json')
+        # Padded so each write spans several blocks and a torn file would be visible.
+        written = [ElectionStatus(is_open=bool(n % 2), start_time=f'2030-01-01T00:00:{n:02d}Z',
+                                  end_time='2030-01-02T00:00:00Z' + ' ' * 20000 * (n + 1)).to_dict()
+                   for n in range(4)]
+        with open(status_file) as f:
+            initial = json.load(f)
+        writers_done = threading.Event()
+        seen = []
+
+        def write(n):
+            for _ in range(50):
+                assert data_handler.save_election_status(ElectionStatus(**written[n]), self.election_id)
+
+        def read(_):
+            while not writers_done.is_set():
+                # Read the raw file: data_handler's loader would hide a decode error.
+                with open(status_file) as f:
+                    seen.append(json.load(f) in written + [initial])
+
+        readers = threading.Thread(target=lambda: read_errors.extend(_run_threads(read, 2)))
+        read_errors = []
+        readers.start()
+        write_errors = _run_threads(write, 4)
+        writers_done.set()
+        readers.join()
+
+        self.assertEqual(write_errors + read_errors, [])
+        self.assertTrue(seen and all(seen))
+        with open(status_file) as f:
+            self.assertIn(json.load(f), written)
+        self.assertNoTempFiles()
+
+if __name__ == '__main__':
+    unittest.main()
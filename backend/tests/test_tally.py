@@ -0,0 +1,90 @@
+# backend/tests/test_tally.py
+import unittest
+from collections import Counter
+
+from support import ballot, new_election
+from models import Candidate
+from utils import data_handler, tally as tally_module
+from utils.tally import TallyEngine
+
+CANDIDATES = [Candidate(id=i, name=f'C{i}', photo='', bio='bio', activity=0, field_of_activity='')
+              for i in range(1, 21)]
+
+def _ballot(n):
+    vote = ballot(f'voter-{n}')
+    # Vary the picks so the counts differ between candidates.
+    vote.selected_candidates = [(n + i) % 20 + 1 for i in range(15)]
+    vote.executive_candidates = vote.selected_candidates[:7]
+    return vote
+
+class TallyCheckpointTest(unittest.TestCase):
+    """The jsonl layout, where tail reads are incremental and checkpoints pay off."""
+
+    def setUp(self):
+        self.original_mode = data_handler.VOTE_STORAGE_MODE
+        data_handler.VOTE_STORAGE_MODE = 'jsonl'
+        self.election_id = new_election()
+        self.replayed = []
+        self.checkpoints = []
+        self.real_read, self.real_save = tally_module.read_votes_since, tally_module.save_tally_checkpoint
+
+        def counting_read(election_id, cursor):
+            votes, new_cursor, full = self.real_read(election_id, cursor)
+            self.replayed.append(len(votes))
+            return votes, new_cursor, full
+
+        def counting_save(election_id, checkpoint):
+            self.checkpoints.append(checkpoint['ballots'])
+            return self.real_save(election_id, checkpoint)
+
+        tally_module.read_votes_since, tally_module.save_tally_checkpoint = counting_read, counting_save
+
+    def tearDown(self):
+        tally_module.read_votes_since, tally_module.save_tally_checkpoint = self.real_read, self.real_save
+        data_handler.VOTE_STORAGE_MODE = self.original_mode
+
+    def _store(self, engine, numbers):
+        for n in numbers:
+            self.assertEqual(data_handler.append_votes([_ballot(n)], self.election_id), [True])
+            engine.record_ballot(self.election_id)
+
+    def assertMatchesRecount(self, total, results):
+        votes = data_handler.get_votes(self.election_id).votes
+        council = Counter(c for v in votes for c in v.selected_candidates)
+        executive = Counter(c for v in votes for c in v.executive_candidates)
+        self.assertEqual(total, len(votes))
+        self.assertEqual({r['id']: (r['councilVotes'], r['executiveVotes']) for r in results},
+                         {c.id: (council[c.id], executive[c.id]) for c in CANDIDATES})
+
+    def test_restart_replays_only_the_tail_after_the_checkpoint(self):
+        self._store(TallyEngine(checkpoint_every=5), range(7))
+        self.assertEqual(self.checkpoints, [5])
+
+        self.replayed.clear()
+        restarted = TallyEngine(checkpoint_every=5)
+        total, results = restarted.results(self.election_id, CANDIDATES)
+        self.assertEqual(self.replayed, [2])
+        self.assertMatchesRecount(total, results)
+
+    def test_reading_results_does_not_write_checkpoints(self):
+        engine = TallyEngine(checkpoint_every=5)
+        self._store(engine, range(3))
+        for _ in range(10):
+            total, results = engine.results(self.election_id, CANDIDATES)
+        self.assertEqual(self.checkpoints, [])
+        self.assertMatchesRecount(total, results)
+
+    def test_checkpoint_all_saves_the_pending_tail(self):
+        engine = TallyEngine(checkpoint_every=5)
+        self._store(engine, range(7))
+        engine.checkpoint_all()
+        engine.checkpoint_all()
+        self.assertEqual(self.checkpoints, [5, 7])
+
+        self.replayed.clear()
+        total, results = TallyEngine(checkpoint_every=5).results(self.election_id, CANDIDATES)
+        self.assertEqual(self.replayed, [0])
+        self.assertMatchesRecount(total, results)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,37 @@
+# backend/tests/test_vote_queue.py
+import unittest
+
+from support import ballot, new_election
+from utils import data_handler, vote_queue
+from utils.vote_queue import VoteIngestQueue
+
+class QueuedReservationTest(unittest.TestCase):
+    def test_second_ballot_from_queued_voter_is_refused_while_another_batch_commits(self):
+        election_id = new_election()
+        queue = VoteIngestQueue(max_batch=1, linger_seconds=0)
+        real_append_votes = vote_queue.append_votes
+        attempts = []
+
+        def append_then_retry_queued_voter(votes, election_id):
+            results = real_append_votes(votes, election_id)
+            if votes[0].voter_id == 'committed':
+                # 'queued' was reserved and is waiting for the next batch; a second
+                # ballot from them must still be refused after this commit.
+                attempts.append((data_handler.has_voter_voted(election_id, 'queued'),
+                                 data_handler.reserve_voter(election_id, 'queued')))
+            return results
+
+        self.assertTrue(data_handler.reserve_voter(election_id, 'committed'))
+        self.assertTrue(data_handler.reserve_voter(election_id, 'queued'))
+        vote_queue.append_votes = append_then_retry_queued_voter
+        try:
+            self.assertTrue(queue.submit(election_id, ballot('committed')))
+            self.assertTrue(queue.submit(election_id, ballot('queued')))
+        finally:
+            vote_queue.append_votes = real_append_votes
+
+        self.assertEqual(attempts, [(True, False)])
+        self.assertEqual(sorted(data_handler.get_votes(election_id).voter_ids), ['committed', 'queued'])
+
+if __name__ == '__main__':
+    unittest.main()
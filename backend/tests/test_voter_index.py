@@ -0,0 +1,110 @@
+# backend/tests/test_voter_index.py
+import multiprocessing
+import os
+import threading
+import unittest
+from collections import Counter
+
+from support import ballot, new_election
+from models import VotesData
+from utils import data_handler
+from utils.data_handler import _VoterIdIndex
+
+def _reserve_concurrently(reserve, voter_ids, threads=8):
+    """Call reserve(voter_id) for every voter from `threads` threads at once; count the successes."""
+    barrier = threading.Barrier(threads)
+    granted = Counter()
+    granted_lock = threading.Lock()
+
+    def worker():
+        barrier.wait()
+        for voter_id in voter_ids:
+            if reserve(voter_id):
+                with granted_lock:
+                    granted[voter_id] += 1
+
+    workers = [threading.Thread(target=worker) for _ in range(threads)]
+    for t in workers:
+        t.start()
+    for t in workers:
+        t.join()
+    return granted
+
+def _reserve_in_worker(election_id, voter_ids, start, results):
+    index = _VoterIdIndex(election_id)
+    start.wait()
+    results.put([voter_id for voter_id in voter_ids if index.reserve(voter_id)])
+
+class VoterReservationTest(unittest.TestCase):
+    def setUp(self):
+        self.election_id = new_election()
+        self.log_path = data_handler._get_election_file_path(self.election_id, data_handler.VOTED_IDS_FILENAME)
+
+    def test_same_voter_reserved_from_many_threads_succeeds_once(self):
+        voter_ids = [f'voter-{i}' for i in range(50)]
+        granted = _reserve_concurrently(lambda v: data_handler.reserve_voter(self.election_id, v), voter_ids)
+        self.assertEqual(granted, Counter({v: 1 for v in voter_ids}))
+
+    @unittest.skipUnless('fork' in multiprocessing.get_all_start_methods(), 'needs fork')
+    def test_reservations_are_exclusive_across_processes(self):
+        # Each worker process has its own in-memory set; only the flock on
+        # voted_ids.log keeps them from granting the same voter twice.
+        context = multiprocessing.get_context('fork')
+        voter_ids = [f'voter-{i}' for i in range(300)]
+        start, results = context.Barrier(4), context.Queue()
+        workers = [context.Process(target=_reserve_in_worker, args=(self.election_id, voter_ids, start, results))
+                   for _ in range(4)]
+        for p in workers:
+            p.start()
+        granted = Counter(v for _ in workers for v in results.get(timeout=60))
+        for p in workers:
+            p.join()
+        self.assertEqual(granted, Counter({v: 1 for v in voter_ids}))
+        self.assertTrue(all(data_handler.has_voter_voted(self.election_id, v) for v in voter_ids))
+
+    def test_released_voter_can_vote_again(self):
+        self.assertTrue(data_handler.reserve_voter(self.election_id, 'alice'))
+        self.assertFalse(data_handler.reserve_voter(self.election_id, 'alice'))
+        # The ballot could not be stored, so the reservation is undone.
+        data_handler.release_voter(self.election_id, 'alice')
+        self.assertFalse(data_handler.has_voter_voted(self.election_id, 'alice'))
+        self.assertTrue(data_handler.reserve_voter(self.election_id, 'alice'))
+
+    def test_restart_replays_reservations_and_releases(self):
+        for voter_id in ('alice', 'bob', 'carol'):
+            self.assertTrue(data_handler.reserve_voter(self.election_id, voter_id))
+        data_handler.release_voter(self.election_id, 'bob')
+        with open(self.log_path, 'rb') as f:
+            self.assertEqual(f.read().splitlines()[1:], [b'+"alice"', b'+"bob"', b'+"carol"', b'-"bob"'])
+
+        restarted = _VoterIdIndex(self.election_id)
+        self.assertTrue(restarted.contains('alice'))
+        self.assertFalse(restarted.contains('bob'))
+        self.assertTrue(restarted.contains('carol'))
+        self.assertTrue(restarted.reserve('bob'))
+        self.assertFalse(restarted.reserve('carol'))
+
+    def test_rewrite_changes_generation_and_other_processes_rebuild(self):
+        other = _VoterIdIndex(self.election_id)
+        self.assertTrue(data_handler.reserve_voter(self.election_id, 'alice'))
+        self.assertTrue(other.contains('alice'))
+        with open(self.log_path, 'rb') as f:
+            header = f.readline()
+
+        self.assertTrue(data_handler.save_votes(VotesData(voter_ids=['bob'], votes=[ballot('bob')]), self.election_id))
+        with open(self.log_path, 'rb') as f:
+            self.assertNotEqual(f.readline(), header)
+        self.assertFalse(other.contains('alice'))
+        self.assertTrue(other.contains('bob'))
+
+    def test_missing_log_is_seeded_from_stored_ballots(self):
+        self.assertTrue(data_handler.save_votes(VotesData(voter_ids=['alice'], votes=[ballot('alice')]), self.election_id))
+        os.remove(self.log_path)
+
+        restarted = _VoterIdIndex(self.election_id)
+        self.assertTrue(restarted.contains('alice'))
+        self.assertFalse(restarted.reserve('alice'))
+        self.assertTrue(os.path.exists(self.log_path))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,132 @@
+# backend/utils/analytics.py
+from typing import List, Any, Dict, Iterable
+from models import Candidate, Vote, ColumnarVotesData, COUNCIL_SLOTS, EXECUTIVE_SLOTS
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional; the analytics endpoint reports it as unavailable
+    np = None
+
+def is_available() -> bool:
+    return np is not None
+
+class BallotMatrix:
+    """Ballots as dense 0/1 matrices (ballots x candidates) for vectorized analysis.
+
+    Candidate ids are mapped to column indexes in roster order; selections of ids
+    that are not on the roster are dropped, matching how the results endpoint counts.
+    """
+    def __init__(self, votes: Iterable[Vote], candidates: List[Candidate]):
+        if np is None:
+            raise RuntimeError("numpy is not installed")
+        self.candidates = candidates
+        if isinstance(votes, ColumnarVotesData):
+            self._from_columnar(votes)
+            return
+        column_of = {c.id: i for i, c in enumerate(candidates)}
+        n_candidates = len(candidates)
+
+        council_rows, council_cols = [], []
+        executive_rows, executive_cols = [], []
+        timestamps = []
+        n_ballots = 0
+        for row, vote in enumerate(votes):
+            for cid in vote.selected_candidates:
+                col = column_of.get(cid)
+                if col is not None:
+                    council_rows.append(row)
+                    council_cols.append(col)
+            for cid in vote.executive_candidates:
+                col = column_of.get(cid)
+                if col is not None:
+                    executive_rows.append(row)
+                    executive_cols.append(col)
+            timestamps.append(vote.timestamp[:19])
+            n_ballots = row + 1
+
+        self.council = np.zeros((n_ballots, n_candidates), dtype=np.uint8)
+        self.council[council_rows, council_cols] = 1
+        self.executive = np.zeros((n_ballots, n_candidates), dtype=np.uint8)
+        self.executive[executive_rows, executive_cols] = 1
+        # Vote timestamps are UTC ISO strings ("...Z"); seconds precision is enough for bucketing.
+        self.timestamps = np.array(timestamps, dtype='datetime64[s]').astype(np.int64)
+
+    def _from_columnar(self, data: ColumnarVotesData):
+        """Build the matrices straight from the fixed-width id arrays, without per-ballot Python loops."""
+        n_ballots, n_candidates = len(data), len(self.candidates)
+        # Lookup table from candidate id to column; empty slots (0) and unknown ids map to -1.
+        column_of = np.full(0x10000, -1, dtype=np.int64)
+        for i, c in enumerate(self.candidates):
+            if 0 < c.id <= 0xFFFF:
+                column_of[c.id] = i
+
+        def to_matrix(ids: 'np.ndarray', slots: int) -> 'np.ndarray':
+            matrix = np.zeros((n_ballots, n_candidates + 1), dtype=np.uint8)
+            cols = column_of[ids.reshape(n_ballots, slots)]
+            rows = np.repeat(np.arange(n_ballots), slots).reshape(n_ballots, slots)
+            matrix[rows, np.where(cols >= 0, cols, n_candidates)] = 1  # unknown ids land in a spare column
+            return matrix[:, :n_candidates]
+
+        self.council = to_matrix(np.frombuffer(data.council, dtype=np.uint16), COUNCIL_SLOTS)
+        self.executive = to_matrix(np.frombuffer(data.executive, dtype=np.uint16), EXECUTIVE_SLOTS)
+        self.timestamps = np.frombuffer(data.timestamps, dtype=np.int64) // 1_000_000
+
+        # Ballots that did not fit the fixed layout are patched in one by one.
+        ids = {c.id: i for i, c in enumerate(self.candidates)}
+        for row, vote_data in data.irregular_rows().items():
+            for matrix, key in ((self.council, 'selected_candidates'), (self.executive, 'executive_candidates')):
+                for cid in vote_data.get(key, []):
+                    if cid in ids:
+                        matrix[row, ids[cid]] = 1
+            self.timestamps[row] = np.array([str(vote_data.get('timestamp', ''))[:19]], dtype='datetime64[s]').astype(np.int64)[0]
+
+    @property
+    def ballot_count(self) -> int:
+        return int(self.council.shape[0])
+
+    def tallies(self) -> Dict[str, Any]:
+        return {
+            'council': self.council.sum(axis=0, dtype=np.int64),
+            'executive': self.executive.sum(axis=0, dtype=np.int64)
+        }
+
+    def co_selection(self) -> 'np.ndarray':
+        """Pairwise counts of ballots selecting both candidates for council (diagonal = council votes)."""
+        council = self.council.astype(np.int32)
+        return council.T @ council
+
+    def executive_overlap(self) -> 'np.ndarray':
+        """[i, j] = ballots naming i as executive and j on the council."""
+        return self.executive.astype(np.int32).T @ self.council.astype(np.int32)
+
+    def turnout(self, bucket_seconds: int = 3600) -> List[Dict[str, Any]]:
+        if not self.ballot_count:
+            return []
+        buckets, counts = np.unique(self.timestamps // bucket_seconds * bucket_seconds, return_counts=True)
+        starts = buckets.astype('datetime64[s]').astype(str)
+        return [{'start': f"{start}Z", 'votes': int(count)} for start, count in zip(starts, counts)]
+
+def election_analytics(votes: Iterable[Vote], candidates: List[Candidate], bucket_seconds: int = 3600) -> Dict[str, Any]:
+    matrix = BallotMatrix(votes, candidates)
+    tallies = matrix.tallies()
+    council, executive = tallies['council'], tallies['executive']
+    with np.errstate(divide='ignore', invalid='ignore'):
+        executive_share = np.where(council > 0, executive / np.maximum(council, 1), 0.0)
+    return {
+        'totalVotes': matrix.ballot_count,
+        'candidates': [
+            {
+                'id': c.id,
+                'name': c.name,
+                'councilVotes': int(council[i]),
+                'executiveVotes': int(executive[i]),
+                'executiveShare': round(float(executive_share[i]), 4)
+            }
+            for i, c in enumerate(candidates)
+        ],
+        'candidateIds': [c.id for c in candidates],
+        'coSelection': matrix.co_selection().tolist(),
+        'executiveCouncilOverlap': matrix.executive_overlap().tolist(),
+        'turnout': matrix.turnout(bucket_seconds),
+        'turnoutBucketSeconds': bucket_seconds
+    }
@@ -1,16 +1,107 @@
 # utils/auth.py
 import os
 import json
-from typing import Optional, Dict, Any, List
+import base64
+import hashlib
+import re
+import secrets
+import threading
+import time
+from typing import Optional, Dict, Any, Iterator, Mapping, Tuple
+from urllib.parse import urlencode
 import datetime
 import uuid
-from google_auth_oauthlib.flow import Flow
 from google.oauth2 import id_token
 from google.auth.transport import requests as google_requests
 import requests as http_requests
+from contextlib import contextmanager
+from requests.adapters import HTTPAdapter
+from config import Config
+from utils.data_handler import get_sqlite_store, SQLITE_DB_PATH
+from utils.session_store import SessionStore, SQLiteSessionBackend
+from utils.session_tokens import SessionTokenSigner
+from utils.login_audit import LoginAuditLog
+from utils.schedule import parse_schedule_time
+from utils.metrics import metrics
+
+GOOGLE_ENDPOINTS = {
+    'auth_uri': 'https://accounts.google.com/o/oauth2/auth',
+    'token_uri': 'https://oauth2.googleapis.com/token',
+    'certs_uri': 'https://www.googleapis.com/oauth2/v1/certs',
+    'userinfo_uri': 'https://www.googleapis.com/oauth2/v2/userinfo',
+}
+
+_MAX_AGE = re.compile(r'max-age=(\d+)')
+
+# Seconds the current thread has spent waiting on Google since the last reset.
+_google_wait = threading.local()
+
+@contextmanager
+def _waiting_on_google(kind: str):
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        _google_wait.seconds = getattr(_google_wait, 'seconds', 0.0) + elapsed
+        metrics.record_timing(f'oauth.google.{kind}', elapsed)
+
+def reset_google_wait():
+    _google_wait.seconds = 0.0
+
+def google_wait_seconds() -> float:
+    """Time this thread spent in HTTP calls to Google since reset_google_wait()."""
+    return getattr(_google_wait, 'seconds', 0.0)
+
+class _CachingRequest(google_requests.Request):
+    """google-auth transport over a shared session that caches GET responses
+    (Google's signing certificates) for as long as their Cache-Control max-age allows."""
+    def __init__(self, session: http_requests.Session, timeout: float):
+        super().__init__(session=session)
+        self.timeout = timeout
+        self._lock = threading.Lock()
+        self._cache: Dict[str, Tuple[Any, float]] = {}  # url -> (response, expires_at monotonic)
+
+    def __call__(self, url, method='GET', body=None, headers=None, timeout=None, **kwargs):
+        if method != 'GET' or body is not None:
+            return super().__call__(url, method=method, body=body, headers=headers,
+                                    timeout=timeout or self.timeout, **kwargs)
+        cached = self._cache.get(url)
+        if cached and cached[1] > time.monotonic():
+            return cached[0]
+        # One fetch at a time, so a login storm on a cold cache costs a single round trip.
+        with self._lock:
+            cached = self._cache.get(url)
+            if cached and cached[1] > time.monotonic():
+                return cached[0]
+            with _waiting_on_google('certs'):
+                response = super().__call__(url, method='GET', headers=headers, timeout=timeout or self.timeout, **kwargs)
+            cache_control = response.headers.get('Cache-Control', '')
+            match = _MAX_AGE.search(cache_control)
+            if response.status == 200 and match and 'no-store' not in cache_control:
+                self._cache[url] = (response, time.monotonic() + int(match.group(1)))
+            return response
+
+    def invalidate(self, url: str):
+        with self._lock:
+            self._cache.pop(url, None)
 
 class GoogleAuth:
-    def __init__(self, client_id: str, client_secret: str, redirect_uri: str):
+    """Google OAuth2 sign-in.
+
+    The client configuration and authorization parameters are built once. Token
+    exchanges, userinfo calls and certificate fetches share one pooled HTTP
+    session, and Google's signing certificates are cached per their Cache-Control
+    max-age, so a callback normally costs a single request to Google. Pass
+    `endpoints` to point at a stand-in server (see utils.google_standin).
+
+    This talks to the endpoints directly rather than through google_auth_oauthlib's
+    Flow. A Flow holds per-login state (its PKCE verifier and token), so one hoisted
+    instance cannot be shared between concurrent logins. It also opens a fresh
+    OAuth2Session for every exchange, which defeats the connection pool.
+    """
+    def __init__(self, client_id: str, client_secret: str, redirect_uri: str,
+                 endpoints: Optional[Dict[str, str]] = None, pool_size: int = 32, timeout: float = 10.0):
         self.client_id = client_id
         self.client_secret = client_secret
         self.redirect_uri = redirect_uri
@@ -19,62 +110,79 @@ class GoogleAuth:
             'https://www.googleapis.com/auth/userinfo.email',
             'https://www.googleapis.com/auth/userinfo.profile'
         ]
+        self.endpoints = dict(GOOGLE_ENDPOINTS, **(endpoints or {}))
+        self.timeout = timeout
+        self.http = http_requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_size)
+        self.http.mount('https://', adapter)
+        self.http.mount('http://', adapter)
+        self.request = _CachingRequest(self.http, timeout)
+        self._authorization_params = {
+            'response_type': 'code',
+            'client_id': client_id,
+            'redirect_uri': redirect_uri,
+            'scope': ' '.join(self.scopes),
+            'access_type': 'offline',
+            'include_granted_scopes': 'true',
+            'code_challenge_method': 'S256',
+        }
+        self._last_forced_refresh = float('-inf')
 
-    def get_authorization_url(self) -> tuple[str, str]:
-        """Generate Google OAuth2 authorization URL."""
-        flow = Flow.from_client_config(
-            {
-                "web": {
-                    "client_id": self.client_id,
-                    "client_secret": self.client_secret,
-                    "auth_uri": "https://accounts.google.com/o/oauth2/auth",
-                    "token_uri": "https://oauth2.googleapis.com/token",
-                    "redirect_uris": [self.redirect_uri]
-                }
-            },
-            scopes=self.scopes
-        )
-        flow.redirect_uri = self.redirect_uri
-        authorization_url, state = flow.authorization_url(
-            access_type='offline',
-            include_granted_scopes='true'
-        )
-        return authorization_url, state
-
-    def exchange_code_for_tokens(self, authorization_code: str) -> Optional[Dict[str, Any]]:
+    def get_authorization_url(self) -> tuple[str, str, str]:
+        """Generate Google OAuth2 authorization URL.
+
+        Returns (url, state, code_verifier); keep the state and PKCE verifier in the
+        user's session for the callback.
+        """
+        state = secrets.token_urlsafe(30)
+        code_verifier = secrets.token_urlsafe(64)
+        code_challenge = base64.urlsafe_b64encode(hashlib.sha256(code_verifier.encode('ascii')).digest()).rstrip(b'=').decode('ascii')
+        query = urlencode(dict(self._authorization_params, state=state, code_challenge=code_challenge))
+        return f"{self.endpoints['auth_uri']}?{query}", state, code_verifier
+
+    def exchange_code_for_tokens(self, authorization_code: str, code_verifier: Optional[str] = None) -> Optional[Dict[str, Any]]:
         """Exchange authorization code for access and ID tokens."""
-        flow = Flow.from_client_config(
-            {
-                "web": {
-                    "client_id": self.client_id,
-                    "client_secret": self.client_secret,
-                    "auth_uri": "https://accounts.google.com/o/oauth2/auth",
-                    "token_uri": "https://oauth2.googleapis.com/token",
-                    "redirect_uris": [self.redirect_uri]
-                }
-            },
-            scopes=self.scopes
-        )
-        flow.redirect_uri = self.redirect_uri
+        form = {
+            'grant_type': 'authorization_code',
+            'code': authorization_code,
+            'client_id': self.client_id,
+            'client_secret': self.client_secret,
+            'redirect_uri': self.redirect_uri,
+        }
+        if code_verifier:
+            form['code_verifier'] = code_verifier
         try:
-            flow.fetch_token(code=authorization_code)
+            with _waiting_on_google('token'):
+                response = self.http.post(self.endpoints['token_uri'], data=form, timeout=self.timeout)
+            response.raise_for_status()
+            tokens = response.json()
             return {
-                'access_token': flow.credentials.token,
-                'id_token': flow.credentials.id_token,
-                'refresh_token': flow.credentials.refresh_token
+                'access_token': tokens.get('access_token'),
+                'id_token': tokens.get('id_token'),
+                'refresh_token': tokens.get('refresh_token')
             }
         except Exception as e:
             print(f"Error exchanging code for tokens: {e}")
             return None
 
+    def _verify_oauth2_token(self, id_token_str: str) -> Mapping[str, Any]:
+        certs_uri = self.endpoints['certs_uri']
+        try:
+            return id_token.verify_token(id_token_str, self.request, audience=self.client_id, certs_url=certs_uri)
+        except ValueError:
+            # Google may have rotated its keys within the cached max-age; refetch at most
+            # every 30 seconds so a stream of bad tokens cannot turn into a fetch storm.
+            now = time.monotonic()
+            if now - self._last_forced_refresh < 30:
+                raise
+            self._last_forced_refresh = now
+            self.request.invalidate(certs_uri)
+            return id_token.verify_token(id_token_str, self.request, audience=self.client_id, certs_url=certs_uri)
+
     def verify_id_token(self, id_token_str: str) -> Optional[Dict[str, Any]]:
         """Verify Google ID token and extract user information."""
         try:
-            idinfo = id_token.verify_oauth2_token(
-                id_token_str,
-                google_requests.Request(),
-                self.client_id
-            )
+            idinfo = self._verify_oauth2_token(id_token_str)
             valid_issuers_base = ['accounts.google.com', 'https://accounts.google.com']
             if not any(idinfo['iss'].startswith(issuer) for issuer in valid_issuers_base):
                 raise ValueError(f'Wrong issuer. Got: {idinfo["iss"]}')
@@ -94,10 +202,12 @@ class GoogleAuth:
     def get_user_info(self, access_token: str) -> Optional[Dict[str, Any]]:
         """Get user info from Google API."""
         try:
-            response = http_requests.get(
-                'https://www.googleapis.com/oauth2/v2/userinfo',
-                headers={'Authorization': f'Bearer {access_token}'}
-            )
+            with _waiting_on_google('userinfo'):
+                response = self.http.get(
+                    self.endpoints['userinfo_uri'],
+                    headers={'Authorization': f'Bearer {access_token}'},
+                    timeout=self.timeout
+                )
             response.raise_for_status()
             return response.json()
         except Exception as e:
@@ -109,36 +219,34 @@ class VoterSession:
         current_dir = os.path.dirname(os.path.abspath(__file__))
         backend_dir = os.path.dirname(current_dir)
         self.data_dir = os.path.join(backend_dir, 'data')
-        self.sessions_file = os.path.join(self.data_dir, 'voter_sessions.json')
         self.login_log_file = os.path.join(self.data_dir, 'voter_login_log.json')
-        self._load_sessions()
-
-    def _load_sessions(self):
-        """Load existing voter sessions from file."""
-        try:
-            with open(self.sessions_file, 'r') as f:
-                self.sessions = json.load(f)
-        except FileNotFoundError:
-            self.sessions = {}
-        except json.JSONDecodeError as e:
-            print(f"Error decoding voter_sessions.json: {e}. Initializing empty sessions.")
-            self.sessions = {}
-
-    def _save_sessions(self):
-        """Save voter sessions to file."""
-        try:
-            os.makedirs(os.path.dirname(self.sessions_file), exist_ok=True)
-            with open(self.sessions_file, 'w') as f:
-                json.dump(self.sessions, f, indent=2, default=str)
-        except Exception as e:
-            print(f"Error saving voter sessions: {e}")
+        self.store = get_sqlite_store()
+        self.audit_log = None
+        if not self.store:
+            self.audit_log = LoginAuditLog(
+                getattr(Config, 'LOGIN_AUDIT_DIR', os.path.join(self.data_dir, 'login_audit')),
+                max_bytes=getattr(Config, 'LOGIN_AUDIT_MAX_BYTES', 16 * 1024 * 1024),
+                rotate_seconds=getattr(Config, 'LOGIN_AUDIT_ROTATE_SECONDS', 86400),
+                compress=getattr(Config, 'LOGIN_AUDIT_COMPRESS', True),
+                legacy_file=self.login_log_file
+            )
+        default_session_db = SQLITE_DB_PATH if self.store else os.path.join(self.data_dir, 'sessions.db')
+        backend = SQLiteSessionBackend(getattr(Config, 'SESSION_DB_PATH', default_session_db))
+        ttl_seconds = getattr(Config, 'SESSION_TTL_SECONDS', 86400)
+        self.sessions = SessionStore(backend, ttl_seconds=ttl_seconds,
+                                     cache_size=getattr(Config, 'SESSION_CACHE_SIZE', 10000))
+        # SESSION_MODE = 'token': the session id handed out is a signed token that
+        # carries the session itself, so lookups need no storage round trip.
+        self.tokens = None
+        if getattr(Config, 'SESSION_MODE', 'server') == 'token':
+            self.tokens = SessionTokenSigner(getattr(Config, 'SECRET_KEY', None), backend, ttl_seconds=ttl_seconds)
 
     def create_session(self, user_id: str, email: str, name: str,
                        has_voted: bool = False, is_admin: bool = False,
                        is_eligible_voter: bool = True) -> str:
         """Create a new voter session."""
         session_id = str(uuid.uuid4())
-        self.sessions[session_id] = {
+        session_data = {
             'user_id': user_id,
             'email': email,
             'name': name,
@@ -147,51 +255,28 @@ class VoterSession:
             'is_admin': is_admin,
             'is_eligible_voter': is_eligible_voter
         }
-        self._save_sessions()
+        if self.tokens:
+            return self.tokens.issue(session_data)
+        self.sessions.create(session_id, session_data)
         return session_id
 
-    def _load_login_log(self) -> List[Dict[str, Any]]:
-        """Load existing login log data from file."""
-        try:
-            with open(self.login_log_file, 'r') as f:
-                data = json.load(f)
-                if isinstance(data, list):
-                    return data
-                else:
-                    print(f"Warning: {self.login_log_file} does not contain a list. Initializing empty log.")
-                    return []
-        except FileNotFoundError:
-            return []
-        except json.JSONDecodeError as e:
-            print(f"Error decoding {self.login_log_file}: {e}. Initializing empty log.")
-            return []
-
-    def _save_login_log(self, log_data: List[Dict[str, Any]]) -> bool:
-        """Save login log data to file."""
-        try:
-            os.makedirs(os.path.dirname(self.login_log_file), exist_ok=True)
-            with open(self.login_log_file, 'w') as f:
-                json.dump(log_data, f, indent=2, default=str)
-            return True
-        except Exception as e:
-            print(f"Error saving login log to {self.login_log_file}: {e}")
-            return False
-
     def log_login(self, google_user_id: str, email: str, name: str = ""):
         """
         Logs a voter login event with Google ID, email, and timestamp.
         This creates a static record of each login attempt.
         """
         try:
-            log_entries = self._load_login_log()
             new_entry = {
                 "google_id": google_user_id,
                 "email": email,
                 "name": name,
                 "login_timestamp": datetime.datetime.utcnow().isoformat() + 'Z'
             }
-            log_entries.append(new_entry)
-            success = self._save_login_log(log_entries)
+            if self.store:
+                success = self.store.log_login(new_entry)
+            else:
+                # Queued; the audit log's writer thread appends it to the current segment.
+                success = self.audit_log.log(new_entry)
             if success:
                 print(f"Logged login for Google ID: {google_user_id}, Email: {email}")
             else:
@@ -199,19 +284,37 @@ class VoterSession:
         except Exception as e:
             print(f"Error in log_login: {e}")
 
+    def iter_logins(self, email: Optional[str] = None, since: Optional[datetime.datetime] = None,
+                    until: Optional[datetime.datetime] = None) -> Iterator[Dict[str, Any]]:
+        """Stream login records oldest first, filtered by email and/or login time in [since, until)."""
+        if not self.store:
+            yield from self.audit_log.query(email=email, since=since, until=until)
+            return
+        for record in self.store.iter_logins(email):
+            if since or until:
+                logged_at = parse_schedule_time(record['login_timestamp'])
+                if (since and logged_at < since) or (until and logged_at >= until):
+                    continue
+            yield record
+
     def get_session(self, session_id: str) -> Optional[Dict[str, Any]]:
         """Get session by ID."""
+        if self.tokens:
+            return self.tokens.verify(session_id) if session_id else None
         return self.sessions.get(session_id)
 
     def update_session(self, session_id: str, **kwargs):
         """Update session fields."""
-        if session_id in self.sessions:
-            self.sessions[session_id].update(kwargs)
-            self._save_sessions()
+        if self.tokens:
+            # A signed token cannot change in place; a new one has to be issued at login.
+            print(f"Warning: update_session is not supported with SESSION_MODE='token' (fields: {', '.join(kwargs)})")
+            return
+        self.sessions.update(session_id, **kwargs)
 
     def delete_session(self, session_id: str):
         """Delete a session."""
-        if session_id in self.sessions:
-            del self.sessions[session_id]
-            self._save_sessions()
+        if self.tokens:
+            self.tokens.revoke(session_id)
+            return
+        self.sessions.delete(session_id)
 
@@ -0,0 +1,27 @@
+# backend/utils/candidate_cache.py
+import json
+from dataclasses import dataclass
+from typing import Any, Dict, List, Tuple
+from models import Candidate
+from utils.http_cache import PrecompressedBody, build_body
+
+@dataclass(frozen=True)
+class CandidateRoster:
+    """An election's candidates, serialized once.
+
+    `body` is the JSON array the candidates API serves (personal fields included;
+    only admins and eligible voters may read it), ready to send with its ETag. The
+    Candidate objects and `records` are shared between requests and must not be
+    modified.
+    """
+    candidates: Tuple[Candidate, ...]
+    records: Tuple[Dict[str, Any], ...]
+    body: PrecompressedBody
+
+def build_roster(candidates: List[Candidate]) -> CandidateRoster:
+    records = tuple(c.to_dict(include_private=True) for c in candidates)
+    return CandidateRoster(
+        candidates=tuple(candidates),
+        records=records,
+        body=build_body(json.dumps(list(records), ensure_ascii=False, separators=(',', ':')).encode('utf-8'))
+    )
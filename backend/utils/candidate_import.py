@@ -0,0 +1,48 @@
+# backend/utils/candidate_import.py
+import csv
+import io
+import json
+from typing import Any, Dict, List
+
+def _column(header: str) -> str:
+    """'Field of Activity' / 'field-of-activity' -> 'field_of_activity'."""
+    return '_'.join(header.strip().lower().replace('-', ' ').split())
+
+def parse_csv(raw: bytes) -> List[Dict[str, Any]]:
+    """One dict per CSV row, keyed by the normalized header. Empty cells are left out so defaults apply."""
+    try:
+        text = raw.decode('utf-8-sig')
+    except UnicodeDecodeError:
+        raise ValueError("CSV file must be UTF-8 encoded.")
+    reader = csv.reader(io.StringIO(text, newline=''))
+    header = next(reader, None)
+    if not header:
+        raise ValueError("CSV file is empty.")
+    columns = [_column(h) for h in header]
+    rows = []
+    for record in reader:
+        if not any(cell.strip() for cell in record):
+            continue
+        rows.append({column: cell for column, cell in zip(columns, record) if column and cell.strip()})
+    return rows
+
+def parse_json(raw: bytes) -> List[Any]:
+    """A JSON array of candidate objects, or {"candidates": [...]}."""
+    try:
+        data = json.loads(raw.decode('utf-8-sig'))
+    except (UnicodeDecodeError, ValueError) as e:
+        raise ValueError(f"Invalid JSON: {e}")
+    if isinstance(data, dict):
+        data = data.get('candidates')
+    if not isinstance(data, list):
+        raise ValueError("Expected a JSON array of candidates.")
+    return data
+
+def parse_upload(raw: bytes, filename: str = '', content_type: str = '') -> List[Any]:
+    """Rows from an uploaded file, as CSV or JSON depending on its name or content type."""
+    filename, content_type = (filename or '').lower(), (content_type or '').lower()
+    if filename.endswith('.csv') or 'csv' in content_type:
+        return parse_csv(raw)
+    if filename.endswith('.json') or 'json' in content_type:
+        return parse_json(raw)
+    raise ValueError("Upload a .csv or .json file.")
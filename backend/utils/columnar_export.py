@@ -0,0 +1,126 @@
+# backend/utils/columnar_export.py
+import io
+import json
+import sys
+import uuid
+import zipfile
+from array import array
+from typing import Dict, List
+from models import Candidate, ColumnarVotesData, COUNCIL_SLOTS, EXECUTIVE_SLOTS
+
+try:
+    import pyarrow as pa
+    import pyarrow.ipc
+    import pyarrow.parquet
+except ImportError:  # pyarrow is optional; without it only the zip fallback is offered
+    pa = None
+
+FORMATS = {
+    # format: (mimetype, file extension)
+    'parquet': ('application/vnd.apache.parquet', 'parquet'),
+    'arrow': ('application/vnd.apache.arrow.file', 'arrow'),
+    'zip': ('application/zip', 'zip'),
+}
+
+def is_arrow_available() -> bool:
+    return pa is not None
+
+def default_format() -> str:
+    return 'parquet' if pa is not None else 'zip'
+
+def _little_endian(values: array) -> bytes:
+    if sys.byteorder == 'little':
+        return values.tobytes()
+    swapped = array(values.typecode, values)
+    swapped.byteswap()
+    return swapped.tobytes()
+
+def _slot_columns(values: array, slots: int) -> List[array]:
+    """Split row-major fixed-width selections into one array per slot."""
+    return [values[slot::slots] for slot in range(slots)]
+
+def _vote_ids(data: ColumnarVotesData) -> List[str]:
+    irregular = data.irregular_rows()
+    ids = []
+    for row in range(len(data)):
+        record = irregular.get(row)
+        ids.append(str(record.get('id', '')) if record is not None else str(uuid.UUID(bytes=bytes(data.vote_ids[row * 16:(row + 1) * 16]))))
+    return ids
+
+def _metadata(election_id: str, candidates: List[Candidate], data: ColumnarVotesData) -> Dict[str, str]:
+    """Key/value metadata shared by all formats. Irregular ballots (those that did not fit
+    the fixed-width layout) have zeroed selection/timestamp cells and are included verbatim."""
+    return {
+        'phoenix.election_id': election_id,
+        'phoenix.candidates': json.dumps([{'id': c.id, 'name': c.name} for c in candidates]),
+        'phoenix.council_slots': str(COUNCIL_SLOTS),
+        'phoenix.executive_slots': str(EXECUTIVE_SLOTS),
+        'phoenix.empty_slot': '0',
+        'phoenix.irregular_ballots': json.dumps(
+            [{'row': row, 'vote': record} for row, record in sorted(data.irregular_rows().items())], default=str),
+    }
+
+def _arrow_table(election_id: str, data: ColumnarVotesData, candidates: List[Candidate]) -> 'pa.Table':
+    def fixed(values: array, arrow_type) -> 'pa.Array':
+        return pa.Array.from_buffers(arrow_type, len(values), [None, pa.py_buffer(_little_endian(values))])
+
+    # Voter identities are interned in ColumnarVotesData; keep that as dictionary encoding.
+    refs = fixed(data.voter_refs, pa.uint32())
+    columns = {
+        'vote_id': pa.array(_vote_ids(data), type=pa.string()),
+        'voter_id': pa.DictionaryArray.from_arrays(refs, pa.array([v[0] for v in data.voters], type=pa.string())),
+        'voter_name': pa.DictionaryArray.from_arrays(refs, pa.array([v[1] for v in data.voters], type=pa.string())),
+        'voter_email': pa.DictionaryArray.from_arrays(refs, pa.array([v[2] for v in data.voters], type=pa.string())),
+        'timestamp': fixed(data.timestamps, pa.timestamp('us', tz='UTC')),
+    }
+    for slot, values in enumerate(_slot_columns(data.council, COUNCIL_SLOTS), 1):
+        columns[f'council_{slot}'] = fixed(values, pa.uint16())
+    for slot, values in enumerate(_slot_columns(data.executive, EXECUTIVE_SLOTS), 1):
+        columns[f'executive_{slot}'] = fixed(values, pa.uint16())
+    table = pa.table(columns)
+    return table.replace_schema_metadata(_metadata(election_id, candidates, data))
+
+def _zip_export(election_id: str, data: ColumnarVotesData, candidates: List[Candidate]) -> bytes:
+    """Dependency-free fallback: one little-endian binary file per column plus manifest.json.
+
+    Read with e.g. numpy.frombuffer(z.read('council.u16'), '<u2').reshape(-1, 15).
+    """
+    manifest = {
+        'rows': len(data),
+        'columns': {
+            'vote_id': {'file': 'vote_id.txt', 'encoding': 'utf-8, one per line'},
+            'voter_ref': {'file': 'voter_ref.u32', 'dtype': '<u4', 'references': 'voters.jsonl'},
+            'timestamp': {'file': 'timestamp.i64', 'dtype': '<i8', 'unit': 'microseconds since 1970-01-01 UTC'},
+            'council': {'file': 'council.u16', 'dtype': '<u2', 'shape': [len(data), COUNCIL_SLOTS]},
+            'executive': {'file': 'executive.u16', 'dtype': '<u2', 'shape': [len(data), EXECUTIVE_SLOTS]},
+        },
+        'metadata': _metadata(election_id, candidates, data),
+    }
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w', compression=zipfile.ZIP_DEFLATED) as z:
+        z.writestr('manifest.json', json.dumps(manifest, indent=2))
+        z.writestr('vote_id.txt', '\n'.join(_vote_ids(data)) + '\n')
+        z.writestr('voters.jsonl', ''.join(
+            json.dumps({'voter_id': v[0], 'voter_name': v[1], 'voter_email': v[2]}) + '\n' for v in data.voters))
+        z.writestr('voter_ref.u32', _little_endian(data.voter_refs))
+        z.writestr('timestamp.i64', _little_endian(data.timestamps))
+        z.writestr('council.u16', _little_endian(data.council))
+        z.writestr('executive.u16', _little_endian(data.executive))
+    return buffer.getvalue()
+
+def export_ballots(election_id: str, data: ColumnarVotesData, candidates: List[Candidate], export_format: str) -> bytes:
+    """Encode ballots as `export_format` ('parquet', 'arrow' or 'zip')."""
+    if export_format == 'zip':
+        return _zip_export(election_id, data, candidates)
+    if pa is None:
+        raise RuntimeError("pyarrow is not installed")
+    table = _arrow_table(election_id, data, candidates)
+    sink = pa.BufferOutputStream()
+    if export_format == 'parquet':
+        pa.parquet.write_table(table, sink, compression='zstd')
+    elif export_format == 'arrow':
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+    else:
+        raise ValueError(f"unknown export format {export_format!r}")
+    return sink.getvalue().to_pybytes()
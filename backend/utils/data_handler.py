@@ -1,13 +1,53 @@
 # backend/utils/data_handler.py
 import json
 import os
-from typing import List, Any, Dict, Optional, Tuple
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from typing import List, Any, Dict, Optional, Tuple, Iterator, Iterable, Set
+
+try:
+    import fcntl
+except ImportError:  # not available on Windows; fall back to in-process locking only
+    fcntl = None
 from config import Config
-from models import Candidate, Vote, VotesData, ElectionStatus, Election
+from models import Candidate, Vote, VotesData, ColumnarVotesData, ElectionStatus, Election
+from utils.candidate_cache import CandidateRoster, build_roster
+from utils.election_registry import ElectionRegistry
+from utils.json_stream import JSONStreamReader
+from utils.schedule import ElectionSchedule
+from utils.stamped_cache import StampedCache
+from utils.metrics import metrics
 
 DATA_DIR = Config.DATA_FOLDER
 ELECTIONS_FILE = os.path.join(DATA_DIR, 'elections.json')
 
+# 'json' rewrites votes.json on every ballot; 'jsonl' appends each ballot as one
+# fsync'd line to votes.jsonl and treats votes.json as a compacted snapshot.
+VOTE_STORAGE_MODE = getattr(Config, 'VOTE_STORAGE_MODE', 'json')
+VOTES_LOG_FILENAME = 'votes.jsonl'
+VOTED_IDS_FILENAME = 'voted_ids.log'
+
+# 'json' keeps the one-file-per-concern layout under DATA_DIR; 'sqlite' routes every
+# function below through utils.sqlite_store (see migrate_to_sqlite.py for the import).
+STORAGE_BACKEND = getattr(Config, 'STORAGE_BACKEND', 'json')
+SQLITE_DB_PATH = getattr(Config, 'SQLITE_DB_PATH', os.path.join(DATA_DIR, 'phoenix.db'))
+_sqlite_store = None
+_sqlite_store_lock = threading.Lock()
+
+def get_sqlite_store():
+    """Return the shared SQLiteStore when STORAGE_BACKEND is 'sqlite', otherwise None."""
+    global _sqlite_store
+    if STORAGE_BACKEND != 'sqlite':
+        return None
+    if _sqlite_store is None:
+        with _sqlite_store_lock:
+            if _sqlite_store is None:
+                from utils.sqlite_store import SQLiteStore
+                _sqlite_store = SQLiteStore(SQLITE_DB_PATH)
+    return _sqlite_store
+
 def _load_json_file(filepath: str, default_data: Any) -> Any:
     try:
         with open(filepath, 'r') as f:
@@ -20,16 +60,94 @@ def _load_json_file(filepath: str, default_data: Any) -> Any:
         return default_data
 
 def _save_json_file(filepath: str, data: Any) -> bool:
+    """Write `data` to a temp file in the same directory, fsync it, then atomically replace `filepath`.
+
+    Readers see either the old or the new file, never a partial one, even if the
+    process dies mid-write.
+    """
+    tmp_path = None
     try:
-        os.makedirs(os.path.dirname(filepath), exist_ok=True)
-        with open(filepath, 'w') as f:
+        directory = os.path.dirname(filepath)
+        os.makedirs(directory, exist_ok=True)
+        try:
+            mode = os.stat(filepath).st_mode & 0o777
+        except FileNotFoundError:
+            mode = 0o644
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.' + os.path.basename(filepath) + '.', suffix='.tmp')
+        os.fchmod(fd, mode)
+        with os.fdopen(fd, 'w') as f:
             json.dump(data, f, indent=4, default=str)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, filepath)
+        tmp_path = None
         return True
     except Exception as e:
         print(f"Error saving data to {filepath}: {e}")
         return False
+    finally:
+        if tmp_path:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
 
-def get_elections() -> List[Election]:
+# Write serialization. Each election has an in-process RLock plus an fcntl lock on
+# elections/<id>/.lock, so read-modify-write cycles are serialized across threads and
+# gunicorn workers; elections.json uses the same scheme with DATA_DIR/.elections.lock.
+# Nested acquisition by the same thread is allowed and only the outermost level
+# touches the file lock.
+_thread_locks: Dict[str, threading.RLock] = {}
+_thread_locks_guard = threading.Lock()
+_lock_state = threading.local()
+
+def _lock_file_path(election_id: Optional[str]) -> str:
+    if election_id is None:
+        return os.path.join(DATA_DIR, '.elections.lock')
+    return _get_election_file_path(election_id, '.lock')
+
+@contextmanager
+def election_lock(election_id: Optional[str] = None):
+    """Hold the write lock for one election (or for elections.json when election_id is None)."""
+    key = election_id or ''
+    with _thread_locks_guard:
+        thread_lock = _thread_locks.setdefault(key, threading.RLock())
+    held = getattr(_lock_state, 'held', None)
+    if held is None:
+        held = _lock_state.held = {}
+
+    start = time.perf_counter()
+    with thread_lock:
+        lock_file = None
+        if not held.get(key):
+            if fcntl:
+                path = _lock_file_path(election_id)
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                lock_file = open(path, 'a')
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            waited = time.perf_counter() - start
+            metrics.record_timing('storage.lock_wait', waited)
+            metrics.record_timing(f'storage.lock_wait.{election_id or "elections"}', waited)
+        held[key] = held.get(key, 0) + 1
+        try:
+            yield
+        finally:
+            held[key] -= 1
+            if lock_file is not None:
+                lock_file.close()
+
+def lock_metrics(election_id: Optional[str] = None) -> Dict[str, Any]:
+    """Lock wait timings for this process, overall and for `election_id` if given."""
+    timings = metrics.snapshot('storage.lock_wait')['timings']
+    result = {'all': timings.get('storage.lock_wait')}
+    if election_id:
+        result['election'] = timings.get(f'storage.lock_wait.{election_id}')
+    return result
+
+def _load_elections() -> List[Election]:
+    store = get_sqlite_store()
+    if store:
+        return store.get_elections()
     data = _load_json_file(ELECTIONS_FILE, [])
     elections = []
     if isinstance(data, list):
@@ -41,34 +159,92 @@ def get_elections() -> List[Election]:
                     print(f"Warning: Skipping invalid election data: {e}. Data: {item}")
     return elections
 
+def _elections_stamp() -> Any:
+    store = get_sqlite_store()
+    if store:
+        return store.elections_version()
+    try:
+        st = os.stat(ELECTIONS_FILE)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+_election_registry = ElectionRegistry(_load_elections, _elections_stamp)
+
+def get_elections() -> List[Election]:
+    return _election_registry.all()
+
+def get_elections_for_user(user_id: Optional[str], email: Optional[str]) -> List[Election]:
+    """Elections the user administers or may vote in, via the registry's reverse indexes."""
+    return _election_registry.for_user(user_id, email)
+
 def save_elections(elections: List[Election]) -> bool:
-    data_to_save = [e.to_dict() for e in elections]
-    return _save_json_file(ELECTIONS_FILE, data_to_save)
+    store = get_sqlite_store()
+    try:
+        if store:
+            return store.save_elections(elections)
+        data_to_save = [e.to_dict() for e in elections]
+        with election_lock():
+            return _save_json_file(ELECTIONS_FILE, data_to_save)
+    finally:
+        _election_registry.invalidate()
 
 def get_election_by_id(election_id: str) -> Optional[Election]:
-    elections = get_elections()
-    for e in elections:
-        if e.id == election_id:
-            return e
-    return None
+    return _election_registry.get(election_id)
+
+def save_election(election: Election) -> bool:
+    """Insert or update a single election, keeping its position in the list."""
+    store = get_sqlite_store()
+    if store:
+        saved = store.save_election(election)
+        _election_registry.invalidate()
+        return saved
+    with election_lock():
+        elections = get_elections()
+        for i, e in enumerate(elections):
+            if e.id == election.id:
+                elections[i] = election
+                break
+        else:
+            elections.append(election)
+        return save_elections(elections)
+
+def delete_election(election_id: str) -> bool:
+    store = get_sqlite_store()
+    if store:
+        deleted = store.delete_election(election_id)
+        _election_registry.invalidate()
+        _schedule_cache.invalidate(election_id)
+        _candidate_cache.invalidate(election_id)
+        return deleted
+    with election_lock():
+        elections = [e for e in get_elections() if e.id != election_id]
+        saved = save_elections(elections)
+    _schedule_cache.invalidate(election_id)
+    _candidate_cache.invalidate(election_id)
+    return saved
 
 def create_election_data_structure(election_id: str) -> bool:
+    store = get_sqlite_store()
+    if store:
+        return store.create_election_data_structure(election_id)
     try:
-        election_dir = os.path.join(DATA_DIR, 'elections', election_id)
-        os.makedirs(election_dir, exist_ok=True)
+        with election_lock(election_id):
+            election_dir = os.path.join(DATA_DIR, 'elections', election_id)
+            os.makedirs(election_dir, exist_ok=True)
 
-        candidates_file = os.path.join(election_dir, 'candidates.json')
-        if not os.path.exists(candidates_file):
-            _save_json_file(candidates_file, [])
+            candidates_file = os.path.join(election_dir, 'candidates.json')
+            if not os.path.exists(candidates_file):
+                _save_json_file(candidates_file, [])
 
-        votes_file = os.path.join(election_dir, 'votes.json')
-        if not os.path.exists(votes_file):
-            _save_json_file(votes_file, {"voter_ids": [], "votes": []})
+            votes_file = os.path.join(election_dir, 'votes.json')
+            if not os.path.exists(votes_file):
+                _save_json_file(votes_file, {"voter_ids": [], "votes": []})
 
-        status_file = os.path.join(election_dir, 'election_status.json')
-        if not os.path.exists(status_file):
-            default_status = ElectionStatus(is_open=False, start_time=None, end_time=None)
-            _save_json_file(status_file, default_status.to_dict())
+            status_file = os.path.join(election_dir, 'election_status.json')
+            if not os.path.exists(status_file):
+                default_status = ElectionStatus(is_open=False, start_time=None, end_time=None)
+                _save_json_file(status_file, default_status.to_dict())
 
         return True
     except Exception as e:
@@ -79,6 +255,9 @@ def _get_election_file_path(election_id: str, filename: str) -> str:
     return os.path.join(DATA_DIR, 'elections', election_id, filename)
 
 def get_candidates(election_id: str, include_private: bool = False) -> List[Candidate]:
+    store = get_sqlite_store()
+    if store:
+        return store.get_candidates(election_id)
     CANDIDATES_FILE_FOR_ELECTION = _get_election_file_path(election_id, 'candidates.json')
     data = _load_json_file(CANDIDATES_FILE_FOR_ELECTION, [])
     if not isinstance(data, list):
@@ -93,36 +272,432 @@ def get_candidates(election_id: str, include_private: bool = False) -> List[Cand
                 print(f"Warning: Skipping candidate item for election {election_id} due to error: {e}. Data: {item}")
     return candidates
 
-def get_votes(election_id: str) -> VotesData:
+def _candidates_stamp(election_id: str) -> Any:
+    store = get_sqlite_store()
+    if store:
+        return store.candidates_version(election_id)
+    return _file_stamp(_get_election_file_path(election_id, 'candidates.json'))
+
+_candidate_cache: StampedCache[CandidateRoster] = StampedCache(
+    lambda election_id: build_roster(get_candidates(election_id, include_private=True)), _candidates_stamp)
+
+def get_candidate_roster(election_id: str) -> CandidateRoster:
+    """The election's candidates with their serialized JSON, from an in-process cache (see StampedCache)."""
+    return _candidate_cache.get(election_id)
+
+def _votes_from_dicts(items: Iterator[Any], election_id: str) -> List[Vote]:
+    votes = []
+    for vote_data in items:
+        if isinstance(vote_data, dict):
+            try:
+                votes.append(Vote(**vote_data))
+            except TypeError as e:
+                print(f"Warning: Skipping invalid vote data for election {election_id} due to TypeError: {e}. Data: {vote_data}")
+            except Exception as e:
+                print(f"Warning: Skipping invalid vote data for election {election_id} due to unexpected error: {e}. Data: {vote_data}")
+    return votes
+
+def _load_votes_snapshot(election_id: str) -> Optional[Dict[str, Any]]:
     VOTES_FILE_FOR_ELECTION = _get_election_file_path(election_id, 'votes.json')
     data = _load_json_file(VOTES_FILE_FOR_ELECTION, {"voter_ids": [], "votes": []})
     if isinstance(data, dict) and 'votes' in data and 'voter_ids' in data:
-        votes = []
-        for vote_data in data.get('votes', []):
-            if isinstance(vote_data, dict):
+        return data
+    print(f"Warning: Votes data for election {election_id} has unexpected structure. Returning empty VotesData.")
+    return None
+
+def _iter_votes_snapshot(election_id: str) -> Iterator[Dict[str, Any]]:
+    """Stream the ballot dicts of votes.json without loading the whole file."""
+    VOTES_FILE_FOR_ELECTION = _get_election_file_path(election_id, 'votes.json')
+    try:
+        with open(VOTES_FILE_FOR_ELECTION, 'r', encoding='utf-8') as f:
+            reader = JSONStreamReader(f)
+            for key in reader.object_keys():
+                if reader.peek() != '[':
+                    reader.value()
+                    continue
+                for item in reader.array_items():
+                    if key == 'votes' and isinstance(item, dict):
+                        yield item
+    except FileNotFoundError:
+        return
+    except ValueError as e:
+        print(f"Warning: Stopped reading votes for election {election_id}; votes.json is malformed: {e}")
+
+def _iter_vote_log(election_id: str, offset: int = 0) -> Iterator[Tuple[Dict[str, Any], int]]:
+    """Stream (vote_dict, end_offset) records from the election's votes.jsonl.
+
+    A trailing line without a newline is a write still in progress (or torn by a
+    crash) and is not yielded, so the returned offsets always land on a record boundary.
+    """
+    log_path = _get_election_file_path(election_id, VOTES_LOG_FILENAME)
+    try:
+        with open(log_path, 'rb') as f:
+            f.seek(offset)
+            for line in f:
+                if not line.endswith(b'\n'):
+                    break
+                offset += len(line)
                 try:
-                    votes.append(Vote(**vote_data))
-                except TypeError as e:
-                    print(f"Warning: Skipping invalid vote data for election {election_id} due to TypeError: {e}. Data: {vote_data}")
-                except Exception as e:
-                    print(f"Warning: Skipping invalid vote data for election {election_id} due to unexpected error: {e}. Data: {vote_data}")
-        return VotesData(voter_ids=data['voter_ids'], votes=votes)
-    else:
-        print(f"Warning: Votes data for election {election_id} has unexpected structure. Returning empty VotesData.")
-        return VotesData(voter_ids=[], votes=[])
+                    record = json.loads(line)
+                except json.JSONDecodeError as e:
+                    print(f"Warning: Skipping corrupt vote log record for election {election_id}: {e}")
+                    continue
+                if isinstance(record, dict):
+                    yield record, offset
+    except FileNotFoundError:
+        return
 
-def save_votes(votes_data: VotesData, election_id: str) -> bool:
-    if not isinstance(votes_data, VotesData):
-        print("Error: save_votes called with non-VotesData object")
+class _VoterIdIndex:
+    """The "has voted" index for one election: an in-memory set backed by voted_ids.log.
+
+    The log is append-only: '+<voter id>' reserves a voter and '-<voter id>' releases a
+    reservation whose ballot could not be stored. It is seeded once from the existing
+    ballots (a streaming scan of votes.json and votes.jsonl); after that only the bytes
+    appended since the last read are scanned, so reservations made by other worker
+    processes are seen without rereading the file. Reservations hold an exclusive
+    flock on the log, which makes check-and-reserve atomic across processes. The
+    header carries a random generation tag that changes when save_votes rewrites the
+    file, telling other processes to rebuild.
+    """
+    HEADER_PREFIX = b'#voted-ids '
+
+    def __init__(self, election_id: str):
+        self.election_id = election_id
+        self.path = _get_election_file_path(election_id, VOTED_IDS_FILENAME)
+        self.lock = threading.Lock()
+        self.header = b''
+        self.voter_ids: Set[str] = set()
+        self.log_offset = 0
+
+    def _scan_existing_ballots(self) -> Set[str]:
+        voter_ids = set()
+        snapshot = _load_votes_snapshot(self.election_id)
+        if snapshot:
+            voter_ids.update(snapshot['voter_ids'])
+        if VOTE_STORAGE_MODE == 'jsonl':
+            for record, _ in _iter_vote_log(self.election_id):
+                if record.get('voter_id'):
+                    voter_ids.add(record['voter_id'])
+        return voter_ids
+
+    @staticmethod
+    def _record(op: bytes, voter_id: str) -> bytes:
+        return op + json.dumps(voter_id).encode('utf-8') + b'\n'
+
+    def _write_all(self, f, voter_ids: Iterable[str]) -> None:
+        f.seek(0)
+        f.truncate()
+        f.write(self.HEADER_PREFIX + os.urandom(8).hex().encode('ascii') + b'\n')
+        f.write(b''.join(self._record(b'+', v) for v in voter_ids))
+        f.flush()
+        os.fsync(f.fileno())
+
+    def _open_locked(self):
+        """Open the log with an exclusive flock held, seeding it first if it is new."""
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        f = open(self.path, 'a+b')
+        if fcntl:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        f.seek(0)
+        if not f.readline().startswith(self.HEADER_PREFIX):
+            self._write_all(f, self._scan_existing_ballots())
+        return f
+
+    def _refresh(self) -> None:
+        try:
+            f = open(self.path, 'rb')
+        except FileNotFoundError:
+            with self._open_locked():
+                pass
+            f = open(self.path, 'rb')
+        with f:
+            header = f.readline()
+            if not header.endswith(b'\n') or not header.startswith(self.HEADER_PREFIX):
+                return  # being seeded by another process; it holds the lock
+            if header != self.header:
+                self.header = header
+                self.voter_ids = set()
+                self.log_offset = len(header)
+            f.seek(self.log_offset)
+            for line in f:
+                if not line.endswith(b'\n'):
+                    break
+                self.log_offset += len(line)
+                if line[:1] == b'+':
+                    self.voter_ids.add(json.loads(line[1:]))
+                elif line[:1] == b'-':
+                    self.voter_ids.discard(json.loads(line[1:]))
+
+    def contains(self, voter_id: str) -> bool:
+        with self.lock:
+            self._refresh()
+            return voter_id in self.voter_ids
+
+    def _append_if(self, op: bytes, voter_id: str, present: bool) -> bool:
+        """Append `op voter_id` if the voter's current membership equals `present`."""
+        with self.lock, self._open_locked() as f:
+            self._refresh()
+            if (voter_id in self.voter_ids) != present:
+                return False
+            f.write(self._record(op, voter_id))
+            f.flush()
+            os.fsync(f.fileno())
+            self._refresh()
+            return True
+
+    def reserve(self, voter_id: str) -> bool:
+        return self._append_if(b'+', voter_id, present=False)
+
+    def release(self, voter_id: str) -> None:
+        self._append_if(b'-', voter_id, present=True)
+
+    def rewrite(self, voter_ids: Iterable[str]) -> None:
+        with self.lock, self._open_locked() as f:
+            self._write_all(f, voter_ids)
+            self._refresh()
+
+_voter_id_indexes: Dict[str, _VoterIdIndex] = {}
+_voter_id_indexes_lock = threading.Lock()
+
+def _get_voter_id_index(election_id: str) -> _VoterIdIndex:
+    with _voter_id_indexes_lock:
+        index = _voter_id_indexes.get(election_id)
+        if index is None:
+            index = _VoterIdIndex(election_id)
+            _voter_id_indexes[election_id] = index
+    return index
+
+def warm_vote_indexes() -> None:
+    """Load (seeding where needed) the "has voted" sets for every election (called at startup)."""
+    if get_sqlite_store():
+        return
+    for election in get_elections():
+        _get_voter_id_index(election.id).contains('')
+
+def has_voter_voted(election_id: str, voter_id: str) -> bool:
+    store = get_sqlite_store()
+    if store:
+        return store.has_voter_voted(election_id, voter_id)
+    return _get_voter_id_index(election_id).contains(voter_id)
+
+def reserve_voter(election_id: str, voter_id: str) -> bool:
+    """Atomically mark `voter_id` as having voted. Returns False if they already had.
+
+    Call before storing the ballot; if storing fails, undo with release_voter().
+    """
+    store = get_sqlite_store()
+    if store:
+        return store.reserve_voter(election_id, voter_id)
+    try:
+        return _get_voter_id_index(election_id).reserve(voter_id)
+    except OSError as e:
+        print(f"Error reserving voter {voter_id} in election {election_id}: {e}")
         return False
+
+def release_voter(election_id: str, voter_id: str) -> None:
+    store = get_sqlite_store()
+    if store:
+        store.release_voter(election_id, voter_id)
+        return
+    try:
+        _get_voter_id_index(election_id).release(voter_id)
+    except OSError as e:
+        print(f"Error releasing voter {voter_id} in election {election_id}: {e}")
+
+def get_votes(election_id: str) -> VotesData:
+    store = get_sqlite_store()
+    if store:
+        return store.get_votes(election_id)
+    snapshot = _load_votes_snapshot(election_id)
+    if snapshot is None:
+        return VotesData(voter_ids=[], votes=[])
+    votes = _votes_from_dicts(snapshot.get('votes', []), election_id)
+    voter_ids = list(snapshot['voter_ids'])
+    if VOTE_STORAGE_MODE == 'jsonl':
+        for record, _ in _iter_vote_log(election_id):
+            log_votes = _votes_from_dicts([record], election_id)
+            if log_votes:
+                votes.extend(log_votes)
+                voter_ids.append(log_votes[0].voter_id)
+    return VotesData(voter_ids=voter_ids, votes=votes)
+
+def iter_vote_records(election_id: str) -> Iterator[Dict[str, Any]]:
+    """Yield raw ballot dicts in storage order without building Vote objects."""
+    store = get_sqlite_store()
+    if store:
+        yield from store.iter_vote_records(election_id)
+        return
+    yield from _iter_votes_snapshot(election_id)
+    if VOTE_STORAGE_MODE == 'jsonl':
+        for record, _ in _iter_vote_log(election_id):
+            yield record
+
+def get_votes_columnar(election_id: str) -> ColumnarVotesData:
+    """Like get_votes, but array-backed; Vote objects are only built when iterated."""
+    return ColumnarVotesData.from_records(iter_vote_records(election_id))
+
+def _write_votes_snapshot(votes_data: VotesData, election_id: str) -> bool:
+    """Write votes.json (emptying votes.jsonl in 'jsonl' mode). Caller holds election_lock."""
     VOTES_FILE_FOR_ELECTION = _get_election_file_path(election_id, 'votes.json')
     data_to_save = {
         "voter_ids": votes_data.voter_ids,
         "votes": [vote.to_dict() for vote in votes_data.votes]
     }
-    return _save_json_file(VOTES_FILE_FOR_ELECTION, data_to_save)
+    if not _save_json_file(VOTES_FILE_FOR_ELECTION, data_to_save):
+        return False
+    if VOTE_STORAGE_MODE == 'jsonl':
+        # Full saves compact the log into the snapshot.
+        try:
+            open(_get_election_file_path(election_id, VOTES_LOG_FILENAME), 'w').close()
+        except Exception as e:
+            print(f"Error truncating vote log for election {election_id}: {e}")
+            return False
+    return True
+
+def save_votes(votes_data: VotesData, election_id: str) -> bool:
+    """Replace an election's ballots wholesale, rebuilding the "has voted" index from them.
+
+    Outstanding reservations (ballots reserved but not yet stored) are dropped, so this
+    is for compaction and administrative rewrites, not for storing new ballots.
+    """
+    if not isinstance(votes_data, VotesData):
+        print("Error: save_votes called with non-VotesData object")
+        return False
+    store = get_sqlite_store()
+    if store:
+        return store.save_votes(votes_data, election_id)
+    with election_lock(election_id):
+        if not _write_votes_snapshot(votes_data, election_id):
+            return False
+        try:
+            _get_voter_id_index(election_id).rewrite(votes_data.voter_ids)
+        except OSError as e:
+            print(f"Error rewriting voted ids for election {election_id}: {e}")
+        return True
+
+def append_votes(votes: List[Vote], election_id: str) -> List[bool]:
+    """Persist a batch of ballots with a single durable write; returns a success flag per ballot.
+
+    This is the group-commit path used by the vote ingestion queue: one votes.json
+    rewrite, one fsync'd votes.jsonl append or one SQLite transaction per batch.
+    """
+    if not votes:
+        return []
+    store = get_sqlite_store()
+    if store:
+        return store.append_votes(votes, election_id)
+    with election_lock(election_id):
+        if VOTE_STORAGE_MODE != 'jsonl':
+            votes_data = get_votes(election_id)
+            for vote in votes:
+                votes_data.voter_ids.append(vote.voter_id)
+                votes_data.votes.append(vote)
+            return [_write_votes_snapshot(votes_data, election_id)] * len(votes)
+        log_path = _get_election_file_path(election_id, VOTES_LOG_FILENAME)
+        data = b''.join((json.dumps(vote.to_dict(), default=str) + '\n').encode('utf-8') for vote in votes)
+        try:
+            os.makedirs(os.path.dirname(log_path), exist_ok=True)
+            fd = os.open(log_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            try:
+                view = memoryview(data)
+                while view:
+                    view = view[os.write(fd, view):]
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+        except Exception as e:
+            print(f"Error appending votes to {log_path}: {e}")
+            return [False] * len(votes)
+        return [True] * len(votes)
+
+def _file_stamp(filepath: str) -> Optional[List[int]]:
+    try:
+        st = os.stat(filepath)
+    except OSError:
+        return None
+    return [st.st_mtime_ns, st.st_size]
+
+def supports_incremental_vote_reads() -> bool:
+    """True when read_votes_since reads only the new ballots rather than reparsing votes.json."""
+    return get_sqlite_store() is not None or VOTE_STORAGE_MODE == 'jsonl'
+
+def read_votes_since(election_id: str, cursor: Optional[Dict[str, Any]]) -> Tuple[List[Vote], Dict[str, Any], bool]:
+    """Return ballots stored after `cursor`, a new cursor, and whether the list is a full reload.
+
+    Cursors are small JSON-serializable dicts (safe to checkpoint). When the cursor can
+    no longer be honoured -- the snapshot was rewritten by save_votes, or it came from a
+    different backend -- every ballot is returned and the third value is True, so the
+    caller must discard whatever it derived from earlier reads.
+    """
+    cursor = cursor or {}
+    store = get_sqlite_store()
+    if store:
+        epoch = store.votes_epoch(election_id)
+        seq = cursor.get('seq', 0) if cursor.get('backend') == 'sqlite' and cursor.get('epoch') == epoch else 0
+        votes, last_seq = store.get_votes_after(election_id, seq)
+        return votes, {'backend': 'sqlite', 'epoch': epoch, 'seq': last_seq}, seq == 0
+
+    if VOTE_STORAGE_MODE == 'jsonl':
+        snapshot_stamp = _file_stamp(_get_election_file_path(election_id, 'votes.json'))
+        log_path = _get_election_file_path(election_id, VOTES_LOG_FILENAME)
+        offset = cursor.get('offset', 0)
+        full = (cursor.get('backend') != 'jsonl' or cursor.get('snapshot') != snapshot_stamp
+                or (os.path.getsize(log_path) if os.path.exists(log_path) else 0) < offset)
+        votes = []
+        if full:
+            snapshot = _load_votes_snapshot(election_id)
+            votes = _votes_from_dicts(snapshot.get('votes', []), election_id) if snapshot else []
+            offset = 0
+        for record, end_offset in _iter_vote_log(election_id, offset):
+            votes.extend(_votes_from_dicts([record], election_id))
+            offset = end_offset
+        return votes, {'backend': 'jsonl', 'snapshot': snapshot_stamp, 'offset': offset}, full
+
+    # Plain votes.json: reparse only when the file has changed since the cursor was taken.
+    stamp = _file_stamp(_get_election_file_path(election_id, 'votes.json'))
+    if cursor.get('backend') == 'json' and stamp is not None and cursor.get('stamp') == stamp:
+        return [], cursor, False
+    votes = get_votes(election_id).votes
+    count = cursor.get('count', 0)
+    full = cursor.get('backend') != 'json' or count > len(votes)
+    return (votes if full else votes[count:]), {'backend': 'json', 'count': len(votes), 'stamp': stamp}, full
+
+def load_tally_checkpoint(election_id: str) -> Optional[Dict[str, Any]]:
+    store = get_sqlite_store()
+    if store:
+        return store.load_tally_checkpoint(election_id)
+    checkpoint_file = _get_election_file_path(election_id, 'tally_checkpoint.json')
+    if not os.path.exists(checkpoint_file):
+        return None
+    data = _load_json_file(checkpoint_file, None)
+    return data if isinstance(data, dict) else None
+
+def save_tally_checkpoint(election_id: str, checkpoint: Dict[str, Any]) -> bool:
+    store = get_sqlite_store()
+    if store:
+        return store.save_tally_checkpoint(election_id, checkpoint)
+    return _save_json_file(_get_election_file_path(election_id, 'tally_checkpoint.json'), checkpoint)
+
+def load_results_snapshot(election_id: str) -> Optional[Dict[str, Any]]:
+    store = get_sqlite_store()
+    if store:
+        return store.load_results_snapshot(election_id)
+    snapshot_file = _get_election_file_path(election_id, 'results_snapshot.json')
+    if not os.path.exists(snapshot_file):
+        return None
+    data = _load_json_file(snapshot_file, None)
+    return data if isinstance(data, dict) else None
+
+def save_results_snapshot(election_id: str, snapshot: Dict[str, Any]) -> bool:
+    store = get_sqlite_store()
+    if store:
+        return store.save_results_snapshot(election_id, snapshot)
+    return _save_json_file(_get_election_file_path(election_id, 'results_snapshot.json'), snapshot)
 
 def get_election_status(election_id: str) -> ElectionStatus:
+    store = get_sqlite_store()
+    if store:
+        return store.get_election_status(election_id)
     ELECTION_STATUS_FILE_FOR_ELECTION = _get_election_file_path(election_id, 'election_status.json')
     data = _load_json_file(ELECTION_STATUS_FILE_FOR_ELECTION, {"is_open": False})
     if isinstance(data, dict):
@@ -139,88 +714,188 @@ def save_election_status(status: ElectionStatus, election_id: str) -> bool:
     if not isinstance(status, ElectionStatus):
         print("ERROR: save_election_status called with non-ElectionStatus object")
         return False
-    ELECTION_STATUS_FILE_FOR_ELECTION = _get_election_file_path(election_id, 'election_status.json')
-    return _save_json_file(ELECTION_STATUS_FILE_FOR_ELECTION, status.to_dict())
+    store = get_sqlite_store()
+    try:
+        if store:
+            return store.save_election_status(status, election_id)
+        ELECTION_STATUS_FILE_FOR_ELECTION = _get_election_file_path(election_id, 'election_status.json')
+        with election_lock(election_id):
+            return _save_json_file(ELECTION_STATUS_FILE_FOR_ELECTION, status.to_dict())
+    finally:
+        _schedule_cache.invalidate(election_id)
+
+def _election_status_stamp(election_id: str) -> Any:
+    store = get_sqlite_store()
+    if store:
+        return store.status_version(election_id)
+    return _file_stamp(_get_election_file_path(election_id, 'election_status.json'))
+
+_schedule_cache: StampedCache[ElectionSchedule] = StampedCache(
+    lambda election_id: ElectionSchedule(get_election_status(election_id)), _election_status_stamp)
+
+def get_election_schedule(election_id: str) -> ElectionSchedule:
+    """The election's parsed schedule, from an in-process cache (see StampedCache)."""
+    return _schedule_cache.get(election_id)
+
+_CANDIDATE_TEXT_FIELDS = {
+    "name": "", "photo": "/images/default.jpg", "bio": "", "biography": "", "field_of_activity": "",
+    "full_name": "", "email": "", "phone": "", "place_of_birth": "", "residence": "",
+    "date_of_birth": "", "work": "", "education": "", "facebook_url": "",
+}
+
+def _build_candidate(new_id: int, new_candidate_data: Dict) -> Tuple[Optional[Candidate], str]:
+    candidate_obj_data: Dict[str, Any] = {"id": new_id}
+    for field, default in _CANDIDATE_TEXT_FIELDS.items():
+        value = new_candidate_data.get(field)
+        if value is None:
+            value = default
+        if not isinstance(value, str):
+            return None, f"Candidate {field} must be text."
+        candidate_obj_data[field] = value.strip()
+    activity = new_candidate_data.get("activity")
+    if activity is None or activity == "":
+        activity = 0
+    try:
+        if isinstance(activity, bool) or (isinstance(activity, float) and not activity.is_integer()):
+            raise ValueError(activity)
+        candidate_obj_data["activity"] = int(activity.strip() if isinstance(activity, str) else activity)
+    except (TypeError, ValueError):
+        return None, "Candidate activity must be a whole number."
+
+    if not candidate_obj_data["name"]:
+         return None, "Candidate name is required."
+    if not candidate_obj_data["bio"]:
+         return None, "Candidate bio is required."
+
+    try:
+        new_candidate = Candidate(**candidate_obj_data)
+    except Exception as e:
+         return None, f"Invalid candidate data: {e}"
+    return new_candidate, f"Candidate '{candidate_obj_data['name']}' added successfully with ID {new_id}."
 
 def add_candidate(new_candidate_data: Dict, election_id: str) -> Tuple[bool, str]:
     try:
-        CANDIDATES_FILE_FOR_ELECTION = _get_election_file_path(election_id, 'candidates.json')
-        candidates_list = get_candidates(election_id, include_private=True)
-        if candidates_list:
-            new_id = max(candidate.id for candidate in candidates_list) + 1
-        else:
-            new_id = 1
-
-        candidate_obj_data = {
-            "id": new_id,
-            "name": new_candidate_data.get("name", "").strip(),
-            "photo": new_candidate_data.get("photo", "/images/default.jpg").strip(),
-            "bio": new_candidate_data.get("bio", "").strip(),
-            "biography": new_candidate_data.get("biography", "").strip(),
-            "field_of_activity": new_candidate_data.get("field_of_activity", "").strip(),
-            "activity": int(new_candidate_data.get("activity", 0)),
-            "full_name": new_candidate_data.get("full_name", "").strip(),
-            "email": new_candidate_data.get("email", "").strip(),
-            "phone": new_candidate_data.get("phone", "").strip(),
-            "place_of_birth": new_candidate_data.get("place_of_birth", "").strip(),
-            "residence": new_candidate_data.get("residence", "").strip(),
-            "date_of_birth": new_candidate_data.get("date_of_birth", "").strip(),
-            "work": new_candidate_data.get("work", "").strip(),
-            "education": new_candidate_data.get("education", "").strip(),
-            "facebook_url": new_candidate_data.get("facebook_url", "").strip(),
-        }
-
-        if not candidate_obj_data["name"]:
-             return False, "Candidate name is required."
-        if not candidate_obj_data["bio"]:
-             return False, "Candidate bio is required."
+        store = get_sqlite_store()
+        if store:
+            return store.add_candidate(election_id, lambda new_id: _build_candidate(new_id, new_candidate_data))
+        with election_lock(election_id):
+            CANDIDATES_FILE_FOR_ELECTION = _get_election_file_path(election_id, 'candidates.json')
+            candidates_list = get_candidates(election_id, include_private=True)
+            if candidates_list:
+                new_id = max(candidate.id for candidate in candidates_list) + 1
+            else:
+                new_id = 1
 
-        try:
-            new_candidate = Candidate(**candidate_obj_data)
-        except Exception as e:
-             return False, f"Invalid candidate data: {e}"
+            new_candidate, message = _build_candidate(new_id, new_candidate_data)
+            if new_candidate is None:
+                return False, message
 
-        candidates_list.append(new_candidate)
-        candidates_dicts = [c.to_dict(include_private=True) for c in candidates_list]
-        if _save_json_file(CANDIDATES_FILE_FOR_ELECTION, candidates_dicts):
-            return True, f"Candidate '{candidate_obj_data['name']}' added successfully with ID {new_id}."
-        else:
-            return False, "Failed to save candidate data to file."
+            candidates_list.append(new_candidate)
+            candidates_dicts = [c.to_dict(include_private=True) for c in candidates_list]
+            if _save_json_file(CANDIDATES_FILE_FOR_ELECTION, candidates_dicts):
+                return True, message
+            else:
+                return False, "Failed to save candidate data to file."
     except Exception as e:
         print(f"Error adding candidate to election {election_id}: {e}")
         return False, f"Failed to add candidate: {str(e)}"
+    finally:
+        _candidate_cache.invalidate(election_id)
 
 def remove_candidate(candidate_id: int, election_id: str) -> Tuple[bool, str]:
     try:
-        CANDIDATES_FILE_FOR_ELECTION = _get_election_file_path(election_id, 'candidates.json')
-        candidates_list = get_candidates(election_id, include_private=True)
-        original_count = len(candidates_list)
-        candidates_list = [c for c in candidates_list if c.id != candidate_id]
+        store = get_sqlite_store()
+        if store:
+            return store.remove_candidate(candidate_id, election_id)
+        with election_lock(election_id):
+            CANDIDATES_FILE_FOR_ELECTION = _get_election_file_path(election_id, 'candidates.json')
+            candidates_list = get_candidates(election_id, include_private=True)
+            original_count = len(candidates_list)
+            candidates_list = [c for c in candidates_list if c.id != candidate_id]
 
-        if len(candidates_list) < original_count:
-            candidates_dicts = [c.to_dict() for c in candidates_list]
-            if _save_json_file(CANDIDATES_FILE_FOR_ELECTION, candidates_dicts):
-                 return True, f"Candidate with ID {candidate_id} removed successfully."
+            if len(candidates_list) < original_count:
+                candidates_dicts = [c.to_dict(include_private=True) for c in candidates_list]
+                if _save_json_file(CANDIDATES_FILE_FOR_ELECTION, candidates_dicts):
+                     return True, f"Candidate with ID {candidate_id} removed successfully."
+                else:
+                     return False, "Failed to save updated candidate list to file."
             else:
-                 return False, "Failed to save updated candidate list to file."
-        else:
-            return False, f"Candidate with ID {candidate_id} not found."
+                return False, f"Candidate with ID {candidate_id} not found."
     except Exception as e:
         print(f"Error removing candidate {candidate_id} from election {election_id}: {e}")
         return False, f"Failed to remove candidate: {str(e)}"
+    finally:
+        _candidate_cache.invalidate(election_id)
+
+def _build_candidates(first_id: int, rows: List[Any]) -> Tuple[List[Candidate], List[Dict[str, Any]]]:
+    """Validate every row, numbering the valid ones consecutively from `first_id`.
+    Errors are {"row": 1-based position, "message": ...}."""
+    candidates, errors = [], []
+    for row_number, row in enumerate(rows, start=1):
+        if not isinstance(row, dict):
+            errors.append({"row": row_number, "message": "Expected an object of candidate fields."})
+            continue
+        candidate, message = _build_candidate(first_id + len(candidates), row)
+        if candidate is None:
+            errors.append({"row": row_number, "message": message})
+        else:
+            candidates.append(candidate)
+    return candidates, errors
 
-TRANSLATIONS_FILE = os.path.join(DATA_DIR, 'translations.json')
+def add_candidates(rows: List[Any], election_id: str) -> Tuple[bool, str, List[Candidate], List[Dict[str, Any]]]:
+    """Add many candidates with one write. All rows are validated first; if any is invalid,
+    nothing is added and every row error is returned. Returns (success, message, added, errors)."""
+    if not rows:
+        return False, "No candidates to add.", [], []
+    try:
+        store = get_sqlite_store()
+        if store:
+            stored, candidates, errors = store.add_candidates(election_id, lambda first_id: _build_candidates(first_id, rows))
+        else:
+            with election_lock(election_id):
+                CANDIDATES_FILE_FOR_ELECTION = _get_election_file_path(election_id, 'candidates.json')
+                candidates_list = get_candidates(election_id, include_private=True)
+                first_id = max((c.id for c in candidates_list), default=0) + 1
+                candidates, errors = _build_candidates(first_id, rows)
+                stored = False
+                if not errors:
+                    candidates_dicts = [c.to_dict(include_private=True) for c in candidates_list + candidates]
+                    stored = _save_json_file(CANDIDATES_FILE_FOR_ELECTION, candidates_dicts)
+        if errors:
+            return False, f"{len(errors)} of {len(rows)} rows are invalid; no candidates were added.", [], errors
+        if not stored:
+            return False, "Failed to save candidate data.", [], []
+        return True, f"{len(candidates)} candidates added.", candidates, []
+    except Exception as e:
+        print(f"Error adding candidates to election {election_id}: {e}")
+        return False, f"Failed to add candidates: {str(e)}", [], []
+    finally:
+        _candidate_cache.invalidate(election_id)
 
-def load_translations():
+def remove_candidates(candidate_ids: Iterable[int], election_id: str) -> Tuple[bool, str, List[int], List[int]]:
+    """Remove many candidates with one write. Returns (success, message, removed ids, ids not found)."""
+    wanted = list(dict.fromkeys(candidate_ids))
     try:
-        with open(TRANSLATIONS_FILE, 'r', encoding='utf-8') as f:
-            return json.load(f)
-    except FileNotFoundError:
-        print(f"Translation file not found: {TRANSLATIONS_FILE}")
-        return {}
-    except json.JSONDecodeError as e:
-        print(f"Error decoding JSON from {TRANSLATIONS_FILE}: {e}")
-        return {}
+        store = get_sqlite_store()
+        if store:
+            removed = store.remove_candidates(wanted, election_id)
+            if removed is None:
+                return False, "Failed to remove candidates.", [], []
+        else:
+            with election_lock(election_id):
+                CANDIDATES_FILE_FOR_ELECTION = _get_election_file_path(election_id, 'candidates.json')
+                candidates_list = get_candidates(election_id, include_private=True)
+                wanted_set = set(wanted)
+                removed = [c.id for c in candidates_list if c.id in wanted_set]
+                if removed:
+                    candidates_dicts = [c.to_dict(include_private=True) for c in candidates_list if c.id not in wanted_set]
+                    if not _save_json_file(CANDIDATES_FILE_FOR_ELECTION, candidates_dicts):
+                        return False, "Failed to save updated candidate list to file.", [], []
+        removed_set = set(removed)
+        missing = [candidate_id for candidate_id in wanted if candidate_id not in removed_set]
+        return bool(removed), f"{len(removed)} candidates removed.", removed, missing
     except Exception as e:
-        print(f"Unexpected error loading translations from {TRANSLATIONS_FILE}: {e}")
-        return {}
+        print(f"Error removing candidates from election {election_id}: {e}")
+        return False, f"Failed to remove candidates: {str(e)}", [], []
+    finally:
+        _candidate_cache.invalidate(election_id)
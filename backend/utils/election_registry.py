@@ -0,0 +1,67 @@
+# backend/utils/election_registry.py
+import copy
+import threading
+from typing import List, Dict, Optional, Set, Callable, Any, NamedTuple
+from models import Election, normalize_email, normalize_user_id
+
+class _Snapshot(NamedTuple):
+    by_id: Dict[str, Election]
+    order: Dict[str, int]
+    ids_by_email: Dict[str, Set[str]]
+    ids_by_admin: Dict[str, Set[str]]
+
+class ElectionRegistry:
+    """In-process cache of all elections, keyed by id.
+
+    `loader` returns the full election list from storage and `stamp` returns a cheap
+    token (file mtime, database counter) that changes whenever that list does. The
+    cache is rebuilt when the token moves or after `invalidate()`, and keeps reverse
+    indexes from voter email and admin user id to election ids so per-user lookups
+    never scan every election.
+    """
+    def __init__(self, loader: Callable[[], List[Election]], stamp: Callable[[], Any]):
+        self._loader = loader
+        self._stamp = stamp
+        self._lock = threading.Lock()
+        self._loaded_stamp = None
+        self._valid = False
+        self._snapshot = _Snapshot({}, {}, {}, {})
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._valid = False
+
+    def _refresh(self) -> '_Snapshot':
+        stamp = self._stamp()
+        with self._lock:
+            if self._valid and stamp == self._loaded_stamp:
+                return self._snapshot
+            elections = self._loader()
+            by_id, order, by_email, by_admin = {}, {}, {}, {}
+            for position, election in enumerate(elections):
+                by_id[election.id] = election
+                order[election.id] = position
+                for email in election.eligible_voter_index:
+                    by_email.setdefault(email, set()).add(election.id)
+                for user_id in election.admin_user_index:
+                    by_admin.setdefault(user_id, set()).add(election.id)
+            self._snapshot = _Snapshot(by_id, order, by_email, by_admin)
+            self._loaded_stamp = stamp
+            self._valid = True
+            return self._snapshot
+
+    def get(self, election_id: str) -> Optional[Election]:
+        """Return a shallow copy so callers can modify fields without touching the cache."""
+        election = self._refresh().by_id.get(election_id)
+        return copy.copy(election) if election else None
+
+    def all(self) -> List[Election]:
+        snapshot = self._refresh()
+        return [copy.copy(e) for e in sorted(snapshot.by_id.values(), key=lambda e: snapshot.order[e.id])]
+
+    def for_user(self, user_id: Optional[str], email: Optional[str]) -> List[Election]:
+        """Elections where the user is an admin or an eligible voter, in storage order."""
+        snapshot = self._refresh()
+        ids = (snapshot.ids_by_admin.get(normalize_user_id(user_id), set())
+               | snapshot.ids_by_email.get(normalize_email(email), set()))
+        return [copy.copy(snapshot.by_id[i]) for i in sorted(ids, key=snapshot.order.__getitem__)]
@@ -0,0 +1,136 @@
+# backend/utils/events.py
+import json
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterator
+from utils.data_handler import get_election_schedule
+from utils.metrics import metrics
+
+class _Subscriber:
+    """Latest unsent payload per event name; a slow client only ever gets the newest state."""
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.ready = threading.Event()
+        self.pending: Dict[str, Dict[str, Any]] = {}
+
+    def offer(self, event: str, data: Dict[str, Any]):
+        with self.lock:
+            self.pending[event] = data
+        self.ready.set()
+
+    def take(self, timeout: float) -> Dict[str, Dict[str, Any]]:
+        if not self.ready.wait(timeout):
+            return {}
+        with self.lock:
+            pending, self.pending = self.pending, {}
+            self.ready.clear()
+        return pending
+
+class _Publisher:
+    def __init__(self, election_id: str):
+        self.election_id = election_id
+        self.subscribers = set()
+        self.wake = threading.Event()
+        self.last: Dict[str, Dict[str, Any]] = {}
+
+class ElectionEventHub:
+    """One publisher thread per election with listeners, fanned out to every subscriber.
+
+    The publisher wakes at the next open/close transition, when `notify()` is called
+    after ballots are stored, or every `poll_seconds` (to notice writes from other
+    workers), and only pushes events whose payload changed. Turnout is sent at most
+    once per `turnout_interval` seconds however many ballots arrive.
+    """
+    def __init__(self, turnout: Callable[[str], int], poll_seconds: float = 5.0,
+                 turnout_interval: float = 2.0, keepalive_seconds: float = 15.0):
+        self._turnout = turnout
+        self.poll_seconds = poll_seconds
+        self.turnout_interval = turnout_interval
+        self.keepalive_seconds = keepalive_seconds
+        self._lock = threading.Lock()
+        self._publishers: Dict[str, _Publisher] = {}
+
+    def notify(self, election_id: str):
+        publisher = self._publishers.get(election_id)
+        if publisher:
+            publisher.wake.set()
+
+    def _publish(self, publisher: _Publisher, event: str, data: Dict[str, Any]):
+        if publisher.last.get(event) == data:
+            return
+        with self._lock:
+            publisher.last[event] = data
+            subscribers = list(publisher.subscribers)
+        for subscriber in subscribers:
+            subscriber.offer(event, data)
+
+    def _run(self, publisher: _Publisher):
+        election_id = publisher.election_id
+        next_turnout = 0.0
+        turnout_due = True
+        while True:
+            with self._lock:
+                if not publisher.subscribers:
+                    del self._publishers[election_id]
+                    return
+            transition = None
+            try:
+                now = datetime.now(timezone.utc)
+                self._publish(publisher, 'status', get_election_schedule(election_id).status_payload(now))
+                if turnout_due and time.monotonic() >= next_turnout:
+                    self._publish(publisher, 'turnout', {'totalVotes': self._turnout(election_id)})
+                    next_turnout = time.monotonic() + self.turnout_interval
+                    turnout_due = False
+                transition = get_election_schedule(election_id).next_transition(now)
+            except Exception as e:
+                print(f"Error publishing events for election {election_id}: {e}")
+
+            timeout = self.poll_seconds
+            if transition is not None:
+                timeout = min(timeout, (transition - datetime.now(timezone.utc)).total_seconds())
+            if turnout_due:
+                # A burst of ballots is folded into one update at the end of the interval.
+                timeout = min(timeout, next_turnout - time.monotonic())
+            woken = publisher.wake.wait(max(0.05, timeout))
+            publisher.wake.clear()
+            # Timeouts also recount, to pick up ballots stored by other workers.
+            turnout_due = turnout_due or woken or timeout >= self.poll_seconds
+
+    def subscribe(self, election_id: str) -> _Subscriber:
+        subscriber = _Subscriber()
+        with self._lock:
+            publisher = self._publishers.get(election_id)
+            start = publisher is None
+            if start:
+                publisher = self._publishers[election_id] = _Publisher(election_id)
+            publisher.subscribers.add(subscriber)
+            # Late subscribers start from the publisher's current state.
+            for event, data in publisher.last.items():
+                subscriber.offer(event, data)
+            metrics.set_gauge(f'events.subscribers.{election_id}', len(publisher.subscribers))
+        if start:
+            threading.Thread(target=self._run, args=(publisher,), name=f'events-{election_id}', daemon=True).start()
+        return subscriber
+
+    def unsubscribe(self, election_id: str, subscriber: _Subscriber):
+        with self._lock:
+            publisher = self._publishers.get(election_id)
+            if publisher:
+                publisher.subscribers.discard(subscriber)
+                metrics.set_gauge(f'events.subscribers.{election_id}', len(publisher.subscribers))
+                publisher.wake.set()
+
+    def stream(self, election_id: str) -> Iterator[str]:
+        """Server-Sent Events for one client; unsubscribes when the client disconnects."""
+        subscriber = self.subscribe(election_id)
+        try:
+            yield f"retry: {int(self.poll_seconds * 1000)}\n\n"
+            while True:
+                pending = subscriber.take(self.keepalive_seconds)
+                if not pending:
+                    yield ": keepalive\n\n"
+                for event, data in pending.items():
+                    yield f"event: {event}\ndata: {json.dumps(data)}\n\n"
+        finally:
+            self.unsubscribe(election_id, subscriber)
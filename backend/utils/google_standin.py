@@ -0,0 +1,172 @@
+# backend/utils/google_standin.py
+import base64
+import hashlib
+import secrets
+import threading
+import time
+import uuid
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import urlencode
+from flask import Flask, jsonify, redirect, request
+from google.auth import crypt, jwt
+from werkzeug.serving import WSGIRequestHandler, make_server
+
+def _generate_rsa_key() -> Tuple[str, str, int, int]:
+    """(private PEM, public PKCS#1 PEM, modulus, exponent) using whichever RSA library google-auth has."""
+    try:
+        from cryptography.hazmat.primitives import serialization
+        from cryptography.hazmat.primitives.asymmetric import rsa as rsa_keys
+        key = rsa_keys.generate_private_key(public_exponent=65537, key_size=2048)
+        private_pem = key.private_bytes(serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8,
+                                        serialization.NoEncryption()).decode('ascii')
+        public_pem = key.public_key().public_bytes(serialization.Encoding.PEM,
+                                                   serialization.PublicFormat.PKCS1).decode('ascii')
+        numbers = key.public_key().public_numbers()
+        return private_pem, public_pem, numbers.n, numbers.e
+    except ImportError:
+        import rsa
+        public_key, private_key = rsa.newkeys(2048)
+        return (private_key.save_pkcs1().decode('ascii'), public_key.save_pkcs1().decode('ascii'),
+                public_key.n, public_key.e)
+
+class _QuietHandler(WSGIRequestHandler):
+    def log_request(self, *args, **kwargs):
+        pass
+
+def _b64_uint(value: int) -> str:
+    return base64.urlsafe_b64encode(value.to_bytes((value.bit_length() + 7) // 8, 'big')).rstrip(b'=').decode('ascii')
+
+class GoogleStandIn:
+    """Local stand-in for Google's OAuth2 endpoints, for offline development and benchmarks.
+
+    Serves an authorization endpoint that signs the user straight in (as `login_hint`,
+    or a random demo address), a token endpoint that checks the client credentials and
+    PKCE verifier and returns ID tokens signed with a throwaway RSA key, and that key as
+    a `{kid: PEM}` map (`/oauth2/v1/certs`, the format GoogleAuth verifies against) and
+    as a JWKS (`/oauth2/v3/certs`). Optional `latency` seconds are added to the token
+    endpoint to imitate the round trip to Google.
+    """
+    def __init__(self, client_id: str, client_secret: str, host: str = '127.0.0.1', port: int = 0,
+                 latency: float = 0.0, certs_max_age: int = 3600):
+        self.client_id = client_id
+        self.client_secret = client_secret
+        self.latency = latency
+        self.certs_max_age = certs_max_age
+        self.key_id = uuid.uuid4().hex
+        private_pem, self._public_pem, self._modulus, self._exponent = _generate_rsa_key()
+        self._signer = crypt.RSASigner.from_string(private_pem, key_id=self.key_id)
+        self._lock = threading.Lock()
+        self._codes: Dict[str, Dict[str, Any]] = {}
+        self._access_tokens: Dict[str, Dict[str, Any]] = {}
+        self._server = make_server(host, port, self._build_app(), threaded=True, request_handler=_QuietHandler)
+        self.base_url = f"http://{host}:{self._server.server_port}"
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def endpoints(self) -> Dict[str, str]:
+        """Endpoint overrides for GoogleAuth(endpoints=...)."""
+        return {
+            'auth_uri': f'{self.base_url}/o/oauth2/auth',
+            'token_uri': f'{self.base_url}/token',
+            'certs_uri': f'{self.base_url}/oauth2/v1/certs',
+            'userinfo_uri': f'{self.base_url}/oauth2/v2/userinfo',
+        }
+
+    def start(self) -> 'GoogleStandIn':
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._server.serve_forever, name='google-standin', daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+
+    def issue_code(self, email: Optional[str] = None, name: str = '', redirect_uri: str = '',
+                   code_challenge: Optional[str] = None) -> str:
+        """Mint an authorization code for `email`, as if the user had just consented."""
+        email = email or f'demo_{uuid.uuid4().hex[:8]}@example.com'
+        code = secrets.token_urlsafe(24)
+        with self._lock:
+            self._codes[code] = {
+                'sub': hashlib.sha256(email.lower().encode('utf-8')).hexdigest()[:21],
+                'email': email,
+                'name': name or email.split('@')[0],
+                'redirect_uri': redirect_uri,
+                'code_challenge': code_challenge,
+            }
+        return code
+
+    def _id_token(self, user: Dict[str, Any]) -> str:
+        now = int(time.time())
+        payload = {
+            'iss': 'https://accounts.google.com',
+            'aud': self.client_id,
+            'sub': user['sub'],
+            'email': user['email'],
+            'email_verified': True,
+            'name': user['name'],
+            'iat': now,
+            'exp': now + 3600,
+        }
+        return jwt.encode(self._signer, payload).decode('ascii')
+
+    def _build_app(self) -> Flask:
+        app = Flask(__name__)
+
+        @app.route('/o/oauth2/auth')
+        def authorize():
+            redirect_uri = request.args.get('redirect_uri', '')
+            code = self.issue_code(request.args.get('login_hint'), redirect_uri=redirect_uri,
+                                   code_challenge=request.args.get('code_challenge'))
+            return redirect(f"{redirect_uri}?{urlencode({'code': code, 'state': request.args.get('state', '')})}")
+
+        @app.route('/token', methods=['POST'])
+        def token():
+            if self.latency:
+                time.sleep(self.latency)
+            form = request.form
+            if form.get('client_id') != self.client_id or form.get('client_secret') != self.client_secret:
+                return jsonify({'error': 'invalid_client'}), 401
+            with self._lock:
+                user = self._codes.pop(form.get('code', ''), None)
+            if user is None or (user['redirect_uri'] and user['redirect_uri'] != form.get('redirect_uri')):
+                return jsonify({'error': 'invalid_grant'}), 400
+            if user['code_challenge']:
+                verifier = form.get('code_verifier', '').encode('ascii')
+                challenge = base64.urlsafe_b64encode(hashlib.sha256(verifier).digest()).rstrip(b'=').decode('ascii')
+                if challenge != user['code_challenge']:
+                    return jsonify({'error': 'invalid_grant', 'error_description': 'code_verifier mismatch'}), 400
+            access_token = secrets.token_urlsafe(32)
+            with self._lock:
+                self._access_tokens[access_token] = user
+            return jsonify({
+                'access_token': access_token,
+                'id_token': self._id_token(user),
+                'token_type': 'Bearer',
+                'expires_in': 3599,
+            })
+
+        @app.route('/oauth2/v1/certs')
+        def certs():
+            response = jsonify({self.key_id: self._public_pem})
+            response.headers['Cache-Control'] = f'public, max-age={self.certs_max_age}'
+            return response
+
+        @app.route('/oauth2/v3/certs')
+        def jwks():
+            response = jsonify({'keys': [{
+                'kid': self.key_id, 'kty': 'RSA', 'alg': 'RS256', 'use': 'sig',
+                'n': _b64_uint(self._modulus), 'e': _b64_uint(self._exponent),
+            }]})
+            response.headers['Cache-Control'] = f'public, max-age={self.certs_max_age}'
+            return response
+
+        @app.route('/oauth2/v2/userinfo')
+        def userinfo():
+            with self._lock:
+                user = self._access_tokens.get(request.headers.get('Authorization', '').replace('Bearer ', '', 1))
+            if user is None:
+                return jsonify({'error': 'invalid_token'}), 401
+            return jsonify({'id': user['sub'], 'email': user['email'], 'verified_email': True, 'name': user['name']})
+
+        return app
@@ -0,0 +1,100 @@
+# backend/utils/http_cache.py
+import gzip
+import hashlib
+import zlib
+from dataclasses import dataclass
+from typing import Optional, Dict, Iterable, Iterator
+from flask import Request, Response
+
+try:
+    import brotli
+except ImportError:  # brotli is optional; gzip is always available
+    brotli = None
+
+@dataclass(frozen=True)
+class PrecompressedBody:
+    """A response body encoded once, with its gzip/brotli variants and a strong ETag."""
+    raw: bytes
+    gzip: bytes
+    br: Optional[bytes]
+    etag: str
+    mimetype: str
+
+def build_body(raw: bytes, mimetype: str = 'application/json') -> PrecompressedBody:
+    return PrecompressedBody(
+        raw=raw,
+        gzip=gzip.compress(raw, compresslevel=9, mtime=0),
+        br=brotli.compress(raw) if brotli else None,
+        etag='"' + hashlib.sha256(raw).hexdigest()[:32] + '"',
+        mimetype=mimetype
+    )
+
+def _accepts(request: Request, coding: str) -> bool:
+    for part in request.headers.get('Accept-Encoding', '').split(','):
+        name, _, params = part.strip().partition(';')
+        if name.strip().lower() == coding:
+            return params.replace(' ', '') not in ('q=0', 'q=0.0', 'q=0.00', 'q=0.000')
+    return False
+
+def etag_matches(request: Request, etag: str) -> bool:
+    if_none_match = request.headers.get('If-None-Match', '')
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == '*':
+        return True
+    candidates = {t.strip().removeprefix('W/') for t in if_none_match.split(',')}
+    return etag in candidates
+
+def send_precompressed(body: PrecompressedBody, request: Request, cache_control: str,
+                       status: int = 200, headers: Optional[Dict[str, str]] = None) -> Response:
+    """Serve `body` with If-None-Match/304 handling and the best encoding the client accepts."""
+    response_headers = {
+        'ETag': body.etag,
+        'Cache-Control': cache_control,
+        'Vary': 'Accept-Encoding'
+    }
+    if headers:
+        response_headers.update(headers)
+    if etag_matches(request, body.etag):
+        return Response(status=304, headers=response_headers)
+
+    if body.br is not None and _accepts(request, 'br'):
+        data, encoding = body.br, 'br'
+    elif _accepts(request, 'gzip'):
+        data, encoding = body.gzip, 'gzip'
+    else:
+        data, encoding = body.raw, None
+    if encoding:
+        response_headers['Content-Encoding'] = encoding
+    return Response(data, status=status, mimetype=body.mimetype, headers=response_headers)
+
+def _batched(chunks: Iterable[str], size: int) -> Iterator[bytes]:
+    buffer, buffered = [], 0
+    for chunk in chunks:
+        buffer.append(chunk)
+        buffered += len(chunk)
+        if buffered >= size:
+            yield ''.join(buffer).encode('utf-8')
+            buffer, buffered = [], 0
+    if buffer:
+        yield ''.join(buffer).encode('utf-8')
+
+def _gzip_stream(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    for chunk in chunks:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
+
+def send_stream(chunks: Iterable[str], request: Request, mimetype: str,
+                headers: Optional[Dict[str, str]] = None, chunk_size: int = 64 * 1024) -> Response:
+    """Stream text `chunks` in ~chunk_size pieces, gzip-compressed on the fly when the client accepts it."""
+    response_headers = {'Vary': 'Accept-Encoding'}
+    if headers:
+        response_headers.update(headers)
+    body = _batched(chunks, chunk_size)
+    if _accepts(request, 'gzip'):
+        body = _gzip_stream(body)
+        response_headers['Content-Encoding'] = 'gzip'
+    return Response(body, mimetype=mimetype, headers=response_headers)
@@ -0,0 +1,219 @@
+# backend/utils/login_audit.py
+import atexit
+import gzip
+import json
+import os
+import queue
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterator, List, Optional
+
+try:
+    import fcntl
+except ImportError:  # not available on Windows; a single worker still serializes through its writer thread
+    fcntl = None
+from utils.json_stream import JSONStreamReader
+from utils.metrics import metrics
+from utils.schedule import parse_schedule_time
+
+class LoginAuditLog:
+    """Append-only JSON-lines login log with rotation, written by a background thread.
+
+    - `log()` only enqueues; a daemon thread appends whole batches with one write.
+    - The active segment `<directory>/logins.jsonl` is rotated to
+      `logins.<UTC time>.jsonl` once it exceeds `max_bytes` or has been open for
+      `rotate_seconds`; rotated segments are gzipped when `compress` is set.
+    - Several workers may share the directory: appends and rotation happen under an
+      flock on `.lock` (where fcntl exists), and a writer reopens the active file if
+      another worker rotated it.
+    """
+    ACTIVE_NAME = 'logins.jsonl'
+
+    def __init__(self, directory: str, max_bytes: int = 16 * 1024 * 1024, rotate_seconds: float = 86400,
+                 compress: bool = True, max_pending: int = 10000, legacy_file: Optional[str] = None):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.rotate_seconds = rotate_seconds
+        self.compress = compress
+        self.legacy_file = legacy_file
+        self.active_path = os.path.join(directory, self.ACTIVE_NAME)
+        self._queue: 'queue.Queue[Optional[Dict[str, Any]]]' = queue.Queue(maxsize=max_pending)
+        self._lock = threading.Lock()
+        self._writer: Optional[threading.Thread] = None
+        self._fd: Optional[int] = None
+        self._opened_at = 0.0
+        os.makedirs(directory, exist_ok=True)
+        atexit.register(self.flush)
+
+    # --- Writing ---
+
+    def log(self, entry: Dict[str, Any]) -> bool:
+        """Queue one record; returns False (and counts a drop) if the queue is full."""
+        if self._writer is None or not self._writer.is_alive():
+            with self._lock:
+                if self._writer is None or not self._writer.is_alive():
+                    self._writer = threading.Thread(target=self._run, name='login-audit-writer', daemon=True)
+                    self._writer.start()
+        try:
+            self._queue.put_nowait(entry)
+            return True
+        except queue.Full:
+            metrics.increment('login_audit.dropped')
+            print(f"Warning: login audit queue is full; dropped login record for {entry.get('email')}")
+            return False
+
+    def flush(self, timeout: float = 5.0):
+        """Wait (up to `timeout` seconds) until every queued record has been written."""
+        deadline = time.monotonic() + timeout
+        while self._queue.unfinished_tasks and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+    def _run(self):
+        while True:
+            batch: List[Dict[str, Any]] = [self._queue.get()]
+            while len(batch) < 1000:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                self._write(batch)
+            except Exception as e:
+                print(f"Error writing {len(batch)} login audit record(s) to {self.active_path}: {e}")
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    def _write(self, batch: List[Dict[str, Any]]):
+        data = ''.join(json.dumps(entry, separators=(',', ':'), default=str) + '\n' for entry in batch).encode('utf-8')
+        with open(os.path.join(self.directory, '.lock'), 'a') as lock_file:
+            if fcntl:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                fd = self._active_fd()
+                size = os.fstat(fd).st_size
+                if size and (size + len(data) > self.max_bytes or time.time() - self._opened_at >= self.rotate_seconds):
+                    self._rotate()
+                    fd = self._active_fd()
+                view = memoryview(data)
+                while view:
+                    view = view[os.write(fd, view):]
+            finally:
+                if fcntl:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+        metrics.increment('login_audit.records', len(batch))
+
+    def _active_fd(self) -> int:
+        """Descriptor for the current active segment, reopened if another worker rotated it."""
+        if self._fd is not None:
+            try:
+                if os.stat(self.active_path).st_ino == os.fstat(self._fd).st_ino:
+                    return self._fd
+            except FileNotFoundError:
+                pass
+            os.close(self._fd)
+        self._fd = os.open(self.active_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        # An existing segment counts from its first record so restarts do not postpone rotation.
+        self._opened_at = self._first_record_time(self.active_path) or time.time()
+        return self._fd
+
+    @staticmethod
+    def _first_record_time(path: str) -> Optional[float]:
+        try:
+            with open(path, 'r') as f:
+                first = f.readline()
+            return parse_schedule_time(json.loads(first).get('login_timestamp')).timestamp() if first else None
+        except (OSError, ValueError, AttributeError, TypeError):
+            return None
+
+    def _rotate(self):
+        stamp = datetime.now(timezone.utc).strftime('%Y%m%dT%H%M%S%fZ')
+        rotated = os.path.join(self.directory, f'logins.{stamp}.jsonl')
+        os.replace(self.active_path, rotated)
+        os.close(self._fd)
+        self._fd = None
+        metrics.increment('login_audit.rotations')
+        if self.compress:
+            with open(rotated, 'rb') as src, gzip.open(rotated + '.gz.tmp', 'wb') as dst:
+                while True:
+                    chunk = src.read(1024 * 1024)
+                    if not chunk:
+                        break
+                    dst.write(chunk)
+            os.replace(rotated + '.gz.tmp', rotated + '.gz')
+            os.remove(rotated)
+
+    # --- Reading ---
+
+    def segments(self) -> List[str]:
+        """Log files oldest first: rotated segments (by name), then the active one."""
+        rotated = sorted(name for name in os.listdir(self.directory)
+                         if name.startswith('logins.') and name != self.ACTIVE_NAME
+                         and (name.endswith('.jsonl') or name.endswith('.jsonl.gz')))
+        paths = [os.path.join(self.directory, name) for name in rotated]
+        if os.path.exists(self.active_path):
+            paths.append(self.active_path)
+        return paths
+
+    def _segment_records(self, path: str) -> Iterator[Dict[str, Any]]:
+        opener = gzip.open if path.endswith('.gz') else open
+        try:
+            with opener(path, 'rt', encoding='utf-8') as f:
+                for line in f:
+                    # A line without its newline is still being written.
+                    if line.endswith('\n'):
+                        try:
+                            yield json.loads(line)
+                        except ValueError:
+                            continue
+        except FileNotFoundError:
+            # Compressed while we were listing; the records now live in the .gz sibling.
+            if path != self.active_path and not path.endswith('.gz'):
+                yield from self._segment_records(path + '.gz')
+
+    def _legacy_records(self) -> Iterator[Dict[str, Any]]:
+        """Records from the pre-rotation voter_login_log.json, streamed item by item."""
+        if not self.legacy_file or not os.path.exists(self.legacy_file):
+            return
+        try:
+            with open(self.legacy_file, 'r') as f:
+                for item in JSONStreamReader(f).array_items():
+                    if isinstance(item, dict):
+                        yield item
+        except (OSError, ValueError) as e:
+            print(f"Error reading legacy login log {self.legacy_file}: {e}")
+
+    def query(self, email: Optional[str] = None, since: Optional[datetime] = None,
+              until: Optional[datetime] = None) -> Iterator[Dict[str, Any]]:
+        """Stream records oldest first, optionally filtered by email (case-insensitive)
+        and by login time in [since, until). Memory use is independent of the log size.
+
+        Records still queued are waited for only briefly, so a busy writer never holds up
+        the caller; anything not yet written shows up on the next query."""
+        self.flush(timeout=0.1)
+        wanted_email = email.strip().lower() if email else None
+        sources = [self._legacy_records()]
+        for path in self.segments():
+            if since is not None and path != self.active_path:
+                # Rotated segment names carry their rotation time, i.e. their newest record.
+                rotated_at = os.path.basename(path).split('.')[1]
+                try:
+                    if datetime.strptime(rotated_at, '%Y%m%dT%H%M%S%fZ').replace(tzinfo=timezone.utc) < since:
+                        continue
+                except ValueError:
+                    pass
+            sources.append(self._segment_records(path))
+        for source in sources:
+            for record in source:
+                if wanted_email and str(record.get('email', '')).strip().lower() != wanted_email:
+                    continue
+                if since is not None or until is not None:
+                    try:
+                        logged_at = parse_schedule_time(record.get('login_timestamp'))
+                    except (ValueError, TypeError):
+                        continue
+                    if logged_at is None or (since is not None and logged_at < since) \
+                            or (until is not None and logged_at >= until):
+                        continue
+                yield record
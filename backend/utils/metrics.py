@@ -0,0 +1,56 @@
+# backend/utils/metrics.py
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict
+
+class Metrics:
+    """Process-local counters, gauges and timing summaries.
+
+    Each gunicorn worker keeps its own numbers; the admin metrics endpoint reports
+    the worker that served the request.
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._timings: Dict[str, Dict[str, float]] = {}
+        self._counters: Dict[str, int] = {}
+        self._gauges: Dict[str, Any] = {}
+
+    def record_timing(self, name: str, seconds: float):
+        with self._lock:
+            t = self._timings.get(name)
+            if t is None:
+                t = self._timings[name] = {'count': 0, 'total_seconds': 0.0, 'max_seconds': 0.0}
+            t['count'] += 1
+            t['total_seconds'] += seconds
+            if seconds > t['max_seconds']:
+                t['max_seconds'] = seconds
+
+    @contextmanager
+    def timer(self, name: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record_timing(name, time.perf_counter() - start)
+
+    def increment(self, name: str, amount: int = 1):
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + amount
+
+    def set_gauge(self, name: str, value: Any):
+        with self._lock:
+            self._gauges[name] = value
+
+    def snapshot(self, prefix: str = '') -> Dict[str, Any]:
+        """All metrics whose name starts with `prefix`, with average timings filled in."""
+        with self._lock:
+            timings = {
+                name: dict(t, avg_seconds=t['total_seconds'] / t['count'] if t['count'] else 0.0)
+                for name, t in self._timings.items() if name.startswith(prefix)
+            }
+            counters = {name: v for name, v in self._counters.items() if name.startswith(prefix)}
+            gauges = {name: v for name, v in self._gauges.items() if name.startswith(prefix)}
+        return {'timings': timings, 'counters': counters, 'gauges': gauges}
+
+metrics = Metrics()
@@ -0,0 +1,104 @@
+# backend/utils/oauth_exchange.py
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeout
+from typing import Any, Dict, Optional
+from utils.auth import GoogleAuth, google_wait_seconds, reset_google_wait
+from utils.metrics import metrics
+
+class SignInUnavailable(Exception):
+    """Sign-in could not be completed right now; the user should start again shortly."""
+
+class SignInBusy(SignInUnavailable):
+    """Every exchange slot is taken."""
+
+class SignInTimeout(SignInUnavailable):
+    """Google did not answer within the timeout."""
+
+class SignInFailed(Exception):
+    """Google rejected the code or the ID token did not verify."""
+
+class SignIn:
+    __slots__ = ('user_info', 'queued_seconds', 'google_seconds')
+
+    def __init__(self, user_info: Dict[str, Any], queued_seconds: float, google_seconds: float):
+        self.user_info = user_info
+        self.queued_seconds = queued_seconds
+        self.google_seconds = google_seconds
+
+class OAuthExchangePool:
+    """Runs the OAuth callback's calls to Google (code exchange and ID token
+    verification) on a bounded thread pool.
+
+    At most `max_concurrent` exchanges talk to Google at once and up to
+    `max_waiting` more may queue for a slot; beyond that `sign_in` raises
+    SignInBusy immediately instead of parking another request worker on outbound
+    HTTP. A caller waits at most `timeout_seconds` (SignInTimeout). The slot is
+    only released when the exchange itself finishes, so abandoned exchanges still
+    count against the cap.
+    """
+    def __init__(self, google_auth: GoogleAuth, max_concurrent: int = 8, max_waiting: int = 16,
+                 timeout_seconds: float = 15.0):
+        self.google_auth = google_auth
+        self.max_concurrent = max_concurrent
+        self.timeout_seconds = timeout_seconds
+        self._slots = threading.BoundedSemaphore(max_concurrent + max_waiting)
+        self._in_flight = 0
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def _ensure_executor(self) -> ThreadPoolExecutor:
+        # Created lazily so that forking servers get their own threads in each worker.
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(max_workers=self.max_concurrent,
+                                                        thread_name_prefix='oauth-exchange')
+        return self._executor
+
+    def _track(self, delta: int):
+        with self._lock:
+            self._in_flight += delta
+            metrics.set_gauge('oauth.in_flight', self._in_flight)
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    def _exchange(self, code: str, code_verifier: Optional[str], submitted_at: float) -> SignIn:
+        queued = time.perf_counter() - submitted_at
+        metrics.record_timing('oauth.queue_wait', queued)
+        reset_google_wait()
+        try:
+            tokens = self.google_auth.exchange_code_for_tokens(code, code_verifier)
+            if not tokens or not tokens.get('id_token'):
+                raise SignInFailed('Failed to exchange authorization code')
+            user_info = self.google_auth.verify_id_token(tokens['id_token'])
+            if not user_info:
+                raise SignInFailed('Failed to verify user identity')
+            return SignIn(user_info, queued, google_wait_seconds())
+        finally:
+            metrics.record_timing('oauth.google_wait', google_wait_seconds())
+            self._track(-1)
+            self._slots.release()
+
+    def sign_in(self, code: str, code_verifier: Optional[str] = None) -> SignIn:
+        """Exchange `code` and verify the ID token; raises SignInBusy, SignInTimeout or SignInFailed."""
+        if not self._slots.acquire(blocking=False):
+            metrics.increment('oauth.rejected')
+            raise SignInBusy()
+        self._track(1)
+        try:
+            future = self._ensure_executor().submit(self._exchange, code, code_verifier, time.perf_counter())
+        except Exception:
+            self._track(-1)
+            self._slots.release()
+            raise
+        try:
+            return future.result(timeout=self.timeout_seconds)
+        except FutureTimeout:
+            metrics.increment('oauth.timeouts')
+            raise SignInTimeout()
+        except SignInFailed:
+            metrics.increment('oauth.failures')
+            raise
@@ -0,0 +1,61 @@
+# backend/utils/results_snapshot.py
+import hashlib
+import json
+import threading
+from typing import Any, Dict, Optional, Tuple
+from models import ElectionStatus
+from utils.data_handler import load_results_snapshot, save_results_snapshot
+from utils.http_cache import PrecompressedBody, build_body
+
+def encode_results(payload: Dict[str, Any]) -> bytes:
+    """Canonical JSON encoding of a results payload; the content hash is taken over these bytes."""
+    return json.dumps(payload, sort_keys=True, separators=(',', ':')).encode('utf-8')
+
+class ResultsSnapshotCache:
+    """Immutable results of closed elections, kept in memory and persisted next to votes.json.
+
+    A snapshot is tied to the schedule (start/end time) it was computed under; if an
+    admin reschedules the election, the stored snapshot no longer matches and is
+    ignored until the election closes again.
+    """
+    def __init__(self):
+        self._bodies: Dict[str, Tuple[Tuple[Any, Any], PrecompressedBody]] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _schedule_key(status: ElectionStatus) -> Tuple[Any, Any]:
+        return (status.start_time, status.end_time)
+
+    def get(self, election_id: str, status: ElectionStatus) -> Optional[PrecompressedBody]:
+        key = self._schedule_key(status)
+        with self._lock:
+            cached = self._bodies.get(election_id)
+        if cached and cached[0] == key:
+            return cached[1]
+
+        stored = load_results_snapshot(election_id)
+        if not stored or (stored.get('start_time'), stored.get('end_time')) != key:
+            return None
+        raw = encode_results(stored.get('results', {}))
+        if hashlib.sha256(raw).hexdigest() != stored.get('content_hash'):
+            print(f"Warning: Results snapshot for election {election_id} failed its hash check; recomputing.")
+            return None
+        body = build_body(raw)
+        with self._lock:
+            self._bodies[election_id] = (key, body)
+        return body
+
+    def materialize(self, election_id: str, status: ElectionStatus, payload: Dict[str, Any]) -> PrecompressedBody:
+        """Freeze `payload` as the final results for this schedule and return its encoded body."""
+        key = self._schedule_key(status)
+        raw = encode_results(payload)
+        save_results_snapshot(election_id, {
+            'start_time': key[0],
+            'end_time': key[1],
+            'content_hash': hashlib.sha256(raw).hexdigest(),
+            'results': payload
+        })
+        body = build_body(raw)
+        with self._lock:
+            self._bodies[election_id] = (key, body)
+        return body
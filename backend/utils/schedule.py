@@ -0,0 +1,74 @@
+# backend/utils/schedule.py
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+from models import ElectionStatus
+
+def parse_schedule_time(value: Any) -> Optional[datetime]:
+    """Parse a stored start/end time ('...Z' or offset ISO 8601, or a datetime); naive values are UTC."""
+    if not value:
+        return None
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value
+
+class ElectionSchedule:
+    """An election's start/end times, parsed once.
+
+    Voting is open while start <= now < end. An election without a complete (or
+    with an unparseable) schedule is never open.
+    """
+    def __init__(self, status: ElectionStatus):
+        self.status = status
+        try:
+            self.start = parse_schedule_time(status.start_time)
+            self.end = parse_schedule_time(status.end_time)
+        except ValueError as e:
+            print(f"Warning: Invalid election schedule {status.start_time!r} - {status.end_time!r}: {e}")
+            self.start = self.end = None
+        if self.start is None or self.end is None:
+            self.start = self.end = None
+
+    @staticmethod
+    def _now(now: Optional[datetime]) -> datetime:
+        return now if now is not None else datetime.now(timezone.utc)
+
+    def is_open(self, now: Optional[datetime] = None) -> bool:
+        now = self._now(now)
+        return self.start is not None and self.start <= now < self.end
+
+    def status_payload(self, now: Optional[datetime] = None) -> Dict[str, Any]:
+        """The election status as the API and the live events report it."""
+        return {
+            'is_open': self.is_open(now),
+            'start_time': self.status.start_time,
+            'end_time': self.status.end_time
+        }
+
+    def is_closed(self, now: Optional[datetime] = None) -> bool:
+        """True once the scheduled end has passed; results are final from then on."""
+        return self.end is not None and self._now(now) >= self.end
+
+    def next_transition(self, now: Optional[datetime] = None) -> Optional[datetime]:
+        now = self._now(now)
+        if self.start is None:
+            return None
+        if now < self.start:
+            return self.start
+        if now < self.end:
+            return self.end
+        return None
+
+    def max_age(self, now: Optional[datetime] = None, cap: int = 300) -> int:
+        """Seconds a client may reuse the open/closed state: until the next transition, at most `cap`.
+
+        The cap bounds how long a client keeps a stale answer after an admin reschedules.
+        """
+        transition = self.next_transition(now)
+        if transition is None:
+            return cap
+        return max(0, min(cap, int((transition - self._now(now)).total_seconds())))
+
+    def cache_control(self, now: Optional[datetime] = None, cap: int = 300) -> str:
+        return f'private, max-age={self.max_age(now, cap)}'
@@ -0,0 +1,195 @@
+# backend/utils/session_store.py
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+SESSIONS_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    session_id TEXT PRIMARY KEY,
+    data TEXT NOT NULL,
+    expires_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_sessions_expires ON sessions (expires_at);
+CREATE TABLE IF NOT EXISTS revoked_tokens (
+    jti TEXT PRIMARY KEY,
+    expires_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_revoked_tokens_expires ON revoked_tokens (expires_at);
+"""
+
+class SQLiteSessionBackend:
+    """Sessions in a SQLite table, shared by every worker that opens the same file. Expiry
+    times are Unix timestamps.
+
+    Every operation is a single indexed statement, so its cost does not depend on
+    how many sessions exist.
+    """
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self._local = threading.local()
+        os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+        self._conn().executescript(SESSIONS_SCHEMA)
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None, check_same_thread=False)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            conn.execute('PRAGMA busy_timeout=30000')
+            self._local.conn = conn
+        return conn
+
+    def load(self, session_id: str) -> Optional[Tuple[Dict[str, Any], float]]:
+        row = self._conn().execute('SELECT data, expires_at FROM sessions WHERE session_id = ?', (session_id,)).fetchone()
+        return (json.loads(row[0]), row[1]) if row else None
+
+    def save(self, session_id: str, data: Dict[str, Any], expires_at: float) -> None:
+        self._conn().execute('INSERT OR REPLACE INTO sessions (session_id, data, expires_at) VALUES (?, ?, ?)',
+                             (session_id, json.dumps(data, default=str), expires_at))
+
+    def save_many(self, sessions: Iterable[Tuple[str, Dict[str, Any], float]]) -> int:
+        """Save (session_id, data, expires_at) rows in one transaction; returns how many were saved."""
+        conn = self._conn()
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            count = 0
+            for session_id, data, expires_at in sessions:
+                self.save(session_id, data, expires_at)
+                count += 1
+        except BaseException:
+            conn.execute('ROLLBACK')
+            raise
+        conn.execute('COMMIT')
+        return count
+
+    def touch(self, session_id: str, expires_at: float) -> None:
+        self._conn().execute('UPDATE sessions SET expires_at = ? WHERE session_id = ?', (expires_at, session_id))
+
+    def delete(self, session_id: str) -> None:
+        self._conn().execute('DELETE FROM sessions WHERE session_id = ?', (session_id,))
+
+    def delete_expired(self, now: float) -> int:
+        conn = self._conn()
+        conn.execute('DELETE FROM revoked_tokens WHERE expires_at <= ?', (now,))
+        return conn.execute('DELETE FROM sessions WHERE expires_at <= ?', (now,)).rowcount
+
+    def revoke_token(self, jti: str, expires_at: float) -> None:
+        """Record a revoked token, pruning ones that have expired since (token mode has no session sweeper)."""
+        conn = self._conn()
+        conn.execute('DELETE FROM revoked_tokens WHERE expires_at <= ?', (time.time(),))
+        conn.execute('INSERT OR REPLACE INTO revoked_tokens (jti, expires_at) VALUES (?, ?)', (jti, expires_at))
+
+    def revoked_tokens(self, now: float) -> List[str]:
+        return [row[0] for row in self._conn().execute('SELECT jti FROM revoked_tokens WHERE expires_at > ?', (now,))]
+
+class SessionStore:
+    """Sessions with a sliding TTL, served from a bounded LRU cache in front of a shared backend.
+
+    - A session expires `ttl_seconds` after it was last used; the expiry is pushed
+      back (one backend write) once less than half of the TTL remains.
+    - Up to `cache_size` sessions are cached per process. A cached entry is trusted
+      for `cache_seconds`, after which it is re-read so that logouts and updates from
+      other workers take effect.
+    - A daemon thread deletes expired sessions every `sweep_interval` seconds.
+    """
+    def __init__(self, backend: SQLiteSessionBackend, ttl_seconds: float = 86400, cache_size: int = 10000,
+                 cache_seconds: float = 5.0, sweep_interval: float = 300.0):
+        self.backend = backend
+        self.ttl_seconds = ttl_seconds
+        self.cache_size = cache_size
+        self.cache_seconds = cache_seconds
+        self.sweep_interval = sweep_interval
+        self._lock = threading.Lock()
+        # session_id -> (data, expires_at, cached_at)
+        self._cache: 'OrderedDict[str, Tuple[Dict[str, Any], float, float]]' = OrderedDict()
+        self._sweeper: Optional[threading.Thread] = None
+
+    def _ensure_sweeper(self):
+        if self._sweeper is None or not self._sweeper.is_alive():
+            with self._lock:
+                if self._sweeper is None or not self._sweeper.is_alive():
+                    self._sweeper = threading.Thread(target=self._sweep_loop, name='session-sweeper', daemon=True)
+                    self._sweeper.start()
+
+    def _sweep_loop(self):
+        while True:
+            time.sleep(self.sweep_interval)
+            try:
+                self.sweep()
+            except Exception as e:
+                print(f"Error sweeping expired sessions: {e}")
+
+    def sweep(self) -> int:
+        """Delete expired sessions from the backend and the cache; returns how many the backend removed."""
+        now = time.time()
+        with self._lock:
+            for session_id in [sid for sid, entry in self._cache.items() if entry[1] <= now]:
+                del self._cache[session_id]
+        return self.backend.delete_expired(now)
+
+    def _remember(self, session_id: str, data: Dict[str, Any], expires_at: float):
+        with self._lock:
+            self._cache[session_id] = (data, expires_at, time.monotonic())
+            self._cache.move_to_end(session_id)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+    def _forget(self, session_id: str):
+        with self._lock:
+            self._cache.pop(session_id, None)
+
+    def clear_cache(self) -> None:
+        """Drop every cached session, so the next lookups read the backend."""
+        with self._lock:
+            self._cache.clear()
+
+    def create(self, session_id: str, data: Dict[str, Any]) -> None:
+        self._ensure_sweeper()
+        expires_at = time.time() + self.ttl_seconds
+        self.backend.save(session_id, data, expires_at)
+        self._remember(session_id, data, expires_at)
+
+    def get(self, session_id: str) -> Optional[Dict[str, Any]]:
+        if not session_id:
+            return None
+        self._ensure_sweeper()
+        now = time.time()
+        with self._lock:
+            entry = self._cache.get(session_id)
+            if entry is not None:
+                self._cache.move_to_end(session_id)
+        if entry is None or time.monotonic() - entry[2] >= self.cache_seconds:
+            loaded = self.backend.load(session_id)
+            if loaded is None:
+                self._forget(session_id)
+                return None
+            entry = (loaded[0], loaded[1], time.monotonic())
+            self._remember(session_id, entry[0], entry[1])
+        data, expires_at, _ = entry
+        if expires_at <= now:
+            self._forget(session_id)
+            self.backend.delete(session_id)
+            return None
+        if expires_at - now < self.ttl_seconds / 2:
+            expires_at = now + self.ttl_seconds
+            self.backend.touch(session_id, expires_at)
+            self._remember(session_id, data, expires_at)
+        return dict(data)
+
+    def update(self, session_id: str, **fields) -> None:
+        current = self.get(session_id)
+        if current is None:
+            return
+        current.update(fields)
+        expires_at = time.time() + self.ttl_seconds
+        self.backend.save(session_id, current, expires_at)
+        self._remember(session_id, current, expires_at)
+
+    def delete(self, session_id: str) -> None:
+        self._forget(session_id)
+        self.backend.delete(session_id)
@@ -0,0 +1,91 @@
+# backend/utils/session_tokens.py
+import base64
+import hashlib
+import hmac
+import json
+import secrets
+import threading
+import time
+from typing import Any, Dict, FrozenSet, Optional
+from utils.session_store import SQLiteSessionBackend
+
+TOKEN_FIELDS = ('user_id', 'email', 'name', 'created_at', 'has_voted', 'is_admin', 'is_eligible_voter')
+
+def _b64encode(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b'=').decode('ascii')
+
+def _b64decode(text: str) -> bytes:
+    return base64.urlsafe_b64decode(text + '=' * (-len(text) % 4))
+
+class SessionTokenSigner:
+    """Stateless session tokens: `<base64url JSON payload>.<base64url HMAC-SHA256>`.
+
+    The payload carries the session fields plus a random `jti` and an `exp` Unix
+    time, so verifying a token is pure CPU work. Logout adds the token's jti to a
+    revocation list kept in the shared session backend until the token would have
+    expired anyway; each worker re-reads that (small) list at most every
+    `revocation_refresh_seconds`.
+    """
+    def __init__(self, secret_key: str, backend: SQLiteSessionBackend, ttl_seconds: float = 86400,
+                 revocation_refresh_seconds: float = 1.0):
+        if not secret_key:
+            raise ValueError("SECRET_KEY must be set to use signed session tokens")
+        self._key = hashlib.sha256(b'phoenix-session-token:' + secret_key.encode('utf-8')).digest()
+        self.backend = backend
+        self.ttl_seconds = ttl_seconds
+        self.revocation_refresh_seconds = revocation_refresh_seconds
+        self._lock = threading.Lock()
+        self._revoked: FrozenSet[str] = frozenset()
+        self._revoked_loaded_at = float('-inf')
+
+    def _sign(self, payload: bytes) -> bytes:
+        return hmac.new(self._key, payload, hashlib.sha256).digest()
+
+    def issue(self, session_data: Dict[str, Any]) -> str:
+        claims = {field: session_data[field] for field in TOKEN_FIELDS if field in session_data}
+        claims['jti'] = secrets.token_urlsafe(12)
+        claims['exp'] = int(time.time() + self.ttl_seconds)
+        payload = json.dumps(claims, separators=(',', ':'), default=str).encode('utf-8')
+        return _b64encode(payload) + '.' + _b64encode(self._sign(payload))
+
+    def _decode(self, token: str) -> Optional[Dict[str, Any]]:
+        """Claims of a well-formed token with a valid signature (expiry and revocation not checked)."""
+        if not isinstance(token, str) or token.count('.') != 1:
+            return None
+        encoded_payload, encoded_signature = token.split('.')
+        try:
+            payload = _b64decode(encoded_payload)
+            signature = _b64decode(encoded_signature)
+        except (ValueError, TypeError):
+            return None
+        if not hmac.compare_digest(signature, self._sign(payload)):
+            return None
+        try:
+            claims = json.loads(payload)
+        except ValueError:
+            return None
+        return claims if isinstance(claims, dict) else None
+
+    def _revoked_ids(self) -> FrozenSet[str]:
+        now = time.monotonic()
+        if now - self._revoked_loaded_at >= self.revocation_refresh_seconds:
+            revoked = frozenset(self.backend.revoked_tokens(time.time()))
+            with self._lock:
+                self._revoked, self._revoked_loaded_at = revoked, now
+        return self._revoked
+
+    def verify(self, token: str) -> Optional[Dict[str, Any]]:
+        claims = self._decode(token)
+        if claims is None or not isinstance(claims.get('exp'), int) or claims['exp'] <= time.time():
+            return None
+        if claims.get('jti') in self._revoked_ids():
+            return None
+        return {field: claims[field] for field in TOKEN_FIELDS if field in claims}
+
+    def revoke(self, token: str) -> None:
+        claims = self._decode(token)
+        if claims is None or not isinstance(claims.get('exp'), int):
+            return
+        self.backend.revoke_token(claims.get('jti', ''), claims['exp'])
+        with self._lock:
+            self._revoked = self._revoked | {claims.get('jti', '')}
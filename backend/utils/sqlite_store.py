@@ -0,0 +1,584 @@
+# backend/utils/sqlite_store.py
+import itertools
+import json
+import os
+import sqlite3
+import threading
+from typing import List, Any, Dict, Optional, Tuple, Callable, Iterable, Iterator
+from models import Candidate, Vote, VotesData, ElectionStatus, Election
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS elections (
+    id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    description TEXT NOT NULL DEFAULT '',
+    created_by TEXT NOT NULL DEFAULT '',
+    created_at TEXT NOT NULL DEFAULT '',
+    is_open INTEGER NOT NULL DEFAULT 0,
+    start_time TEXT,
+    end_time TEXT,
+    position INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS election_voters (
+    election_id TEXT NOT NULL,
+    email TEXT NOT NULL,
+    position INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (election_id, email)
+);
+CREATE INDEX IF NOT EXISTS idx_election_voters_email ON election_voters (email);
+CREATE TABLE IF NOT EXISTS election_admins (
+    election_id TEXT NOT NULL,
+    user_id TEXT NOT NULL,
+    position INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (election_id, user_id)
+);
+CREATE INDEX IF NOT EXISTS idx_election_admins_user ON election_admins (user_id);
+CREATE TABLE IF NOT EXISTS election_status (
+    election_id TEXT PRIMARY KEY,
+    is_open INTEGER NOT NULL DEFAULT 0,
+    start_time TEXT,
+    end_time TEXT
+);
+CREATE TABLE IF NOT EXISTS candidates (
+    election_id TEXT NOT NULL,
+    id INTEGER NOT NULL,
+    data TEXT NOT NULL,
+    PRIMARY KEY (election_id, id)
+);
+CREATE TABLE IF NOT EXISTS votes (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    id TEXT NOT NULL,
+    election_id TEXT NOT NULL,
+    voter_id TEXT NOT NULL,
+    selected_candidates TEXT NOT NULL,
+    executive_candidates TEXT NOT NULL,
+    timestamp TEXT NOT NULL,
+    voter_name TEXT NOT NULL DEFAULT '',
+    voter_email TEXT NOT NULL DEFAULT '',
+    UNIQUE (election_id, voter_id)
+);
+CREATE INDEX IF NOT EXISTS idx_votes_election ON votes (election_id, seq);
+CREATE TABLE IF NOT EXISTS voter_reservations (
+    election_id TEXT NOT NULL,
+    voter_id TEXT NOT NULL,
+    PRIMARY KEY (election_id, voter_id)
+);
+CREATE TABLE IF NOT EXISTS login_log (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    google_id TEXT NOT NULL,
+    email TEXT NOT NULL,
+    name TEXT NOT NULL DEFAULT '',
+    login_timestamp TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_login_log_email ON login_log (email);
+CREATE TABLE IF NOT EXISTS tally_checkpoints (
+    election_id TEXT PRIMARY KEY,
+    data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS results_snapshots (
+    election_id TEXT PRIMARY KEY,
+    data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+"""
+
+class SQLiteStore:
+    """SQLite implementation of the data_handler and VoterSession storage API.
+
+    Each thread reuses its own connection. The database runs in WAL mode so that
+    readers in other gunicorn workers are never blocked by a writer, and every
+    mutation is a single short transaction.
+    """
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self._local = threading.local()
+        os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+        conn = self._conn()
+        conn.executescript(SCHEMA)
+        # Every stored ballot implies a reservation (covers databases from before the table existed).
+        conn.execute('INSERT OR IGNORE INTO voter_reservations (election_id, voter_id) SELECT election_id, voter_id FROM votes')
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None, check_same_thread=False)
+            conn.row_factory = sqlite3.Row
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            conn.execute('PRAGMA busy_timeout=30000')
+            self._local.conn = conn
+        return conn
+
+    def _transaction(self):
+        return _Transaction(self._conn())
+
+    # --- Elections ---
+
+    def _election_from_row(self, conn: sqlite3.Connection, row: sqlite3.Row) -> Election:
+        emails = [r['email'] for r in conn.execute(
+            'SELECT email FROM election_voters WHERE election_id = ? ORDER BY position', (row['id'],))]
+        admins = [r['user_id'] for r in conn.execute(
+            'SELECT user_id FROM election_admins WHERE election_id = ? ORDER BY position', (row['id'],))]
+        return Election(
+            id=row['id'],
+            name=row['name'],
+            description=row['description'],
+            created_by=row['created_by'],
+            created_at=row['created_at'],
+            is_open=bool(row['is_open']),
+            start_time=row['start_time'],
+            end_time=row['end_time'],
+            eligible_voter_emails=emails,
+            admin_user_ids=admins
+        )
+
+    def _counter(self, key: str) -> int:
+        row = self._conn().execute('SELECT value FROM meta WHERE key = ?', (key,)).fetchone()
+        return row[0] if row else 0
+
+    def _bump_counter(self, conn: sqlite3.Connection, key: str) -> None:
+        conn.execute('INSERT INTO meta (key, value) VALUES (?, 1) ON CONFLICT(key) DO UPDATE SET value = value + 1', (key,))
+
+    def elections_version(self) -> int:
+        """Counter bumped by every election write, used by ElectionRegistry to detect changes."""
+        return self._counter('elections_version')
+
+    def _bump_elections_version(self, conn: sqlite3.Connection) -> None:
+        self._bump_counter(conn, 'elections_version')
+
+    def votes_epoch(self, election_id: str) -> int:
+        """Counter bumped whenever an election's ballots are replaced wholesale by save_votes."""
+        return self._counter(f'votes_epoch:{election_id}')
+
+    def status_version(self, election_id: str) -> int:
+        """Counter bumped by save_election_status, used by the schedule cache to detect changes."""
+        return self._counter(f'status_version:{election_id}')
+
+    def candidates_version(self, election_id: str) -> int:
+        """Counter bumped by every candidate write, used by the candidate cache to detect changes."""
+        return self._counter(f'candidates_version:{election_id}')
+
+    def get_elections(self) -> List[Election]:
+        conn = self._conn()
+        rows = conn.execute('SELECT * FROM elections ORDER BY position, rowid').fetchall()
+        return [self._election_from_row(conn, row) for row in rows]
+
+    def get_election_by_id(self, election_id: str) -> Optional[Election]:
+        conn = self._conn()
+        row = conn.execute('SELECT * FROM elections WHERE id = ?', (election_id,)).fetchone()
+        return self._election_from_row(conn, row) if row else None
+
+    def _replace_members(self, conn: sqlite3.Connection, table: str, column: str,
+                         election_id: str, values: List[str]) -> None:
+        """Sync a membership table to `values`, touching only rows that changed."""
+        existing = {r[0]: r[1] for r in conn.execute(
+            f'SELECT {column}, position FROM {table} WHERE election_id = ?', (election_id,))}
+        wanted = {}
+        for position, value in enumerate(values):
+            wanted.setdefault(value, position)
+        removed = [(election_id, v) for v in existing if v not in wanted]
+        if removed:
+            conn.executemany(f'DELETE FROM {table} WHERE election_id = ? AND {column} = ?', removed)
+        changed = [(election_id, v, p) for v, p in wanted.items() if existing.get(v) != p]
+        if changed:
+            conn.executemany(
+                f'INSERT OR REPLACE INTO {table} (election_id, {column}, position) VALUES (?, ?, ?)', changed)
+
+    def _upsert_election(self, conn: sqlite3.Connection, election: Election, position: Optional[int] = None) -> None:
+        if position is None:
+            row = conn.execute('SELECT position FROM elections WHERE id = ?', (election.id,)).fetchone()
+            if row:
+                position = row[0]
+            else:
+                position = conn.execute('SELECT COALESCE(MAX(position), -1) + 1 FROM elections').fetchone()[0]
+        conn.execute(
+            'INSERT OR REPLACE INTO elections (id, name, description, created_by, created_at, is_open, start_time, end_time, position) '
+            'VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)',
+            (election.id, election.name, election.description, election.created_by, election.created_at,
+             int(bool(election.is_open)), election.start_time, election.end_time, position))
+        self._replace_members(conn, 'election_voters', 'email', election.id, election.eligible_voter_emails or [])
+        self._replace_members(conn, 'election_admins', 'user_id', election.id, election.admin_user_ids or [])
+
+    def save_elections(self, elections: List[Election]) -> bool:
+        try:
+            with self._transaction() as conn:
+                keep_ids = {e.id for e in elections}
+                stale = [(r[0],) for r in conn.execute('SELECT id FROM elections') if r[0] not in keep_ids]
+                for table, column in (('elections', 'id'), ('election_voters', 'election_id'), ('election_admins', 'election_id')):
+                    conn.executemany(f'DELETE FROM {table} WHERE {column} = ?', stale)
+                for position, election in enumerate(elections):
+                    self._upsert_election(conn, election, position)
+                self._bump_elections_version(conn)
+            return True
+        except sqlite3.Error as e:
+            print(f"Error saving elections to {self.db_path}: {e}")
+            return False
+
+    def save_election(self, election: Election) -> bool:
+        try:
+            with self._transaction() as conn:
+                self._upsert_election(conn, election)
+                self._bump_elections_version(conn)
+            return True
+        except sqlite3.Error as e:
+            print(f"Error saving election {election.id} to {self.db_path}: {e}")
+            return False
+
+    def delete_election(self, election_id: str) -> bool:
+        try:
+            with self._transaction() as conn:
+                for table, column in (('elections', 'id'), ('election_voters', 'election_id'), ('election_admins', 'election_id')):
+                    conn.execute(f'DELETE FROM {table} WHERE {column} = ?', (election_id,))
+                self._bump_elections_version(conn)
+            return True
+        except sqlite3.Error as e:
+            print(f"Error deleting election {election_id} from {self.db_path}: {e}")
+            return False
+
+    def create_election_data_structure(self, election_id: str) -> bool:
+        try:
+            self._conn().execute(
+                'INSERT OR IGNORE INTO election_status (election_id, is_open, start_time, end_time) VALUES (?, 0, NULL, NULL)',
+                (election_id,))
+            return True
+        except sqlite3.Error as e:
+            print(f"Error creating data structure for election {election_id}: {e}")
+            return False
+
+    # --- Candidates ---
+
+    def get_candidates(self, election_id: str) -> List[Candidate]:
+        candidates = []
+        for row in self._conn().execute(
+                'SELECT data FROM candidates WHERE election_id = ? ORDER BY id', (election_id,)):
+            try:
+                candidates.append(Candidate(**json.loads(row['data'])))
+            except (TypeError, ValueError) as e:
+                print(f"Warning: Skipping candidate item for election {election_id} due to error: {e}. Data: {row['data']}")
+        return candidates
+
+    def add_candidate(self, election_id: str,
+                      build: Callable[[int], Tuple[Optional[Candidate], str]]) -> Tuple[bool, str]:
+        """Allocate the next candidate id and insert the candidate `build(new_id)` returns, atomically."""
+        try:
+            with self._transaction() as conn:
+                new_id = conn.execute(
+                    'SELECT COALESCE(MAX(id), 0) + 1 FROM candidates WHERE election_id = ?', (election_id,)).fetchone()[0]
+                candidate, message = build(new_id)
+                if candidate is None:
+                    return False, message
+                conn.execute('INSERT INTO candidates (election_id, id, data) VALUES (?, ?, ?)',
+                             (election_id, new_id, json.dumps(candidate.to_dict(include_private=True))))
+                self._bump_counter(conn, f'candidates_version:{election_id}')
+            return True, message
+        except sqlite3.Error as e:
+            print(f"Error adding candidate to election {election_id}: {e}")
+            return False, f"Failed to add candidate: {str(e)}"
+
+    def add_candidates(self, election_id: str,
+                       build: Callable[[int], Tuple[List[Candidate], List[Dict[str, Any]]]]
+                       ) -> Tuple[bool, List[Candidate], List[Dict[str, Any]]]:
+        """Insert every candidate `build(first_id)` returns in one transaction, or none of them
+        if it also returns row errors. Returns (stored, candidates, errors)."""
+        try:
+            with self._transaction() as conn:
+                first_id = conn.execute(
+                    'SELECT COALESCE(MAX(id), 0) + 1 FROM candidates WHERE election_id = ?', (election_id,)).fetchone()[0]
+                candidates, errors = build(first_id)
+                if errors or not candidates:
+                    return False, candidates, errors
+                conn.executemany('INSERT INTO candidates (election_id, id, data) VALUES (?, ?, ?)',
+                                 [(election_id, c.id, json.dumps(c.to_dict(include_private=True))) for c in candidates])
+                self._bump_counter(conn, f'candidates_version:{election_id}')
+            return True, candidates, errors
+        except sqlite3.Error as e:
+            print(f"Error adding candidates to election {election_id}: {e}")
+            return False, [], []
+
+    def remove_candidate(self, candidate_id: int, election_id: str) -> Tuple[bool, str]:
+        try:
+            with self._transaction() as conn:
+                cursor = conn.execute(
+                    'DELETE FROM candidates WHERE election_id = ? AND id = ?', (election_id, candidate_id))
+                if cursor.rowcount:
+                    self._bump_counter(conn, f'candidates_version:{election_id}')
+        except sqlite3.Error as e:
+            print(f"Error removing candidate {candidate_id} from election {election_id}: {e}")
+            return False, f"Failed to remove candidate: {str(e)}"
+        if cursor.rowcount:
+            return True, f"Candidate with ID {candidate_id} removed successfully."
+        return False, f"Candidate with ID {candidate_id} not found."
+
+    def remove_candidates(self, candidate_ids: Iterable[int], election_id: str) -> Optional[List[int]]:
+        """Delete the given candidates in one transaction; returns the ids that existed, or None on error."""
+        wanted = set(candidate_ids)
+        try:
+            with self._transaction() as conn:
+                removed = [row[0] for row in conn.execute(
+                    'SELECT id FROM candidates WHERE election_id = ? ORDER BY id', (election_id,)) if row[0] in wanted]
+                if removed:
+                    conn.executemany('DELETE FROM candidates WHERE election_id = ? AND id = ?',
+                                     [(election_id, candidate_id) for candidate_id in removed])
+                    self._bump_counter(conn, f'candidates_version:{election_id}')
+            return removed
+        except sqlite3.Error as e:
+            print(f"Error removing candidates from election {election_id}: {e}")
+            return None
+
+    def replace_candidates(self, election_id: str, candidates: Iterable[Candidate]) -> bool:
+        try:
+            with self._transaction() as conn:
+                conn.execute('DELETE FROM candidates WHERE election_id = ?', (election_id,))
+                conn.executemany('INSERT INTO candidates (election_id, id, data) VALUES (?, ?, ?)',
+                                 [(election_id, c.id, json.dumps(c.to_dict(include_private=True))) for c in candidates])
+                self._bump_counter(conn, f'candidates_version:{election_id}')
+            return True
+        except sqlite3.Error as e:
+            print(f"Error saving candidates for election {election_id}: {e}")
+            return False
+
+    # --- Votes ---
+
+    _VOTE_COLUMNS = 'id, voter_id, selected_candidates, executive_candidates, timestamp, voter_name, voter_email'
+    _VOTE_INSERT = ('INSERT{verb} INTO votes (id, election_id, voter_id, selected_candidates, executive_candidates, '
+                    'timestamp, voter_name, voter_email) VALUES (?, ?, ?, ?, ?, ?, ?, ?)')
+
+    def _vote_row(self, election_id: str, vote: Vote) -> tuple:
+        return (vote.id, election_id, vote.voter_id, json.dumps(vote.selected_candidates),
+                json.dumps(vote.executive_candidates), vote.timestamp, vote.voter_name, vote.voter_email)
+
+    def _vote_from_row(self, row: sqlite3.Row) -> Vote:
+        return Vote(
+            id=row['id'],
+            voter_id=row['voter_id'],
+            selected_candidates=json.loads(row['selected_candidates']),
+            executive_candidates=json.loads(row['executive_candidates']),
+            timestamp=row['timestamp'],
+            voter_name=row['voter_name'],
+            voter_email=row['voter_email']
+        )
+
+    def get_votes(self, election_id: str) -> VotesData:
+        votes = [self._vote_from_row(row) for row in self._conn().execute(
+            f'SELECT {self._VOTE_COLUMNS} FROM votes WHERE election_id = ? ORDER BY seq', (election_id,))]
+        return VotesData(voter_ids=[v.voter_id for v in votes], votes=votes)
+
+    def iter_vote_records(self, election_id: str) -> Iterator[Dict[str, Any]]:
+        for row in self._conn().execute(
+                f'SELECT {self._VOTE_COLUMNS} FROM votes WHERE election_id = ? ORDER BY seq', (election_id,)):
+            record = dict(row)
+            record['selected_candidates'] = json.loads(record['selected_candidates'])
+            record['executive_candidates'] = json.loads(record['executive_candidates'])
+            yield record
+
+    def get_votes_after(self, election_id: str, seq: int) -> Tuple[List[Vote], int]:
+        """Ballots with a sequence number above `seq`, and the highest sequence number seen."""
+        votes = []
+        for row in self._conn().execute(
+                f'SELECT seq, {self._VOTE_COLUMNS} FROM votes WHERE election_id = ? AND seq > ? ORDER BY seq',
+                (election_id, seq)):
+            votes.append(self._vote_from_row(row))
+            seq = row['seq']
+        return votes, seq
+
+    def load_tally_checkpoint(self, election_id: str) -> Optional[Dict[str, Any]]:
+        row = self._conn().execute('SELECT data FROM tally_checkpoints WHERE election_id = ?', (election_id,)).fetchone()
+        return json.loads(row['data']) if row else None
+
+    def save_tally_checkpoint(self, election_id: str, checkpoint: Dict[str, Any]) -> bool:
+        try:
+            self._conn().execute('INSERT OR REPLACE INTO tally_checkpoints (election_id, data) VALUES (?, ?)',
+                                 (election_id, json.dumps(checkpoint)))
+            return True
+        except sqlite3.Error as e:
+            print(f"Error saving tally checkpoint for election {election_id}: {e}")
+            return False
+
+    def save_votes(self, votes_data: VotesData, election_id: str) -> bool:
+        try:
+            with self._transaction() as conn:
+                conn.execute('DELETE FROM votes WHERE election_id = ?', (election_id,))
+                conn.executemany(
+                    self._VOTE_INSERT.format(verb=''),
+                    [self._vote_row(election_id, vote) for vote in votes_data.votes])
+                conn.execute('DELETE FROM voter_reservations WHERE election_id = ?', (election_id,))
+                conn.executemany('INSERT OR IGNORE INTO voter_reservations (election_id, voter_id) VALUES (?, ?)',
+                                 [(election_id, voter_id) for voter_id in votes_data.voter_ids])
+                self._bump_counter(conn, f'votes_epoch:{election_id}')
+            return True
+        except sqlite3.Error as e:
+            print(f"Error saving votes for election {election_id}: {e}")
+            return False
+
+    def append_votes(self, votes: List[Vote], election_id: str) -> List[bool]:
+        """Insert a batch of ballots in one transaction; returns a per-ballot success flag."""
+        results = []
+        try:
+            with self._transaction() as conn:
+                for vote in votes:
+                    try:
+                        conn.execute(self._VOTE_INSERT.format(verb=''), self._vote_row(election_id, vote))
+                        results.append(True)
+                    except sqlite3.IntegrityError:
+                        print(f"Warning: Voter {vote.voter_id} already has a ballot in election {election_id}.")
+                        results.append(False)
+            return results
+        except sqlite3.Error as e:
+            print(f"Error appending votes for election {election_id}: {e}")
+            return [False] * len(votes)
+
+    def has_voter_voted(self, election_id: str, voter_id: str) -> bool:
+        row = self._conn().execute(
+            'SELECT 1 FROM voter_reservations WHERE election_id = ? AND voter_id = ?', (election_id, voter_id)).fetchone()
+        return row is not None
+
+    def reserve_voter(self, election_id: str, voter_id: str) -> bool:
+        """Insert the (election, voter) key; the primary key makes this an atomic check-and-set."""
+        try:
+            self._conn().execute('INSERT INTO voter_reservations (election_id, voter_id) VALUES (?, ?)',
+                                 (election_id, voter_id))
+            return True
+        except sqlite3.IntegrityError:
+            return False
+        except sqlite3.Error as e:
+            print(f"Error reserving voter {voter_id} in election {election_id}: {e}")
+            return False
+
+    def release_voter(self, election_id: str, voter_id: str) -> None:
+        try:
+            self._conn().execute('DELETE FROM voter_reservations WHERE election_id = ? AND voter_id = ?',
+                                 (election_id, voter_id))
+        except sqlite3.Error as e:
+            print(f"Error releasing voter {voter_id} in election {election_id}: {e}")
+
+    def load_results_snapshot(self, election_id: str) -> Optional[Dict[str, Any]]:
+        row = self._conn().execute('SELECT data FROM results_snapshots WHERE election_id = ?', (election_id,)).fetchone()
+        return json.loads(row['data']) if row else None
+
+    def save_results_snapshot(self, election_id: str, snapshot: Dict[str, Any]) -> bool:
+        try:
+            self._conn().execute('INSERT OR REPLACE INTO results_snapshots (election_id, data) VALUES (?, ?)',
+                                 (election_id, json.dumps(snapshot)))
+            return True
+        except sqlite3.Error as e:
+            print(f"Error saving results snapshot for election {election_id}: {e}")
+            return False
+
+    # --- Election status ---
+
+    def get_election_status(self, election_id: str) -> ElectionStatus:
+        row = self._conn().execute(
+            'SELECT is_open, start_time, end_time FROM election_status WHERE election_id = ?', (election_id,)).fetchone()
+        if not row:
+            return ElectionStatus(is_open=False)
+        return ElectionStatus.from_dict({'is_open': bool(row['is_open']), 'start_time': row['start_time'], 'end_time': row['end_time']})
+
+    def save_election_status(self, status: ElectionStatus, election_id: str) -> bool:
+        try:
+            with self._transaction() as conn:
+                conn.execute(
+                    'INSERT OR REPLACE INTO election_status (election_id, is_open, start_time, end_time) VALUES (?, ?, ?, ?)',
+                    (election_id, int(bool(status.is_open)), status.start_time, status.end_time))
+                self._bump_counter(conn, f'status_version:{election_id}')
+            return True
+        except sqlite3.Error as e:
+            print(f"Error saving election status for election {election_id}: {e}")
+            return False
+
+    # --- Login log ---
+
+    def log_login(self, entry: Dict[str, Any]) -> bool:
+        try:
+            self._conn().execute(
+                'INSERT INTO login_log (google_id, email, name, login_timestamp) VALUES (?, ?, ?, ?)',
+                (entry['google_id'], entry['email'], entry.get('name', ''), entry['login_timestamp']))
+            return True
+        except sqlite3.Error as e:
+            print(f"Error saving login log to {self.db_path}: {e}")
+            return False
+
+    def iter_logins(self, email: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """Login records oldest first, read through a cursor rather than all at once."""
+        query = 'SELECT google_id, email, name, login_timestamp FROM login_log'
+        params: Tuple[Any, ...] = ()
+        if email:
+            query += ' WHERE email = ? COLLATE NOCASE'
+            params = (email.strip(),)
+        for row in self._conn().execute(query + ' ORDER BY id', params):
+            yield {'google_id': row[0], 'email': row[1], 'name': row[2], 'login_timestamp': row[3]}
+
+    # --- Migration ---
+
+    def migrate_from_json(self, data_dir: str, login_log_file: str,
+                          login_records: Iterable[Dict[str, Any]] = ()) -> Dict[str, int]:
+        """One-shot import of the legacy JSON layout under `data_dir`. Existing rows are replaced,
+        so a rerun does not duplicate anything. The login log is rebuilt from `login_log_file`
+        followed by `login_records` (e.g. the login_audit segments)."""
+        counts = {'elections': 0, 'candidates': 0, 'votes': 0, 'logins': 0}
+        elections = [Election.from_dict(item) for item in _read_json(os.path.join(data_dir, 'elections.json'), [])
+                     if isinstance(item, dict)]
+        with self._transaction() as conn:
+            self._bump_elections_version(conn)
+            for position, election in enumerate(elections):
+                self._upsert_election(conn, election, position)
+                counts['elections'] += 1
+                election_dir = os.path.join(data_dir, 'elections', election.id)
+
+                status = _read_json(os.path.join(election_dir, 'election_status.json'), {'is_open': False})
+                conn.execute(
+                    'INSERT OR REPLACE INTO election_status (election_id, is_open, start_time, end_time) VALUES (?, ?, ?, ?)',
+                    (election.id, int(bool(status.get('is_open'))), status.get('start_time'), status.get('end_time')))
+
+                conn.execute('DELETE FROM candidates WHERE election_id = ?', (election.id,))
+                for item in _read_json(os.path.join(election_dir, 'candidates.json'), []):
+                    candidate = Candidate(**item)
+                    conn.execute('INSERT INTO candidates (election_id, id, data) VALUES (?, ?, ?)',
+                                 (election.id, candidate.id, json.dumps(candidate.to_dict(include_private=True))))
+                    counts['candidates'] += 1
+                self._bump_counter(conn, f'candidates_version:{election.id}')
+
+                conn.execute('DELETE FROM votes WHERE election_id = ?', (election.id,))
+                self._bump_counter(conn, f'votes_epoch:{election.id}')
+                vote_dicts = list(_read_json(os.path.join(election_dir, 'votes.json'), {}).get('votes', []))
+                log_path = os.path.join(election_dir, 'votes.jsonl')
+                if os.path.exists(log_path):
+                    with open(log_path, 'r') as f:
+                        vote_dicts.extend(json.loads(line) for line in f if line.endswith('\n'))
+                for vote_data in vote_dicts:
+                    conn.execute(
+                        self._VOTE_INSERT.format(verb=' OR IGNORE'),
+                        self._vote_row(election.id, Vote(**vote_data)))
+                    conn.execute('INSERT OR IGNORE INTO voter_reservations (election_id, voter_id) VALUES (?, ?)',
+                                 (election.id, vote_data['voter_id']))
+                    counts['votes'] += 1
+
+            conn.execute('DELETE FROM login_log')
+            for entry in itertools.chain(_read_json(login_log_file, []), login_records):
+                conn.execute(
+                    'INSERT INTO login_log (google_id, email, name, login_timestamp) VALUES (?, ?, ?, ?)',
+                    (entry.get('google_id', ''), entry.get('email', ''), entry.get('name', ''), entry.get('login_timestamp', '')))
+                counts['logins'] += 1
+        return counts
+
+class _Transaction:
+    """BEGIN IMMEDIATE ... COMMIT/ROLLBACK around a block, taking the write lock up front."""
+    def __init__(self, conn: sqlite3.Connection):
+        self.conn = conn
+
+    def __enter__(self) -> sqlite3.Connection:
+        self.conn.execute('BEGIN IMMEDIATE')
+        return self.conn
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        self.conn.execute('ROLLBACK' if exc_type else 'COMMIT')
+        return False
+
+def _read_json(filepath: str, default_data: Any) -> Any:
+    try:
+        with open(filepath, 'r') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return default_data
@@ -0,0 +1,50 @@
+# backend/utils/stamped_cache.py
+import threading
+import time
+from typing import Any, Callable, Dict, Generic, Optional, Tuple, TypeVar
+
+T = TypeVar('T')
+
+class StampedCache(Generic[T]):
+    """Per-election values built by `loader(election_id)`, kept in process.
+
+    Entries are dropped by `invalidate()` on writes from this process. Writes from
+    other workers are picked up by comparing `stamp(election_id)` (a file mtime or
+    database counter) at most once every `revalidate_seconds`; in between, lookups
+    touch no storage at all.
+    """
+    def __init__(self, loader: Callable[[str], T], stamp: Callable[[str], Any],
+                 revalidate_seconds: float = 1.0):
+        self._loader = loader
+        self._stamp = stamp
+        self.revalidate_seconds = revalidate_seconds
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Tuple[Any, float, T]] = {}
+        self._generation = 0
+
+    def invalidate(self, election_id: Optional[str] = None) -> None:
+        with self._lock:
+            self._generation += 1
+            if election_id is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(election_id, None)
+
+    def get(self, election_id: str) -> T:
+        entry = self._entries.get(election_id)
+        now = time.monotonic()
+        if entry is not None and now - entry[1] < self.revalidate_seconds:
+            return entry[2]
+        generation = self._generation
+        stamp = self._stamp(election_id)
+        if entry is not None and stamp == entry[0]:
+            with self._lock:
+                if self._entries.get(election_id) is entry:
+                    self._entries[election_id] = (stamp, now, entry[2])
+            return entry[2]
+        value = self._loader(election_id)
+        with self._lock:
+            # Don't cache a load that raced with a local write.
+            if generation == self._generation:
+                self._entries[election_id] = (stamp, now, value)
+        return value
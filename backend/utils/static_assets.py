@@ -0,0 +1,165 @@
+# backend/utils/static_assets.py
+import gzip
+import hashlib
+import json
+import mimetypes
+import os
+import re
+import tempfile
+import threading
+import time
+from typing import Callable, Dict, Optional, Tuple
+from utils.http_cache import PrecompressedBody, build_body
+
+try:
+    import brotli
+except ImportError:  # brotli is optional; gzip is always available
+    brotli = None
+
+ASSET_EXTENSIONS = ('.css', '.js')
+IMMUTABLE = 'public, max-age=31536000, immutable'
+_REFERENCE = re.compile(r'''(\b(?:src|href)\s*=\s*["'])([^"'?#]+)(["'?#])''')
+
+class StaticAssets:
+    """Fingerprinted, precompressed copies of the frontend's CSS and JS.
+
+    Each asset `js/api.js` becomes `js/api.<content hash>.js` in `build_dir`, with
+    `.gz` and (when brotli is installed) `.br` siblings, and index.html is rewritten
+    to reference the hashed names. Everything is also kept in memory, so a request
+    is a dict lookup. Hashed URLs never change content and can be cached forever;
+    index.html and unhashed paths revalidate by ETag.
+
+    Because hashed files are content-addressed, a sibling that already exists on
+    disk is reused instead of recompressed, so worker restarts are cheap and several
+    workers can share the build directory. Sources are re-checked (mtime/size) at
+    most every `revalidate_seconds`.
+    """
+    def __init__(self, source_dir: str, build_dir: str, revalidate_seconds: float = 1.0):
+        self.source_dir = os.path.abspath(source_dir)
+        self.build_dir = os.path.abspath(build_dir)
+        self.revalidate_seconds = revalidate_seconds
+        self._lock = threading.Lock()
+        self._stamp = None
+        self._checked_at = float('-inf')
+        self._index: Optional[PrecompressedBody] = None
+        # url path -> (body, immutable)
+        self._bodies: Dict[str, Tuple[PrecompressedBody, bool]] = {}
+        self._write_failed = False
+
+    def _sources(self) -> Dict[str, str]:
+        """Relative URL path -> file path for every asset under source_dir (excluding build_dir)."""
+        sources = {}
+        for root, dirs, files in os.walk(self.source_dir):
+            dirs[:] = [d for d in dirs if os.path.join(root, d) != self.build_dir and not d.startswith('.')]
+            for name in files:
+                if name.endswith(ASSET_EXTENSIONS):
+                    path = os.path.join(root, name)
+                    sources[os.path.relpath(path, self.source_dir).replace(os.sep, '/')] = path
+        return sources
+
+    def _source_stamp(self, sources: Dict[str, str]):
+        stamp = []
+        for rel, path in sorted(sources.items()) + [('index.html', os.path.join(self.source_dir, 'index.html'))]:
+            try:
+                st = os.stat(path)
+                stamp.append((rel, st.st_mtime_ns, st.st_size))
+            except FileNotFoundError:
+                stamp.append((rel, None, None))
+        return tuple(stamp)
+
+    def _write(self, rel: str, data: bytes):
+        """Atomically write build_dir/rel; failures (e.g. a read-only deploy) only cost the on-disk copy."""
+        if self._write_failed:
+            return
+        path = os.path.join(self.build_dir, rel)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix='.tmp-')
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.chmod(tmp_path, 0o644)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            self._write_failed = True
+            print(f"Warning: Could not write static build to {self.build_dir}: {e}. Serving from memory only.")
+
+    def _sibling(self, rel: str, compress: Callable[[], bytes]) -> bytes:
+        try:
+            with open(os.path.join(self.build_dir, rel), 'rb') as f:
+                return f.read()
+        except OSError:
+            data = compress()
+            self._write(rel, data)
+            return data
+
+    def _build_asset(self, rel: str, raw: bytes) -> Tuple[str, PrecompressedBody]:
+        digest = hashlib.sha256(raw).hexdigest()
+        stem, ext = os.path.splitext(rel)
+        hashed = f'{stem}.{digest[:12]}{ext}'
+        if not os.path.exists(os.path.join(self.build_dir, hashed)):
+            self._write(hashed, raw)
+        body = PrecompressedBody(
+            raw=raw,
+            gzip=self._sibling(hashed + '.gz', lambda: gzip.compress(raw, compresslevel=9, mtime=0)),
+            br=self._sibling(hashed + '.br', lambda: brotli.compress(raw)) if brotli else None,
+            etag='"' + digest[:32] + '"',
+            mimetype=mimetypes.guess_type(rel)[0] or 'application/octet-stream'
+        )
+        return hashed, body
+
+    def build(self) -> Dict[str, str]:
+        """(Re)build every asset and index.html; returns the original -> hashed path manifest."""
+        sources = self._sources()
+        stamp = self._source_stamp(sources)
+        manifest, bodies = {}, {}
+        for rel, path in sorted(sources.items()):
+            with open(path, 'rb') as f:
+                raw = f.read()
+            hashed, body = self._build_asset(rel, raw)
+            manifest[rel] = hashed
+            bodies[hashed] = (body, True)
+            bodies[rel] = (body, False)
+
+        index = None
+        try:
+            with open(os.path.join(self.source_dir, 'index.html'), 'r', encoding='utf-8') as f:
+                html = f.read()
+
+            def rewrite(match):
+                ref, prefix = match.group(2), ''
+                for candidate in ('./', '/'):
+                    if ref.startswith(candidate):
+                        prefix, ref = candidate, ref[len(candidate):]
+                        break
+                hashed = manifest.get(ref)
+                return match.group(1) + (prefix + hashed if hashed else match.group(2)) + match.group(3)
+
+            rewritten = _REFERENCE.sub(rewrite, html)
+            index = build_body(rewritten.encode('utf-8'), mimetype='text/html')
+            self._write('index.html', index.raw)
+            self._write('index.html.gz', index.gzip)
+            if index.br is not None:
+                self._write('index.html.br', index.br)
+        except FileNotFoundError:
+            print(f"Warning: {self.source_dir}/index.html not found.")
+        self._write('manifest.json', json.dumps(manifest, indent=2, sort_keys=True).encode('utf-8'))
+
+        self._index, self._bodies, self._stamp = index, bodies, stamp
+        return manifest
+
+    def _current(self):
+        now = time.monotonic()
+        if now - self._checked_at >= self.revalidate_seconds:
+            with self._lock:
+                if now - self._checked_at >= self.revalidate_seconds:
+                    if self._stamp is None or self._source_stamp(self._sources()) != self._stamp:
+                        self.build()
+                    self._checked_at = now
+        return self._index, self._bodies
+
+    def index(self) -> Optional[PrecompressedBody]:
+        return self._current()[0]
+
+    def lookup(self, path: str) -> Optional[Tuple[PrecompressedBody, bool]]:
+        """(body, immutable) for a hashed or original asset path, or None if it is not an asset."""
+        return self._current()[1].get(path)
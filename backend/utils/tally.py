@@ -0,0 +1,145 @@
+# backend/utils/tally.py
+import atexit
+import threading
+from collections import Counter
+from typing import List, Any, Dict, Optional, Tuple
+from models import Candidate, Vote
+from utils.data_handler import (
+    read_votes_since, load_tally_checkpoint, save_tally_checkpoint, supports_incremental_vote_reads
+)
+
+class _ElectionTally:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.loaded = False
+        self.council: Counter = Counter()
+        self.executive: Counter = Counter()
+        self.ballots = 0
+        self.cursor: Optional[Dict[str, Any]] = None
+        self.unsaved = 0  # ballots folded in since the last checkpoint
+        self.sorted_cache: Optional[Tuple[Any, List[Dict[str, Any]]]] = None
+
+    def reset(self):
+        self.council.clear()
+        self.executive.clear()
+        self.ballots = 0
+        self.sorted_cache = None
+
+    def add(self, vote: Vote):
+        self.council.update(vote.selected_candidates)
+        self.executive.update(vote.executive_candidates)
+        self.ballots += 1
+
+class TallyEngine:
+    """Per-election council/executive counters maintained incrementally.
+
+    Counts are advanced by reading only the ballots stored after the last read
+    (see data_handler.read_votes_since), so ballots written by other workers are
+    folded in too. A checkpoint with the counts and the storage cursor is saved
+    every `checkpoint_every` ballots and at exit, so after a restart only the tail is
+    replayed. Reading results never writes a checkpoint.
+    """
+    def __init__(self, checkpoint_every: int = 100):
+        self.checkpoint_every = checkpoint_every
+        self._tallies: Dict[str, _ElectionTally] = {}
+        self._tallies_lock = threading.Lock()
+        atexit.register(self.checkpoint_all)
+
+    def _get(self, election_id: str) -> _ElectionTally:
+        with self._tallies_lock:
+            tally = self._tallies.get(election_id)
+            if tally is None:
+                tally = self._tallies[election_id] = _ElectionTally()
+        return tally
+
+    def _load_checkpoint(self, election_id: str, tally: _ElectionTally):
+        checkpoint = load_tally_checkpoint(election_id)
+        if checkpoint:
+            try:
+                tally.council = Counter({int(k): v for k, v in checkpoint['council'].items()})
+                tally.executive = Counter({int(k): v for k, v in checkpoint['executive'].items()})
+                tally.ballots = int(checkpoint['ballots'])
+                tally.cursor = checkpoint['cursor']
+            except (KeyError, TypeError, ValueError) as e:
+                print(f"Warning: Ignoring invalid tally checkpoint for election {election_id}: {e}")
+                tally.reset()
+                tally.cursor = None
+        tally.loaded = True
+
+    def _save_checkpoint(self, election_id: str, tally: _ElectionTally):
+        checkpoint = {
+            'cursor': tally.cursor,
+            'ballots': tally.ballots,
+            'council': {str(k): v for k, v in tally.council.items()},
+            'executive': {str(k): v for k, v in tally.executive.items()}
+        }
+        if save_tally_checkpoint(election_id, checkpoint):
+            tally.unsaved = 0
+
+    def _catch_up(self, election_id: str, tally: _ElectionTally):
+        if not tally.loaded:
+            self._load_checkpoint(election_id, tally)
+        votes, cursor, full = read_votes_since(election_id, tally.cursor)
+        if full:
+            tally.reset()
+            tally.unsaved = 0
+        for vote in votes:
+            tally.add(vote)
+        if votes or full:
+            tally.sorted_cache = None
+        tally.cursor = cursor
+        tally.unsaved += len(votes)
+        if tally.unsaved >= self.checkpoint_every:
+            self._save_checkpoint(election_id, tally)
+
+    def checkpoint_all(self):
+        """Save a checkpoint for every election with ballots counted since its last one."""
+        with self._tallies_lock:
+            tallies = list(self._tallies.items())
+        for election_id, tally in tallies:
+            with tally.lock:
+                if tally.unsaved:
+                    self._save_checkpoint(election_id, tally)
+
+    def record_ballot(self, election_id: str):
+        """Fold newly persisted ballots into the counters; call after a ballot is stored.
+
+        With the plain votes.json layout a tail read means reparsing the whole file, so
+        there the counters are only advanced when results are requested.
+        """
+        if not supports_incremental_vote_reads():
+            return
+        tally = self._get(election_id)
+        with tally.lock:
+            self._catch_up(election_id, tally)
+
+    def ballot_count(self, election_id: str) -> int:
+        """Number of ballots stored for the election, after catching up with storage.
+
+        Cheap when nothing changed: the cached count is returned after a cursor check
+        (a stat of votes.json with the plain JSON layout).
+        """
+        tally = self._get(election_id)
+        with tally.lock:
+            self._catch_up(election_id, tally)
+            return tally.ballots
+
+    def results(self, election_id: str, candidates: List[Candidate]) -> Tuple[int, List[Dict[str, Any]]]:
+        """Return (total ballots, per-candidate counts sorted by council then executive votes)."""
+        tally = self._get(election_id)
+        with tally.lock:
+            self._catch_up(election_id, tally)
+            key = (tally.ballots, tuple((c.id, c.name) for c in candidates))
+            if tally.sorted_cache is None or tally.sorted_cache[0] != key:
+                results = [
+                    {
+                        'id': c.id,
+                        'name': c.name,
+                        'councilVotes': tally.council.get(c.id, 0),
+                        'executiveVotes': tally.executive.get(c.id, 0)
+                    }
+                    for c in candidates
+                ]
+                results.sort(key=lambda x: (-x['councilVotes'], -x['executiveVotes']))
+                tally.sorted_cache = (key, results)
+            return tally.ballots, tally.sorted_cache[1]
@@ -0,0 +1,76 @@
+# backend/utils/translations.py
+import json
+import os
+import threading
+import time
+from typing import Dict, Optional, Tuple
+from config import Config
+from utils.http_cache import PrecompressedBody, build_body
+
+TRANSLATIONS_FILE = os.path.join(Config.DATA_FOLDER, 'translations.json')
+
+class TranslationsService:
+    """translations.json encoded once: the whole file and one slice per language,
+    each with gzip/brotli variants and a strong ETag.
+
+    The file's mtime/size are checked at most every `revalidate_seconds`; when they
+    change, every body is rebuilt and swapped in at once. A file that fails to parse
+    keeps the previous bodies in service.
+    """
+    def __init__(self, path: str = TRANSLATIONS_FILE, revalidate_seconds: float = 1.0):
+        self.path = path
+        self.revalidate_seconds = revalidate_seconds
+        self._lock = threading.Lock()
+        self._stamp: Optional[Tuple[int, int]] = None
+        self._checked_at = float('-inf')
+        self._all: Optional[PrecompressedBody] = None
+        self._languages: Dict[str, PrecompressedBody] = {}
+
+    def _file_stamp(self) -> Optional[Tuple[int, int]]:
+        try:
+            st = os.stat(self.path)
+            return (st.st_mtime_ns, st.st_size)
+        except FileNotFoundError:
+            return None
+
+    def _reload(self, stamp: Optional[Tuple[int, int]]):
+        if stamp is None:
+            print(f"Translation file not found: {self.path}")
+            data = {}
+        else:
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+            except (OSError, ValueError) as e:
+                print(f"Error loading translations from {self.path}: {e}; keeping the previous version.")
+                if self._all is not None:
+                    self._stamp = stamp
+                    return
+                data = {}
+        if not isinstance(data, dict):
+            print(f"Warning: {self.path} does not contain an object of languages.")
+            data = {}
+        encode = lambda value: json.dumps(value, ensure_ascii=False, sort_keys=True, separators=(',', ':')).encode('utf-8')
+        languages = {lang: build_body(encode(strings)) for lang, strings in data.items() if isinstance(strings, dict)}
+        self._all, self._languages, self._stamp = build_body(encode(data)), languages, stamp
+
+    def _current(self):
+        now = time.monotonic()
+        if now - self._checked_at >= self.revalidate_seconds:
+            with self._lock:
+                if now - self._checked_at >= self.revalidate_seconds:
+                    stamp = self._file_stamp()
+                    if self._all is None or stamp != self._stamp:
+                        self._reload(stamp)
+                    self._checked_at = now
+        return self._all, self._languages
+
+    def all(self) -> PrecompressedBody:
+        return self._current()[0]
+
+    def language(self, lang: str) -> Optional[PrecompressedBody]:
+        return self._current()[1].get(lang)
+
+    def versions(self) -> Dict[str, str]:
+        """ETag (without quotes) of each language slice, for building cache-busting URLs."""
+        return {lang: body.etag.strip('"') for lang, body in self._current()[1].items()}
@@ -0,0 +1,107 @@
+# backend/utils/vote_queue.py
+import queue
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+from models import Vote
+from utils.data_handler import append_votes
+from utils.metrics import metrics
+
+class VoteQueueFull(Exception):
+    """Raised when the ingestion queue is at capacity; the caller should ask the client to retry."""
+
+class _PendingVote:
+    __slots__ = ('election_id', 'vote', 'done', 'ok')
+
+    def __init__(self, election_id: str, vote: Vote):
+        self.election_id = election_id
+        self.vote = vote
+        self.done = threading.Event()
+        self.ok = False
+
+class VoteIngestQueue:
+    """Group commit for ballots.
+
+    Request handlers call `submit`, which enqueues the ballot and blocks until it is
+    durable. A single writer thread drains the queue, waiting up to `linger_seconds`
+    after the first ballot to collect more (at most `max_batch`), and stores each
+    election's share of the batch with one append_votes call. When `max_pending`
+    ballots are already waiting, `submit` raises VoteQueueFull instead of queueing.
+
+    Each worker process has its own queue; writes from different workers are still
+    serialized by the storage layer's per-election locks.
+    """
+    def __init__(self, max_pending: int = 1000, max_batch: int = 200, linger_seconds: float = 0.005,
+                 on_committed: Optional[Callable[[str], None]] = None):
+        self.max_batch = max_batch
+        self.linger_seconds = linger_seconds
+        self.on_committed = on_committed
+        self._queue: 'queue.Queue[_PendingVote]' = queue.Queue(maxsize=max_pending)
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+
+    def _ensure_writer(self):
+        # Started lazily so that forking servers get a writer in each worker, not just the master.
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._start_lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name='vote-writer', daemon=True)
+                self._thread.start()
+
+    @property
+    def depth(self) -> int:
+        return self._queue.qsize()
+
+    def submit(self, election_id: str, vote: Vote) -> bool:
+        """Queue `vote` and wait for its batch to be written; returns whether it was stored."""
+        self._ensure_writer()
+        pending = _PendingVote(election_id, vote)
+        try:
+            self._queue.put_nowait(pending)
+        except queue.Full:
+            metrics.increment('vote_queue.rejected')
+            raise VoteQueueFull()
+        metrics.set_gauge('vote_queue.depth', self._queue.qsize())
+        with metrics.timer('vote_queue.wait'):
+            pending.done.wait()
+        return pending.ok
+
+    def _collect(self) -> List[_PendingVote]:
+        batch = [self._queue.get()]
+        deadline = time.monotonic() + self.linger_seconds
+        while len(batch) < self.max_batch:
+            remaining = deadline - time.monotonic()
+            try:
+                batch.append(self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self):
+        while True:
+            batch = self._collect()
+            metrics.set_gauge('vote_queue.depth', self._queue.qsize())
+            by_election: Dict[str, List[_PendingVote]] = {}
+            for pending in batch:
+                by_election.setdefault(pending.election_id, []).append(pending)
+            for election_id, items in by_election.items():
+                stored = False
+                try:
+                    with metrics.timer('vote_queue.commit'):
+                        results = append_votes([p.vote for p in items], election_id)
+                    for pending, ok in zip(items, results):
+                        pending.ok = ok
+                    stored = any(results)
+                    metrics.increment('vote_queue.batches')
+                    metrics.increment('vote_queue.ballots', len(items))
+                except Exception as e:
+                    print(f"Error committing vote batch for election {election_id}: {e}")
+                finally:
+                    for pending in items:
+                        pending.done.set()
+                if stored and self.on_committed:
+                    try:
+                        self.on_committed(election_id)
+                    except Exception as e:
+                        print(f"Error after committing vote batch for election {election_id}: {e}")
@@ -5,8 +5,96 @@ const AdminModule = {
     loadAdminCandidates: async function () {
         console.log("AdminModule.loadAdminCandidates: Fetching admin candidates...");
         // This function is called by UIController.switchTab('admin') in core-main.js
-        // It should load candidates into the #existingCandidatesList element
-        await CandidateManager.loadCandidates({ isAdmin: true });
+        // It loads candidates into the #existingCandidatesList element, one checkbox per candidate
+        const listEl = document.getElementById('existingCandidatesList');
+        if (!listEl) return;
+        const candidates = await apiClient.getAdminCandidates();
+        listEl.innerHTML = '';
+        if (!Array.isArray(candidates) || candidates.length === 0) {
+            listEl.innerHTML = '<p data-i18n="noCandidates">No candidates yet.</p>';
+        } else {
+            candidates.forEach(candidate => {
+                const row = document.createElement('label');
+                row.className = 'form-group';
+                row.style.display = 'block';
+                const checkbox = document.createElement('input');
+                checkbox.type = 'checkbox';
+                checkbox.className = 'admin-candidate-select';
+                checkbox.value = candidate.id;
+                row.appendChild(checkbox);
+                row.appendChild(document.createTextNode(
+                    ` #${candidate.id} ${candidate.name}${candidate.email ? ` (${candidate.email})` : ''}`));
+                listEl.appendChild(row);
+            });
+        }
+        if (typeof I18nModule !== 'undefined' && typeof I18nModule.applyTranslations === 'function') {
+            I18nModule.applyTranslations(listEl);
+        }
+    },
+
+    // --- Import many candidates from a CSV/JSON file in one request ---
+    importCandidates: async function (form) {
+        const fileInput = document.getElementById('candidatesFile');
+        const errorsEl = document.getElementById('importCandidatesErrors');
+        const submitBtn = form.querySelector('button[type="submit"]');
+        const file = fileInput?.files?.[0];
+        if (!file) {
+            Utils.showMessage('Please choose a CSV or JSON file to import', 'error');
+            return;
+        }
+        if (errorsEl) {
+            errorsEl.innerHTML = '';
+            errorsEl.style.display = 'none';
+        }
+        try {
+            if (submitBtn) {
+                submitBtn.disabled = true;
+                submitBtn.innerHTML = '<i class="fas fa-spinner fa-spin"></i> Importing...';
+            }
+            const response = await apiClient.importCandidates(file);
+            Utils.showMessage(response.message, 'success');
+            form.reset();
+            await this.loadAdminCandidates();
+        } catch (error) {
+            console.error('AdminModule.importCandidates: Error:', error);
+            Utils.showMessage(`Error importing candidates: ${error.message}`, 'error');
+            // Show every rejected row; nothing was imported, so the file can be fixed and uploaded again
+            if (errorsEl && error.rowErrors && error.rowErrors.length) {
+                error.rowErrors.forEach(rowError => {
+                    const item = document.createElement('li');
+                    item.textContent = `Row ${rowError.row}: ${rowError.message}`;
+                    errorsEl.appendChild(item);
+                });
+                errorsEl.style.display = 'block';
+            }
+        } finally {
+            if (submitBtn) {
+                submitBtn.disabled = false;
+                submitBtn.innerHTML = '<i class="fas fa-file-import"></i> <span data-i18n="importCandidatesButton">Import</span>';
+                if (typeof I18nModule !== 'undefined' && typeof I18nModule.applyTranslations === 'function') {
+                    I18nModule.applyTranslations(submitBtn);
+                }
+            }
+        }
+    },
+
+    // --- Delete every checked candidate in one request ---
+    deleteSelectedCandidates: async function () {
+        const ids = Array.from(document.querySelectorAll('#existingCandidatesList .admin-candidate-select:checked'))
+            .map(checkbox => parseInt(checkbox.value, 10));
+        if (ids.length === 0) {
+            Utils.showMessage('Select the candidates to delete first', 'error');
+            return;
+        }
+        if (!confirm(`Delete ${ids.length} candidate(s)?`)) return;
+        try {
+            const response = await apiClient.deleteCandidates(ids);
+            Utils.showMessage(response.message, 'success');
+        } catch (error) {
+            console.error('AdminModule.deleteSelectedCandidates: Error:', error);
+            Utils.showMessage(`Error deleting candidates: ${error.message}`, 'error');
+        }
+        await this.loadAdminCandidates();
     },
 
     // --- MODIFIED: Add Candidate using apiClient ---
@@ -74,12 +162,7 @@ const AdminModule = {
                 // Reset the form
                 document.getElementById('addCandidateForm')?.reset();
                 // Reload the admin candidate list
-                // --- MODIFIED: Use apiClient-aware load function ---
-                if (typeof CandidateManager !== 'undefined' && typeof CandidateManager.loadCandidates === 'function') {
-                    await CandidateManager.loadCandidates({ isAdmin: true });
-                } else {
-                    console.warn("CandidateManager.loadCandidates not found after adding candidate.");
-                }
+                await this.loadAdminCandidates();
             } else {
                 Utils.showMessage('admin.unexpectedResponse', 'error');
             }
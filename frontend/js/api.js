@@ -2,6 +2,8 @@ class APIClient {
     constructor() {
         this.baseURL = '/api';
         this.electionId = null;
+        // Candidates delivered by /bootstrap, served once by getCandidates() instead of refetching
+        this.prefetchedCandidates = null;
     }
 
     // Set the current election ID
@@ -88,6 +90,11 @@ class APIClient {
 
     // Candidate Endpoints
     async getCandidates() {
+        const prefetched = this.prefetchedCandidates;
+        this.prefetchedCandidates = null;
+        if (prefetched && prefetched.electionId === this.electionId) {
+            return prefetched.candidates;
+        }
         return this._makeRequest('/candidates');
     }
 
@@ -116,6 +123,25 @@ class APIClient {
         return this._makeRequest('/election/status');
     }
 
+    // Election Events Stream (Server-Sent Events)
+    // handlers: { status: fn(statusData), turnout: fn(turnoutData) }
+    openElectionEvents(handlers = {}) {
+        if (!this.electionId) {
+            throw new Error('No election selected. Please select an election first.');
+        }
+        const source = new EventSource(`${this.baseURL}/elections/${this.electionId}/events`, { withCredentials: true });
+        Object.keys(handlers).forEach(eventName => {
+            source.addEventListener(eventName, (event) => {
+                try {
+                    handlers[eventName](JSON.parse(event.data));
+                } catch (error) {
+                    console.error(`Error handling '${eventName}' event:`, error);
+                }
+            });
+        });
+        return source;
+    }
+
     // Admin Endpoints
     async getAdminCandidates() {
         return this._makeRequest('/admin/candidates');
@@ -137,6 +163,38 @@ class APIClient {
         });
     }
 
+    // Add many candidates at once from a CSV or JSON file. On a 400 the thrown error
+    // carries the server's per-row errors as `error.rowErrors`.
+    async importCandidates(file) {
+        if (!this.electionId) {
+            throw new Error('No election selected. Please select an election first.');
+        }
+        const formData = new FormData();
+        formData.append('file', file);
+        const response = await fetch(`${this.baseURL}/elections/${this.electionId}/admin/candidates/bulk`, {
+            method: 'POST',
+            credentials: 'include',
+            body: formData
+        });
+        const data = await response.json().catch(() => ({}));
+        if (!response.ok) {
+            const error = new Error(data.message || `HTTP error! status: ${response.status}`);
+            error.rowErrors = data.errors || [];
+            throw error;
+        }
+        return data;
+    }
+
+    async deleteCandidates(candidateIds) {
+        return this._makeRequest('/admin/candidates/bulk', {
+            method: 'DELETE',
+            headers: {
+                'Content-Type': 'application/json'
+            },
+            body: JSON.stringify({ ids: candidateIds })
+        });
+    }
+
     async toggleElection() {
         return this._makeRequest('/admin/election/toggle', {
             method: 'POST'
@@ -173,6 +231,26 @@ class APIClient {
         return response;
     }
 
+    // Bootstrap Endpoint (Global)
+    // Session, accessible elections and, for the chosen election (electionId if accessible,
+    // else the first one), its status and candidates plus translation versions, in one request.
+    async getBootstrap(electionId = null) {
+        const query = electionId ? `?election_id=${encodeURIComponent(electionId)}` : '';
+        const response = await fetch(`${this.baseURL}/bootstrap${query}`, {
+            method: 'GET',
+            credentials: 'include'
+        });
+        if (!response.ok) {
+            const errorData = await response.json().catch(() => ({}));
+            throw new Error(errorData.message || `HTTP error! status: ${response.status}`);
+        }
+        const data = await response.json();
+        if (data.electionId && Array.isArray(data.candidates)) {
+            this.prefetchedCandidates = { electionId: data.electionId, candidates: data.candidates };
+        }
+        return data;
+    }
+
     // Session Endpoint (Global)
     async getSession() {
         try {
@@ -115,6 +115,19 @@ document.addEventListener('DOMContentLoaded', async function () {
             });
         }
 
+        const importCandidatesForm = document.getElementById('importCandidatesForm');
+        if (importCandidatesForm) {
+            importCandidatesForm.addEventListener('submit', (e) => {
+                e.preventDefault();
+                AdminModule.importCandidates(importCandidatesForm);
+            });
+        }
+
+        const deleteSelectedCandidatesBtn = document.getElementById('deleteSelectedCandidatesBtn');
+        if (deleteSelectedCandidatesBtn) {
+            deleteSelectedCandidatesBtn.addEventListener('click', () => AdminModule.deleteSelectedCandidates());
+        }
+
         if (scheduleElectionBtn) {
             scheduleElectionBtn.addEventListener('click', () => {
                 if (typeof AdminModule !== 'undefined' && AdminModule.scheduleElection) {
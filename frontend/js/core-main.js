@@ -22,6 +22,17 @@ document.addEventListener('DOMContentLoaded', async function () {
         console.log("Initial auth skeleton screen shown.");
     }
 
+    // Session, elections, election status, candidates and translation versions in one request
+    let bootstrap = null;
+    try {
+        bootstrap = await apiClient.getBootstrap(window.demoElectionId || localStorage.getItem('selectedElectionId'));
+        if (typeof I18nModule !== 'undefined' && bootstrap.translations) {
+            I18nModule.versions = bootstrap.translations;
+        }
+    } catch (bootstrapErr) {
+        console.warn("Bootstrap request failed; falling back to individual requests:", bootstrapErr);
+    }
+
     // Language Initialization
     if (typeof I18nModule !== 'undefined' && typeof I18nModule.initialize === 'function') {
         try {
@@ -39,14 +50,14 @@ document.addEventListener('DOMContentLoaded', async function () {
 
     try {
         // 1. Check if user is authenticated
-        const sessionResponse = await apiClient.getSession();
+        const sessionResponse = bootstrap || await apiClient.getSession();
         isAuthenticated = sessionResponse.authenticated;
         if (isAuthenticated) {
             window.State.currentUser = sessionResponse.user;
             console.log("User is authenticated:", window.State.currentUser);
 
             // 2. Fetch list of elections the user has access to
-            userElections = await apiClient.getElections();
+            userElections = bootstrap ? bootstrap.elections : await apiClient.getElections();
             window.userElections = userElections;
             console.log("User elections fetched:", userElections);
 
@@ -97,7 +108,9 @@ document.addEventListener('DOMContentLoaded', async function () {
 
                 // Fetch initial data for the selected election
                 try {
-                    const statusResponse = await apiClient.getElectionStatus();
+                    const statusResponse = (bootstrap && bootstrap.electionId === selectedElection.id && bootstrap.status)
+                        ? bootstrap.status
+                        : await apiClient.getElectionStatus();
                     window.State.electionOpen = statusResponse.is_open !== undefined ? statusResponse.is_open : false;
                     window.State.electionStartTime = statusResponse.start_time || null;
                     window.State.electionEndTime = statusResponse.end_time || null;
@@ -164,6 +177,50 @@ document.addEventListener('DOMContentLoaded', async function () {
                     }, 1000);
                 }
 
+                // Keep the status current: pushed over Server-Sent Events when the server enables them,
+                // otherwise refetched on a slow timer (each open stream would hold a sync worker)
+                const applyElectionStatus = (status) => {
+                    const wasOpen = window.State.electionOpen;
+                    window.State.electionOpen = !!status.is_open;
+                    window.State.electionStartTime = status.start_time || null;
+                    window.State.electionEndTime = status.end_time || null;
+                    if (typeof updateElectionStatusDisplay === 'function') {
+                        updateElectionStatusDisplay();
+                    }
+                    if (wasOpen !== window.State.electionOpen) {
+                        if (typeof updateVotingTabContent === 'function') {
+                            updateVotingTabContent();
+                        }
+                        if (typeof VotingModule !== 'undefined' && typeof VotingModule.updateUI === 'function') {
+                            VotingModule.updateUI();
+                        }
+                    }
+                };
+                if (window.electionEventSource) {
+                    window.electionEventSource.close();
+                    window.electionEventSource = null;
+                }
+                if (typeof window.electionStatusPoll !== 'undefined') {
+                    clearInterval(window.electionStatusPoll);
+                }
+                if (bootstrap && bootstrap.liveEvents && typeof EventSource !== 'undefined') {
+                    window.electionEventSource = apiClient.openElectionEvents({
+                        status: applyElectionStatus,
+                        turnout: (turnout) => {
+                            window.State.turnout = turnout.totalVotes;
+                            if (typeof updateElectionStatusDisplay === 'function') {
+                                updateElectionStatusDisplay();
+                            }
+                        }
+                    });
+                } else {
+                    window.electionStatusPoll = setInterval(() => {
+                        apiClient.getElectionStatus()
+                            .then(applyElectionStatus)
+                            .catch(err => console.error("Error refreshing election status:", err));
+                    }, 30000);
+                }
+
             } else {
                 // User is authenticated but has no accessible elections
                 console.warn("Authenticated user has no accessible elections.");
@@ -474,7 +531,10 @@ document.addEventListener('DOMContentLoaded', async function () {
             }
         }
 
-        electionStatusElement.innerHTML = `<i class="fas ${iconClass}"></i> <span data-i18n="electionStatus">${statusText}</span>`;
+        const turnoutText = typeof window.State.turnout === 'number' && statusClass !== 'pending'
+            ? ` <span class="election-turnout" data-i18n="votesCast" data-i18n-params='{"count": ${window.State.turnout}}'>(${window.State.turnout} votes cast)</span>`
+            : '';
+        electionStatusElement.innerHTML = `<i class="fas ${iconClass}"></i> <span data-i18n="electionStatus">${statusText}</span>${turnoutText}`;
         electionStatusElement.className = `election-status ${statusClass}`;
 
         if (typeof I18nModule !== 'undefined' && typeof I18nModule.applyTranslations === 'function') {
@@ -1,36 +1,43 @@
 const I18nModule = {
     translations: {},
     currentLanguage: 'en',
+    // Per-language versions (e.g. from /api/bootstrap); a versioned URL is cached by the browser for good.
+    versions: {},
 
-    // Fetch Translations
-    fetchTranslations: async function() {
+    // Fetch one language's translations (served precompressed, revalidated with ETags)
+    fetchLanguage: async function(lang) {
+        if (this.translations[lang]) {
+            return this.translations[lang];
+        }
         try {
-            const response = await fetch('/api/translations');
+            const version = this.versions[lang];
+            const url = `/api/translations/${encodeURIComponent(lang)}` + (version ? `?v=${encodeURIComponent(version)}` : '');
+            const response = await fetch(url);
             if (!response.ok) {
                 throw new Error(`HTTP error! status: ${response.status}`);
             }
-            this.translations = await response.json();
-            console.log("Translations fetched from backend:", this.translations);
+            this.translations[lang] = await response.json();
         } catch (error) {
-            console.error("Failed to fetch translations from backend:", error);
-            this.translations = { en: {}, ar: {} }; // Fallback
+            console.error(`Failed to fetch '${lang}' translations from backend:`, error);
         }
+        return this.translations[lang];
     },
 
     // Initialize i18n module
     initialize: async function() {
-        await this.fetchTranslations();
         // Set initial language based on browser or stored preference
         const storedLang = localStorage.getItem('language');
-        if (storedLang && this.translations[storedLang]) {
+        if (storedLang && await this.fetchLanguage(storedLang)) {
             this.currentLanguage = storedLang;
+        } else if (!await this.fetchLanguage(this.currentLanguage)) {
+            this.translations[this.currentLanguage] = {}; // Fallback
         }
         this.applyTranslations();
     },
 
     // Switch Language
-    switchLanguage: function(lang) {
-        if (lang && this.translations && typeof this.translations === 'object' && this.translations[lang]) {
+    switchLanguage: async function(lang) {
+        if (lang && await this.fetchLanguage(lang)) {
             this.currentLanguage = lang;
             localStorage.setItem('language', lang);
             this.applyTranslations();
@@ -44,7 +51,7 @@ const I18nModule = {
 
             document.body.classList.toggle('rtl', this.currentLanguage === 'ar');
         } else {
-            console.warn(`Cannot switch to language '${lang}'. It's not available in the loaded translations.`);
+            console.warn(`Cannot switch to language '${lang}'. Its translations could not be loaded.`);
         }
     },
 